@@ -3,6 +3,7 @@ from typing import List, Optional, Dict
 from enum import Enum
 import math
 from . import db_manager  # Import db_manager here
+from .enriched_post import EnrichedPost, FeedPage  # Feed rows, built by db_manager
 
 
 class Category(Enum):
@@ -1,8 +1,9 @@
 from typing import List, Optional, Tuple, Dict
 from datetime import datetime
-from .POST import POST
+from .POST import POST, FeedPage
 from .social_network import get_social_network
 from . import db_manager
+from . import user_cache
 
 
 class USER:
@@ -30,8 +31,18 @@ class USER:
 
     @classmethod
     def get_by_id(cls, user_id: int) -> Optional['USER']:
-        """Fetch a user object by ID from the database"""
-        data = db_manager.return_user_by_id(user_id)
+        """Fetch a user object by ID (through the short-lived user_cache)"""
+        return cls.from_data(user_cache.get_user_data(user_id))
+
+    @classmethod
+    def get_many_by_ids(cls, user_ids) -> Dict[int, 'USER']:
+        """Fetch user objects for several IDs in one query, keyed by ID"""
+        return {uid: cls.from_data(data)
+                for uid, data in db_manager.return_users_by_ids(user_ids).items()}
+
+    @classmethod
+    def from_data(cls, data: Optional[Dict]) -> Optional['USER']:
+        """Build a user object from a db_manager user dict"""
         if data:
             user = cls(
                 user_id=data['user_id'],
@@ -70,6 +81,22 @@ class USER:
             return user
         return None
 
+    @classmethod
+    def get_profile_view(cls, user_id: int, viewer_id: Optional[int]) -> Optional[Dict]:
+        """Profile dict for user_id with follow flags relative to viewer_id"""
+        return db_manager.return_profile_view(user_id, viewer_id)
+
+    @classmethod
+    def get_profile_view_by_username(cls, username: str, viewer_id: Optional[int]) -> Optional[Dict]:
+        """get_profile_view, looked up by username"""
+        return db_manager.return_profile_view_by_username(username, viewer_id)
+
+    @classmethod
+    def get_recommendation_dtos(cls, candidate_ids: List[int], viewer_id: Optional[int]) -> List[Dict]:
+        """get_profile_view for each candidate, in candidate order, from one query"""
+        views = db_manager.return_profile_views(candidate_ids, viewer_id)
+        return [views[uid] for uid in candidate_ids if uid in views]
+
     @classmethod
     def get_user_followers_count(cls, user_id: int) -> int:
         """Get follower count for a user ID"""
@@ -90,6 +117,11 @@ class USER:
         """Get following list for a user ID"""
         return db_manager.get_following_list_of_user(user_id)
 
+    @classmethod
+    def get_user_following_ids(cls, user_id: int) -> List[int]:
+        """IDs of everyone a user ID follows"""
+        return db_manager.get_following_ids(user_id)
+
     @classmethod
     def is_following(cls, follower_id: int, followed_id: int) -> bool:
         """Check if one user is following another"""
@@ -98,11 +130,14 @@ class USER:
     @classmethod
     def add_follow_relationship(cls, follower_id: int, followed_id: int) -> bool:
         """Add a follow relationship between two users"""
+        # Triggers update both users' follow counts
+        user_cache.invalidate(follower_id, followed_id)
         return db_manager.add_follow(follower_id, followed_id)
 
     @classmethod
     def remove_follow_relationship(cls, follower_id: int, followed_id: int) -> bool:
         """Remove a follow relationship between two users"""
+        user_cache.invalidate(follower_id, followed_id)
         return db_manager.delete_follow(follower_id, followed_id)
 
     # ===== Setters =====
@@ -185,6 +220,7 @@ class USER:
         """Follow another user"""
         self.following_count += 1
         db_manager.add_follow(self.get_id(), other_user_id)
+        user_cache.invalidate(self.get_id(), other_user_id)
         # Update Singleton Graph
         get_social_network().add_edge(self.get_id(), other_user_id)
 
@@ -192,6 +228,7 @@ class USER:
         """Unfollow another user"""
         self.following_count = max(0, self.following_count - 1)
         db_manager.delete_follow(self.get_id(), other_user_id)
+        user_cache.invalidate(self.get_id(), other_user_id)
         # Update Singleton Graph
         get_social_network().remove_edge(self.get_id(), other_user_id)
 
@@ -235,9 +272,16 @@ class USER:
         """Fetch raw posts for this user's feed"""
         return db_manager.return_following_posts(self.get_id())
 
-    def get_my_posts(self) -> List[Dict]:
-        """Fetch all posts created by this user"""
+    def get_feed_posts_page(self, limit: int, offset: int = 0,
+                            after: Optional[Tuple[int, int]] = None,
+                            category: Optional[str] = None) -> Tuple[FeedPage, int]:
+        """One ranked page of this user's feed, with author names, plus the feed size"""
+        return db_manager.return_following_posts_page(self.get_id(), limit, offset, after, category)
+
+    def get_my_posts(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict]:
+        """Fetch posts created by this user, newest first; limit=None means all"""
         post_ids = db_manager.prepare_all_user_posts(self.get_id())
+        post_ids = post_ids[offset:None if limit is None else offset + limit]
         posts = []
         for pid in post_ids:
             p_data = db_manager.read_post(pid)
@@ -268,6 +312,23 @@ class USER:
             'following': get_social_network().get_following_count(self.id)
         }
 
+    def snapshot_fields(self) -> Dict:
+        """The editable profile fields, keyed like SocialMedia.update_user_profile's user_data"""
+        return {
+            'username': self.user_name,
+            'full_name': self.full_name,
+            'email': self.email,
+            'password': self.password,
+            'address': self.address,
+            'interests': list(self.interests),
+            'birthdate': self.birth_date
+        }
+
+    def save_fields(self, fields: Dict) -> bool:
+        """Persist only the given fields (see snapshot_fields for the keys)"""
+        user_cache.invalidate(self.id)
+        return db_manager.update_user_fields(self.id, fields)
+
     def save_changes(self) -> bool:
         """Persist current user object state to the database"""
         user_data = {
@@ -280,6 +341,7 @@ class USER:
             'interests': self.interests,
             'birthdate': self.birth_date
         }
+        user_cache.invalidate(self.id)
         return db_manager.update_user(user_data)
 
     def recommend_friends(self) -> List[Tuple[str, float]]:
@@ -289,17 +351,16 @@ class USER:
         """
         # 1. Get raw recommendations (IDs and Scores) from the Graph logic
         # This now runs the 60% Jaccard + 40% Cosine logic we just wrote.
-        recs_with_ids = get_social_network().get_recommendations(self.get_id())
+        recs_with_ids = self.recommend_friend_ids()
 
-        # 2. Convert IDs to Usernames for the Frontend UI
-        final_list = []
-        for uid, score in recs_with_ids:
-            # We fetch the USER object briefly just to get the username string
-            u_obj = USER.get_by_id(uid)
-            if u_obj:
-                final_list.append((u_obj.get_username(), score))
+        # 2. Convert IDs to Usernames for the Frontend UI (one query for all)
+        users = USER.get_many_by_ids(uid for uid, _ in recs_with_ids)
+        return [(users[uid].get_username(), score)
+                for uid, score in recs_with_ids if uid in users]
 
-        return final_list
+    def recommend_friend_ids(self) -> List[Tuple[int, float]]:
+        """recommend_friends as (user_id, score) pairs, best first"""
+        return get_social_network().get_recommendations(self.get_id())
 
 
 class System:
@@ -1,7 +1,12 @@
 import sqlite3
+import atexit
+import queue
+import threading
+from concurrent.futures import Future
 from datetime import datetime, timedelta
 from typing import List, Tuple, Optional, Dict
 from .message import Msg
+from .enriched_post import EnrichedPost, FeedPage
 import hashlib
 
 # ==============================================
@@ -179,6 +184,26 @@ def authenticate_user(username: str, password: str) -> Optional[Dict]:
         conn.close()
 
 
+def user_row_to_dict(row) -> Dict:
+    """Convert a `SELECT * FROM user` row to the user dict the rest of the app uses"""
+    # FIXED: Corrected all column indices to match the schema
+    # Schema: user_id(0), user_name(1), full_name(2), password(3),
+    #         email(4), birthdate(5), address(6), interests(7),
+    #         follower_count(8), following_count(9), pp_path(10)
+    return {
+        'user_id': row[0],
+        'username': row[1],
+        'full_name': row[2],
+        'password': row[4],
+        'email': row[3],
+        'birthdate': row[7],
+        'address': row[5] if row[5] else "",
+        'interests': tokenize(row[6]) if row[6] else [],
+        'follower_count': row[8] if len(row) > 8 else 0,
+        'following_count': row[9] if len(row) > 9 else 0
+    }
+
+
 def return_user_by_username(username: str) -> Optional[Dict]:
     """Return user data by username"""
     conn = get_connection()
@@ -192,22 +217,7 @@ def return_user_by_username(username: str) -> Optional[Dict]:
         row = cursor.fetchone()
 
         if row:
-            # FIXED: Corrected all column indices to match the schema
-            # Schema: user_id(0), user_name(1), full_name(2), password(3),
-            #         email(4), birthdate(5), address(6), interests(7),
-            #         follower_count(8), following_count(9), pp_path(10)
-            return {
-                'user_id': row[0],
-                'username': row[1],
-                'full_name': row[2],
-                'password': row[4],
-                'email': row[3],
-                'birthdate': row[7],
-                'address': row[5] if row[5] else "",
-                'interests': tokenize(row[6]) if row[6] else [],
-                'follower_count': row[8] if len(row) > 8 else 0,
-                'following_count': row[9] if len(row) > 9 else 0
-            }
+            return user_row_to_dict(row)
         else:
             print(f"Info: No user found with username: {username}")
             return None
@@ -232,19 +242,7 @@ def return_user_by_id(user_id: int) -> Optional[Dict]:
         row = cursor.fetchone()
 
         if row:
-            # FIXED: Corrected all column indices to match the schema
-            return {
-                'user_id': row[0],
-                'username': row[1],
-                'full_name': row[2],
-                'password': row[4],
-                'email': row[3],
-                'birthdate': row[7],
-                'address': row[5] if row[5] else "",
-                'interests': tokenize(row[6]) if row[6] else [],
-                'follower_count': row[8] if len(row) > 8 else 0,
-                'following_count': row[9] if len(row) > 9 else 0
-            }
+            return user_row_to_dict(row)
         else:
             print(f"Info: No user found with user_id: {user_id}")
             return None
@@ -256,6 +254,115 @@ def return_user_by_id(user_id: int) -> Optional[Dict]:
         conn.close()
 
 
+def return_profile_view(user_id: int, viewer_id: Optional[int]) -> Optional[Dict]:
+    """Return the public profile of user_id plus both follow flags relative to
+    viewer_id, in a single query"""
+    return _profile_view("user_id", user_id, viewer_id)
+
+
+def return_profile_view_by_username(username: str, viewer_id: Optional[int]) -> Optional[Dict]:
+    """return_profile_view, looked up by username"""
+    return _profile_view("user_name", username, viewer_id)
+
+
+def _profile_view(column: str, value, viewer_id: Optional[int]) -> Optional[Dict]:
+    conn = get_connection()
+    if not conn:
+        return None
+
+    try:
+        cursor = conn.cursor()
+        # column is always one of the two literals above, never user input
+        cursor.execute(f"""
+            SELECT u.*,
+                   EXISTS(SELECT 1 FROM follow WHERE follower_id = ? AND followed_id = u.user_id),
+                   EXISTS(SELECT 1 FROM follow WHERE follower_id = u.user_id AND followed_id = ?)
+            FROM user u WHERE u.{column} = ?
+        """, (viewer_id, viewer_id, value))
+        row = cursor.fetchone()
+
+        if row:
+            return _profile_view_row_to_dict(row)
+        else:
+            print(f"Info: No user found with {column}: {value}")
+            return None
+
+    except sqlite3.Error as e:
+        print(f"Database error: Failed to fetch profile - {e}")
+        return None
+    finally:
+        conn.close()
+
+
+def return_profile_views(user_ids, viewer_id: Optional[int]) -> Dict[int, Dict]:
+    """return_profile_view for every id in user_ids, keyed by user_id, in one query"""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+
+    conn = get_connection()
+    if not conn:
+        return {}
+
+    try:
+        cursor = conn.cursor()
+        placeholders = ",".join("?" * len(user_ids))
+        cursor.execute(f"""
+            SELECT u.*,
+                   EXISTS(SELECT 1 FROM follow WHERE follower_id = ? AND followed_id = u.user_id),
+                   EXISTS(SELECT 1 FROM follow WHERE follower_id = u.user_id AND followed_id = ?)
+            FROM user u WHERE u.user_id IN ({placeholders})
+        """, (viewer_id, viewer_id, *user_ids))
+        return {row[0]: _profile_view_row_to_dict(row) for row in cursor.fetchall()}
+
+    except sqlite3.Error as e:
+        print(f"Database error: Failed to fetch profiles - {e}")
+        return {}
+    finally:
+        conn.close()
+
+
+def _profile_view_row_to_dict(row) -> Dict:
+    # Same user columns as return_user_by_id; the two flags come last
+    return {
+        'user_id': row[0],
+        'username': row[1],
+        'full_name': row[2],
+        'follower_count': row[8] if len(row) > 10 else 0,
+        'following_count': row[9] if len(row) > 11 else 0,
+        'is_following': bool(row[-2]),
+        'is_followed_by': bool(row[-1]),
+        'interests': tokenize(row[6]) if row[6] else []
+    }
+
+
+def return_users_by_ids(user_ids) -> Dict[int, Dict]:
+    """Return user data for every id in user_ids, keyed by user_id, in one query"""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return {}
+
+    conn = get_connection()
+    if not conn:
+        return {}
+
+    try:
+        cursor = conn.cursor()
+        placeholders = ",".join("?" * len(user_ids))
+        cursor.execute(f"SELECT * FROM user WHERE user_id IN ({placeholders})", user_ids)
+
+        users = {}
+        for row in cursor.fetchall():
+            users[row[0]] = user_row_to_dict(row)
+        return users
+
+    except sqlite3.Error as e:
+        print(f"Database error: Failed to fetch users - {e}")
+        return {}
+    finally:
+        conn.close()
+
+
 def update_user(user_data: Dict) -> bool:
     """Update user information"""
     conn = get_connection()
@@ -292,6 +399,48 @@ def update_user(user_data: Dict) -> bool:
         conn.close()
 
 
+# update_user_fields keys (as in update_user's user_data) -> user table columns
+_USER_UPDATE_COLUMNS = {
+    'username': 'user_name',
+    'full_name': 'full_name',
+    'password': 'password',
+    'email': 'email',
+    'birthdate': 'birthdate',
+    'address': 'address',
+    'interests': 'interests',
+}
+
+
+def update_user_fields(user_id: int, fields: Dict) -> bool:
+    """Update only the given user columns, e.g. {'address': ...}, instead of
+    rewriting the whole row like update_user"""
+    fields = {key: value for key, value in fields.items() if key in _USER_UPDATE_COLUMNS}
+    if not fields:
+        return True
+
+    conn = get_connection()
+    if not conn:
+        return False
+
+    try:
+        cursor = conn.cursor()
+        # Column names come from _USER_UPDATE_COLUMNS, never from the caller
+        assignments = ", ".join(f"{_USER_UPDATE_COLUMNS[key]}=?" for key in fields)
+        values = [join_list(value) if key == 'interests' else value
+                  for key, value in fields.items()]
+        cursor.execute(f"UPDATE user SET {assignments} WHERE user_id=?", (*values, user_id))
+
+        conn.commit()
+        print("USER UPDATED")
+        return True
+
+    except sqlite3.Error as e:
+        print(f"Database error: Failed to update user - {e}")
+        return False
+    finally:
+        conn.close()
+
+
 def return_last_user_id() -> int:
     """Return the last inserted user_id"""
     conn = get_connection()
@@ -584,6 +733,98 @@ def return_following_posts(user_id: int) -> List[Dict]:
         conn.close()
 
 
+def _feed_row_to_post(row: sqlite3.Row) -> EnrichedPost:
+    # Columns by name from the SELECT in return_following_posts_page
+    return EnrichedPost(
+        post_id=row['post_id'],
+        user_id=row['user_id'],
+        post_score=row['post_score'],
+        date=format_time_ago(string_to_timepoint(row['date_text'])) if row['date_text'] else None,
+        categories=split_categories(row['category']) if row['category'] else [],
+        content=row['content'] if row['content'] else "",
+        like_count=row['like_count'],
+        dislike_count=row['dislike_count'],
+        comment_count=row['comment_count'],
+        author_name=row['full_name'],
+        author_username=row['user_name'],
+        score=row['score']
+    )
+
+
+def return_following_posts_page(user_id: int, limit: int, offset: int = 0,
+                                after: Optional[Tuple[int, int]] = None,
+                                category: Optional[str] = None) -> Tuple[FeedPage, int]:
+    """One page of the posts from users that user_id follows, highest score first,
+    as a FeedPage of EnrichedPost rows with author names joined in. Returns
+    (posts, total number of feed posts).
+    A negative limit means no limit.
+
+    after=(score, post_id) of the last post already shown starts the page right
+    after it (keyset pagination) instead of skipping offset rows.
+
+    category keeps only posts tagged with it (case-insensitive), matched against
+    the comma-separated category column in SQL.
+
+    The score matches POST.update_score for posts read without a timestamp
+    (as return_following_posts gives them): the time term is the same for
+    every post, so only likes*5 + comments*10 - dislikes*5 orders the feed.
+    """
+    conn = get_connection()
+    if not conn:
+        return FeedPage([], _feed_row_to_post), 0
+    conn.row_factory = sqlite3.Row
+
+    score_sql = """p.like_count * 5 + COALESCE(p.comment_count, 0) * 10
+                       - COALESCE(p.dislike_count, 0) * 5"""
+    # Wrapping both sides in commas makes the LIKE match whole entries only;
+    # split_categories strips spaces, so drop the ones after commas here too
+    category_where, category_params = "", ()
+    if category:
+        category_where = """AND ',' || LOWER(REPLACE(p.category, ', ', ',')) || ','
+                                LIKE '%,' || LOWER(?) || ',%'"""
+        category_params = (category.strip(),)
+
+    if after is not None:
+        # Rows ranked strictly below (score, post_id) in ORDER BY order
+        where, params = "AND (" + score_sql + ", p.post_id) < (?, ?)", (*after, limit, 0)
+    else:
+        where, params = "", (limit, offset)
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT COUNT(*) FROM post p
+            JOIN follow f ON p.user_id = f.followed_id
+            WHERE f.follower_id = ? {category_where}
+        """, (user_id, *category_params))
+        total = cursor.fetchone()[0]
+
+        cursor.execute(f"""
+            SELECT p.post_id, p.user_id, p.date_text, p.category, p.content,
+                   p.like_count, p.post_score, p.dislike_count, p.comment_count,
+                   u.full_name, u.user_name,
+                   {score_sql} AS score
+            FROM post p
+            JOIN follow f ON p.user_id = f.followed_id
+            JOIN user u ON u.user_id = p.user_id
+            WHERE f.follower_id = ? {category_where} {where}
+            ORDER BY score DESC, p.post_id DESC
+            LIMIT ? OFFSET ?
+        """, (user_id, *category_params, *params))
+
+        # Rows become EnrichedPost objects (date and category parsing) only
+        # when the page is read
+        posts = FeedPage(cursor.fetchall(), _feed_row_to_post)
+
+        return posts, total
+
+    except sqlite3.Error as e:
+        print(f"Database error: Failed to get following posts page - {e}")
+        return FeedPage([], _feed_row_to_post), 0
+    finally:
+        conn.close()
+
+
 # ==============================================
 # Like/Dislike Counter Operations
 # ==============================================
@@ -911,6 +1152,24 @@ def get_following_list_of_user(user_id: int) -> List[str]:
     finally:
         conn.close()
 
+def get_following_ids(user_id: int) -> List[int]:
+    """Get the IDs of every user the given user follows"""
+    conn = get_connection()
+    if not conn:
+        return []
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT followed_id FROM follow WHERE follower_id = ?", (user_id,))
+        return [row[0] for row in cursor.fetchall()]
+
+    except sqlite3.Error as e:
+        print(f"❌ Database error: Failed to get following ids - {e}")
+        return []
+    finally:
+        conn.close()
+
+
 def get_followers_with_details(user_id: int) -> List[Dict]:
     """Get list of users who follow the given user with full details"""
     conn = get_connection()
@@ -1509,7 +1768,93 @@ def add_message(m: Msg) -> bool:
         conn.close()
 
 
+class MessageWriter:
+    """Background writer for chat messages.
+
+    Sends are queued and a daemon thread drains up to MAX_BATCH of them into
+    one executemany/commit, so the GUI thread never waits on an INSERT. The
+    date is stamped at enqueue time, so chat order is the order of sending.
+    Readers call flush() first to see everything sent so far.
+    """
+
+    MAX_BATCH = 64
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, m: Msg) -> Future:
+        """Queue m for insertion; the future resolves to True once it is committed"""
+        future = Future()
+        date_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        m.set_date(date_str)
+        self._start()
+        self._queue.put(((m.sender_id, m.receiver_id, date_str, m.content), future))
+        return future
+
+    def flush(self):
+        """Block until every queued message has been written"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="MessageWriter", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Every future must be resolved and every item marked done, whatever
+            # happens, or flush() (and the atexit hook) would wait forever
+            try:
+                ok = self._write([row for row, _ in batch])
+            except Exception as e:
+                print(f"Database error: Failed to write messages - {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for _, future in batch:
+                    future.set_result(ok)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, rows) -> bool:
+        conn = get_connection()
+        if not conn:
+            print("Database error: Failed to open database connection.")
+            return False
+
+        try:
+            sql = "INSERT INTO messages (sender_id, receiver_id, date_text, content) VALUES (?, ?, ?, ?);"
+            with conn:
+                conn.executemany(sql, rows)
+            return True
+
+        except sqlite3.Error as e:
+            print(f"Database error: Failed to write messages - {e}")
+            return False
+
+        finally:
+            conn.close()
+
+
+message_writer = MessageWriter()
+# Don't drop queued messages when the app closes
+atexit.register(message_writer.flush)
+
+
 def delete_message(m: Msg) -> bool:
+    message_writer.flush()
     conn = get_connection()
     if not conn:
         print("Database error: Failed to open database connection.")
@@ -1536,6 +1881,7 @@ from typing import List
 def get_chat(user1: int, user2: int) -> List[Msg]:
     chat: List[Msg] = []
 
+    message_writer.flush()
     conn = get_connection()
     if not conn:
         print("operation failed")
@@ -1573,3 +1919,37 @@ def get_chat(user1: int, user2: int) -> List[Msg]:
         conn.close()
 
     return chat
+
+
+def get_conversations(user_id: int) -> List[Dict]:
+    """Everyone user_id has exchanged messages with, most recent chat first, as
+    {'user_data': user dict, 'last_date': date of the latest message}"""
+    message_writer.flush()
+    conn = get_connection()
+    if not conn:
+        return []
+
+    try:
+        cursor = conn.cursor()
+        # Partners and their user rows in one query, instead of a lookup per partner
+        sql = """
+            SELECT u.*, c.last_date
+            FROM (
+                SELECT CASE WHEN sender_id = ? THEN receiver_id ELSE sender_id END AS other_user_id,
+                       MAX(date_text) AS last_date
+                FROM messages
+                WHERE sender_id = ? OR receiver_id = ?
+                GROUP BY other_user_id
+            ) c
+            JOIN user u ON u.user_id = c.other_user_id
+            ORDER BY c.last_date DESC
+        """
+        cursor.execute(sql, (user_id, user_id, user_id))
+        return [{'user_data': user_row_to_dict(row[:-1]), 'last_date': row[-1]}
+                for row in cursor.fetchall()]
+
+    except sqlite3.Error as e:
+        print(f"Database error: Failed to get conversations - {e}")
+        return []
+    finally:
+        conn.close()
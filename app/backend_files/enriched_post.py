@@ -0,0 +1,70 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from sqlite3 import Row
+from typing import Callable, List, Optional, Tuple
+
+
+@dataclass(slots=True)
+class EnrichedPost:
+    """A feed post with its author's names joined in, as returned by
+    db_manager.return_following_posts_page.
+
+    Slots keep each feed row small and its fields fast to read. get() and []
+    accept the old dict keys so pages written against feed dicts still work.
+    """
+    post_id: int
+    user_id: int
+    post_score: int
+    date: Optional[str]
+    content: str
+    like_count: int
+    dislike_count: int
+    comment_count: int
+    author_name: str
+    author_username: str
+    score: int
+    categories: List[str] = field(default_factory=list)
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+class FeedPage(Sequence):
+    """The rows of one feed page, turned into EnrichedPost objects only when
+    read, so a page that is only partly rendered only pays for those posts.
+
+    It behaves like a read-only list: len(), indexing, slicing and iteration.
+    Rows are sqlite3.Row objects with at least 'score' and 'post_id' columns.
+    """
+
+    def __init__(self, rows: List[Row], build: Callable[[Row], EnrichedPost]):
+        self._rows = rows
+        self._build = build
+        self._posts: List[Optional[EnrichedPost]] = [None] * len(rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._rows)))]
+
+        post = self._posts[index]
+        if post is None:
+            post = self._posts[index] = self._build(self._rows[index])
+        return post
+
+    def cursor(self, index: int = -1) -> Tuple[int, int]:
+        """(score, post_id) of self[index], the keyset that resumes the feed after
+        it, read without building the post"""
+        row = self._rows[index]
+        return row['score'], row['post_id']
+
+    def __repr__(self):
+        return f"FeedPage({len(self._rows)} posts)"
@@ -1,5 +1,6 @@
 import numpy as np
 import random
+import threading
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from app.backend_files import social_network, db_manager
@@ -8,7 +9,7 @@ from sklearn.model_selection import train_test_split
 
 
 class LinkPredictor:
-    def __init__(self):
+    def __init__(self, train: bool = True):
         self.knn = KNN(k=5)
         self.network = social_network.get_social_network()
         self.is_trained = False
@@ -17,7 +18,27 @@ class LinkPredictor:
         self.scaler_mean = None
         self.scaler_std = None
 
-        self.train_model()
+        # Only one training pass at a time; warmup() runs it on this thread
+        self._train_lock = threading.Lock()
+        self._warmup_thread = None
+
+        if train:
+            self.train_model()
+
+    def warmup(self) -> threading.Thread:
+        """Train (or retrain) in a background thread so the caller isn't blocked
+        by prepare_data's pass over every user pair. Predictions wait for it."""
+        if self._warmup_thread is None or not self._warmup_thread.is_alive():
+            self._warmup_thread = threading.Thread(target=self.train_model,
+                                                   name="LinkPredictorWarmup", daemon=True)
+            self._warmup_thread.start()
+        return self._warmup_thread
+
+    def wait_for_training(self) -> None:
+        """Block until a training pass started by warmup() has finished"""
+        thread = self._warmup_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
 
     def prepare_data(self):
         size = self.network.return_num_of_users()
@@ -79,6 +100,10 @@ class LinkPredictor:
         return np.array(X, dtype=float), np.array(y)
 
     def train_model(self):
+        with self._train_lock:
+            self._train_model()
+
+    def _train_model(self):
         try:
             X, y = self.prepare_data()
 
@@ -107,6 +132,7 @@ class LinkPredictor:
             self.is_trained = False
 
     def predict_follow(self, user1_id: int, user2_id: int):
+        self.wait_for_training()
         if not self.is_trained: return 0, [0, 0, 0]
 
         user1 = db_manager.return_user_by_id(user1_id)
@@ -132,6 +158,7 @@ class LinkPredictor:
         return self.knn.predict_one(x_scaled), raw_features
 
     def visualize_prediction_3d(self, user1_id, user2_id):
+        self.wait_for_training()
         if not self.is_trained: return
 
         # Get prediction and features
@@ -170,6 +197,7 @@ class LinkPredictor:
 
     def get_ai_recommendations(self, user_id):
         # Helper function for "Suggest Friends" feature if needed
+        self.wait_for_training()
         if not self.is_trained: return []
         recommendations = []
         size = self.network.return_num_of_users()
@@ -38,6 +38,8 @@ class SocialNetwork:
         # graph[i][j] == 1 means User i follows User j
         # graph[i][j] == 0 means no connection
         self.graph: List[List[int]] = []
+        # Number of 1s in the matrix, kept in step by every method that writes it
+        self._edge_count = 0
         self._initialized = True
 
     @classmethod
@@ -65,11 +67,13 @@ class SocialNetwork:
 
         # Create a new graph of size (size x size) with all elements as 0
         self.graph = [[0 for _ in range(size)] for _ in range(size)]
+        self._edge_count = 0
 
         # Populate the graph with connections
         for follower, followee in connections:
             if follower < size and followee < size:
                 if follower != followee:  # Prevent self-loops
+                    self._edge_count += 1 - self.graph[follower][followee]
                     self.graph[follower][followee] = 1
 
         print(f"DEBUG: Graph initialized with {size} nodes and {len(connections)} connections.")
@@ -110,11 +114,13 @@ class SocialNetwork:
         size = len(self.graph)
 
         # The user stops following everyone (clear row)
+        self._edge_count -= sum(self.graph[user_id])
         for j in range(size):
             self.graph[user_id][j] = 0
 
         # Everyone stops following the user (clear column)
         for i in range(size):
+            self._edge_count -= self.graph[i][user_id]
             self.graph[i][user_id] = 0
 
     def add_edge(self, from_user: int, to_user: int) -> None:
@@ -134,6 +140,7 @@ class SocialNetwork:
         if from_user == to_user:
             return
 
+        self._edge_count += 1 - self.graph[from_user][to_user]
         self.graph[from_user][to_user] = 1
 
     def remove_edge(self, from_user: int, to_user: int) -> None:
@@ -147,6 +154,7 @@ class SocialNetwork:
         if from_user >= len(self.graph) or to_user >= len(self.graph):
             return
 
+        self._edge_count -= self.graph[from_user][to_user]
         self.graph[from_user][to_user] = 0
 
     def is_edge(self, user1: int, user2: int) -> bool:
@@ -316,17 +324,16 @@ class SocialNetwork:
     def clear_graph(self) -> None:
         """Clear the entire graph"""
         self.graph = []
+        self._edge_count = 0
 
     def __str__(self) -> str:
         """String representation of the social network"""
         return f"SocialNetwork(users={len(self.graph)}, connections={self._count_connections()})"
 
     def _count_connections(self) -> int:
-        """Count the total number of connections in the graph"""
-        count = 0
-        for row in self.graph:
-            count += sum(row)
-        return count
+        """Count the total number of connections in the graph (O(1), maintained
+        on every edge change instead of summing the matrix)"""
+        return self._edge_count
 
     def __repr__(self) -> str:
         """Developer-friendly representation"""
@@ -0,0 +1,47 @@
+"""
+Short-lived cache of user rows for USER.get_by_id.
+
+The same few users are resolved over and over (feed authors, profile views,
+follower counts), each time with its own connection and query. Rows are kept
+for USER_CACHE_TTL seconds; USER drops a user's row whenever it writes to it,
+so the TTL only bounds staleness from writes made outside USER.
+"""
+import time
+from typing import Dict, Optional
+
+from . import db_manager
+
+USER_CACHE_TTL = 60.0
+USER_CACHE_MAX = 4096
+
+# user_id -> (time fetched, user dict from db_manager.return_user_by_id)
+_rows: Dict[int, tuple] = {}
+
+
+def get_user_data(user_id: int) -> Optional[Dict]:
+    """db_manager.return_user_by_id, reusing a row read in the last USER_CACHE_TTL seconds"""
+    now = time.monotonic()
+    hit = _rows.get(user_id)
+    if hit and now - hit[0] < USER_CACHE_TTL:
+        return _copy(hit[1])
+
+    data = db_manager.return_user_by_id(user_id)
+    if not data:
+        _rows.pop(user_id, None)
+        return None
+    if len(_rows) >= USER_CACHE_MAX:
+        # Dicts keep insertion order, so this drops the oldest fetch
+        _rows.pop(next(iter(_rows)), None)
+    _rows[user_id] = (now, data)
+    return _copy(data)
+
+
+def invalidate(*user_ids: int) -> None:
+    """Forget the cached rows of these users"""
+    for user_id in user_ids:
+        _rows.pop(user_id, None)
+
+
+def _copy(data: Dict) -> Dict:
+    # Callers get their own dict (and interests list) to mutate
+    return {**data, 'interests': list(data['interests'])}
@@ -10,7 +10,7 @@ from .pages.messages import MessagingPage
 from .styles import get_stylesheet
 from .pages.network_graph import NetworkGraph
 from .socialmedia_app import SocialMedia  # Import the backend controller
-from .utils.audio import AudioManager
+from .utils.audio import get_audio_manager
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -19,7 +19,7 @@ class MainWindow(QMainWindow):
         # 1. Initialize the Backend (The Brain)
         self.app = SocialMedia()
 
-        self.audio = AudioManager()
+        self.audio = get_audio_manager()
         QTimer.singleShot(10, self.audio.play_start)
 
         self.setWindowTitle("Social Media App")
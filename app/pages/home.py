@@ -6,10 +6,13 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QPixmap, QIcon, QFont, QPainter, QPainterPath,QColor
 from PySide6.QtCore import Qt, QRectF
+import logging
 import os
 from datetime import datetime, timedelta
 from app.utils import paths
 
+logger = logging.getLogger(__name__)
+
 
 class HomePage(QWidget):
     def __init__(self, main_window):
@@ -576,32 +579,25 @@ class HomePage(QWidget):
         """Update the profile picture with user's image"""
         # Check if profile_pic_label exists
         if not hasattr(self, 'profile_pic_label') or not self.profile_pic_label:
-            print("❌ profile_pic_label not initialized")
+            logger.debug("profile_pic_label not initialized")
             return
 
         # Get current user
         current_user = self.main_window.app.get_current_user()
         if not current_user:
-            print("❌ No current user logged in")
+            logger.debug("No current user logged in")
             return
 
         username = current_user.get_username()
         image_dir = paths.IMAGE_DIR
 
-        # Try multiple image formats
-        possible_extensions = ['.png', '.jpg', '.jpeg', '.PNG', '.JPG', '.JPEG']
-        img_path = None
-
-        for ext in possible_extensions:
-            test_path = os.path.join(image_dir, f"{username}{ext}")
-            if os.path.exists(test_path):
-                img_path = test_path
-                print(f"✅ Found profile image: {img_path}")
-                break
+        img_path = paths.find_user_image(username)
+        if img_path:
+            logger.debug("Found profile image: %s", img_path)
 
         # If no user-specific image found, use default
         if not img_path:
-            print(f"⚠️ No profile image found for {username}, using default")
+            logger.debug("No profile image found for %s, using default", username)
             default_path = os.path.join(image_dir, "profile.png")
             if os.path.exists(default_path):
                 img_path = default_path
@@ -615,14 +611,14 @@ class HomePage(QWidget):
         # Load and set the circular image
         circular_pixmap = self.load_circular_image(img_path, 67)
         self.profile_pic_label.setPixmap(circular_pixmap)
-        print(f"✅ Profile picture updated for {username}")
+        logger.debug("Profile picture updated for %s", username)
 
     def load_circular_image(self, path: str, size: int) -> QPixmap:
         """Load an image, crop it into a circle, and resize."""
         pixmap = QPixmap(path)
 
         if pixmap.isNull():
-            print(f"❌ Image not found: {path}")
+            logger.debug("Image not found: %s", path)
             # Create a gray circular placeholder
             placeholder = QPixmap(size, size)
             placeholder.fill(Qt.transparent)
@@ -1234,7 +1230,7 @@ class HomePage(QWidget):
         path = os.path.join(paths.IMAGE_DIR, filename)
 
         if not os.path.exists(path):
-            print("❌ Image not found:", path)
+            logger.debug("Image not found: %s", path)
             # Create a placeholder (it's good practice to fill it with a color or transparency)
             placeholder = QPixmap(size, size)
             placeholder.fill(Qt.lightGray)
@@ -3,16 +3,16 @@ from PySide6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout,
     QLineEdit, QPushButton, QMessageBox, QGraphicsOpacityEffect
 )
-from PySide6.QtGui import QPixmap
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint
 from app.utils.paths import IMAGE_DIR
-from app.utils.audio import AudioManager
+from app.utils.pixmaps import load_scaled_pixmap
+from app.utils.audio import get_audio_manager
 
 class LoginPage(QWidget):
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
-        self.audio = AudioManager()
+        self.audio = get_audio_manager()
 
         # Setup Opacity Effect for the entire page
         self.opacity_effect = QGraphicsOpacityEffect(self)
@@ -116,23 +116,8 @@ class LoginPage(QWidget):
 
     # ---------- LOAD LOGOS SAFELY ----------
     def load_logos(self):
-        light_path = os.path.join(IMAGE_DIR, "logo_light.png")
-        dark_path  = os.path.join(IMAGE_DIR, "logo_dark.png")
-
-        self.light_logo = QPixmap(light_path)
-        self.dark_logo = QPixmap(dark_path)
-
-        if self.light_logo.isNull():
-            print("❌ Light logo missing:", light_path)
-        if self.dark_logo.isNull():
-            print("❌ Dark logo missing:", dark_path)
-
-        self.light_logo = self.light_logo.scaled(
-            420, 420, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        self.dark_logo = self.dark_logo.scaled(
-            420, 420, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
+        self.light_logo = load_scaled_pixmap(os.path.join(IMAGE_DIR, "logo_light.png"), 420)
+        self.dark_logo = load_scaled_pixmap(os.path.join(IMAGE_DIR, "logo_dark.png"), 420)
 
     # ---------- UPDATE LOGO BASED ON MODE ----------
     def update_logo(self):
@@ -3,23 +3,299 @@ from PySide6.QtWidgets import (
     QLineEdit, QScrollArea, QFrame, QListWidget, QListWidgetItem,
     QTextEdit, QStackedWidget, QMessageBox
 )
-from PySide6.QtGui import QPixmap, QPainter, QPainterPath, QColor, QIcon, QFont, QLinearGradient, QBrush
-from PySide6.QtCore import Qt, QRectF, QTimer
+from PySide6.QtGui import QPixmap, QImage, QPainter, QPainterPath, QColor, QIcon, QFont, QLinearGradient, QBrush
+from PySide6.QtCore import Qt, QRectF, QTimer, Signal
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from app.utils import paths
 
+# Worker threads used to decode conversation avatars off the GUI thread
+_AVATAR_LOAD_WORKERS = 4
+
+# Stylesheets are shared module constants so rebuilding the conversation list
+# and chat view reuses the same strings instead of re-creating literals.
+_SEARCH_BAR_QSS = """
+    QFrame {
+        background: rgba(255, 255, 255, 0.15);
+        border-radius: 22px;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+    }
+    QFrame:hover {
+        background: rgba(255, 255, 255, 0.2);
+        border: 1px solid rgba(255, 255, 255, 0.3);
+    }
+"""
+
+_SEARCH_ICON_QSS = """
+    QLabel {
+        color: rgba(255, 255, 255, 0.7);
+        font-size: 16px;
+    }
+"""
+
+_SEARCH_INPUT_QSS = """
+    QLineEdit {
+        background: transparent;
+        border: none;
+        color: white;
+        font-size: 13px;
+        selection-background-color: rgba(255, 255, 255, 0.3);
+    }
+    QLineEdit::placeholder {
+        color: rgba(255, 255, 255, 0.5);
+        font-style: italic;
+    }
+"""
+
+_ROUND_NAV_BTN_QSS = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.15);
+        color: white;
+        font-size: 22px;
+        border: none;
+        border-radius: 22px;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.25);
+    }
+    QPushButton:pressed {
+        background: rgba(255, 255, 255, 0.35);
+    }
+"""
+
+_HEADER_TITLE_QSS = """
+    QLabel {
+        color: white;
+        font-size: 18px;
+        font-weight: 800;
+        letter-spacing: 2px;
+        text-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
+    }
+"""
+
+_PROFILE_BTN_QSS = """
+    QPushButton {
+        background: white;
+        border-radius: 22px;
+        border: 2px solid white;
+        box-shadow: 0 3px 8px rgba(0, 0, 0, 0.2);
+    }
+    QPushButton:hover {
+        border: 2px solid rgba(255, 255, 255, 0.8);
+        box-shadow: 0 4px 10px rgba(0, 0, 0, 0.3);
+    }
+"""
+
+_ACTIVE_USER_BTN_QSS = """
+    QPushButton {
+        background: white;
+        border-radius: 32px;
+        border: 3px solid rgba(255, 255, 255, 0.6);
+        box-shadow: 0 3px 6px rgba(0, 0, 0, 0.15);
+    }
+    QPushButton:hover {
+        border: 3px solid white;
+        box-shadow: 0 5px 12px rgba(0, 0, 0, 0.25);
+        transform: translateY(-2px);
+    }
+"""
+
+_BOTTOM_NAV_BTN_QSS = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.15);
+        color: white;
+        font-size: 18px;
+        border: none;
+        border-radius: 22px;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.25);
+    }
+    QPushButton:pressed {
+        background: rgba(255, 255, 255, 0.35);
+    }
+"""
+
+_NO_CONVERSATIONS_QSS = """
+    color: rgba(255, 255, 255, 0.7); 
+    font-size: 13px; 
+    padding: 30px; 
+    font-style: italic;
+    text-align: center;
+    border: 2px dashed rgba(255, 255, 255, 0.2);
+    border-radius: 15px;
+    margin: 10px;
+"""
+
+_TRANSPARENT_QSS = "background: transparent; border: none;"
+
+_CONV_NAME_QSS = "font-weight: 600; font-size: 14px; background: transparent; border: none;"
+
+_CONV_USERNAME_QSS = "font-size: 11px; background: transparent; border: none; opacity: 0.7;"
+
+_LAST_MSG_QSS = """
+    QLabel {
+        color: rgba(255, 255, 255, 0.6);
+        font-size: 11px;
+        background: transparent;
+        font-style: italic;
+    }
+"""
+
+_CHAT_BACK_BTN_QSS = """
+    QPushButton {
+        background: rgba(91, 141, 238, 0.1);
+        color: #5B8DEE;
+        font-size: 22px;
+        font-weight: bold;
+        border-radius: 22px;
+        border: 1px solid rgba(91, 141, 238, 0.2);
+    }
+    QPushButton:hover {
+        background: rgba(91, 141, 238, 0.2);
+        border: 1px solid rgba(91, 141, 238, 0.4);
+    }
+    QPushButton:pressed {
+        background: rgba(91, 141, 238, 0.3);
+    }
+"""
+
+_CHAT_AVATAR_FRAME_QSS = """
+    QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #5B8DEE, stop:1 #4A7DDD);
+        border-radius: 25px;
+    }
+"""
+
+_CHAT_NAME_QSS = """
+    font-size: 18px;
+    letter-spacing: 0.2px;
+    background: transparent;
+    border: none;
+"""
+
+_ONLINE_DOT_QSS = """
+    QLabel {
+        color: #4CAF50;
+        font-size: 10px;
+    }
+"""
+
+_CHAT_STATUS_QSS = """
+    font-size: 12px;
+    font-weight: 500;
+    background: transparent;
+    border: none;
+"""
+
+_CHAT_ACTION_BTN_QSS = """
+    QPushButton {{
+        background: rgba({rgb}, 0.1);
+        color: {color};
+        font-size: 16px;
+        border-radius: 21px;
+        border: 1px solid rgba({rgb}, 0.2);
+    }}
+    QPushButton:hover {{
+        background: rgba({rgb}, 0.2);
+        border: 1px solid rgba({rgb}, 0.4);
+    }}
+"""
+
+_SEND_BTN_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #5B8DEE, stop:1 #4A7DDD);
+        color: white;
+        font-size: 22px;
+        font-weight: bold;
+        border-radius: 26px;
+        border: none;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #4A7DDD, stop:1 #5B8DEE);
+        box-shadow: 0 3px 10px rgba(91, 141, 238, 0.3);
+    }
+    QPushButton:pressed {
+        padding-top: 2px;
+    }
+"""
+
+_BUBBLE_TEXT_QSS = "background: transparent; border: none; font-size: 14px;"
+
+_BUBBLE_TIME_QSS = "background: transparent; border: none; font-size: 11px; opacity: 0.7;"
+
+_EMPTY_ICON_QSS = """
+    QLabel {
+        font-size: 60px;
+        color: #CBD5E0;
+        opacity: 0.7;
+    }
+"""
+
+_EMPTY_MESSAGE_QSS = """
+    QLabel {
+        color: #718096;
+        font-size: 16px;
+        font-weight: 600;
+        text-align: center;
+    }
+"""
+
+_EMPTY_SUB_MESSAGE_QSS = """
+    QLabel {
+        color: #A0AEC0;
+        font-size: 13px;
+        text-align: center;
+    }
+"""
+
+_WELCOME_CONTAINER_QSS = """
+    QWidget {
+        background: rgba(91, 141, 238, 0.05);
+        border-radius: 15px;
+        border: 1px dashed rgba(91, 141, 238, 0.3);
+        margin: 20px;
+    }
+"""
+
+_WELCOME_MSG_QSS = """
+    QLabel {
+        color: #5B8DEE;
+        font-size: 15px;
+        font-weight: 600;
+    }
+"""
+
+_WELCOME_TIP_QSS = """
+    QLabel {
+        color: #718096;
+        font-size: 12px;
+        font-style: italic;
+    }
+"""
+
 
 class MessagingPage(QWidget):
     """Complete messaging interface with conversation list and chat view"""
 
+    # Emitted from the message writer thread; Qt delivers it on the GUI thread
+    send_failed = Signal(int, str)
+
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
+        self.send_failed.connect(self.on_send_failed)
 
         # State management
         self.current_conversation_user = None
         self.conversations = []
+        self._avatar_images = {}
+        self._scroll_pending = False
 
         self.build_ui()
 
@@ -100,17 +376,7 @@ class MessagingPage(QWidget):
         """Create search bar for conversations"""
         container = QFrame()
         container.setFixedHeight(45)
-        container.setStyleSheet("""
-            QFrame {
-                background: rgba(255, 255, 255, 0.15);
-                border-radius: 22px;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-            QFrame:hover {
-                background: rgba(255, 255, 255, 0.2);
-                border: 1px solid rgba(255, 255, 255, 0.3);
-            }
-        """)
+        container.setStyleSheet(_SEARCH_BAR_QSS)
 
         layout = QHBoxLayout(container)
         layout.setContentsMargins(15, 0, 15, 0)
@@ -118,29 +384,12 @@ class MessagingPage(QWidget):
 
         # Search icon
         search_icon = QLabel("🔍")
-        search_icon.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 16px;
-            }
-        """)
+        search_icon.setStyleSheet(_SEARCH_ICON_QSS)
 
         # Search input
         search_input = QLineEdit()
         search_input.setPlaceholderText("Search conversations...")
-        search_input.setStyleSheet("""
-            QLineEdit {
-                background: transparent;
-                border: none;
-                color: white;
-                font-size: 13px;
-                selection-background-color: rgba(255, 255, 255, 0.3);
-            }
-            QLineEdit::placeholder {
-                color: rgba(255, 255, 255, 0.5);
-                font-style: italic;
-            }
-        """)
+        search_input.setStyleSheet(_SEARCH_INPUT_QSS)
 
         layout.addWidget(search_icon)
         layout.addWidget(search_input, 1)
@@ -156,33 +405,11 @@ class MessagingPage(QWidget):
         menu_btn.setFixedSize(45, 45)
         menu_btn.clicked.connect(self.go_to_home)
         menu_btn.setCursor(Qt.PointingHandCursor)
-        menu_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.15);
-                color: white;
-                font-size: 22px;
-                border: none;
-                border-radius: 22px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.25);
-            }
-            QPushButton:pressed {
-                background: rgba(255, 255, 255, 0.35);
-            }
-        """)
+        menu_btn.setStyleSheet(_ROUND_NAV_BTN_QSS)
 
         # Title
         title = QLabel("MESSAGES")
-        title.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 18px;
-                font-weight: 800;
-                letter-spacing: 2px;
-                text-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
-            }
-        """)
+        title.setStyleSheet(_HEADER_TITLE_QSS)
 
         # Profile pic
         current_user = self.main_window.app.get_current_user()
@@ -195,18 +422,7 @@ class MessagingPage(QWidget):
             profile_btn.setIcon(QIcon(self.load_circular_image(img_path, 45)))
             profile_btn.setIconSize(profile_btn.size())
 
-        profile_btn.setStyleSheet("""
-            QPushButton {
-                background: white;
-                border-radius: 22px;
-                border: 2px solid white;
-                box-shadow: 0 3px 8px rgba(0, 0, 0, 0.2);
-            }
-            QPushButton:hover {
-                border: 2px solid rgba(255, 255, 255, 0.8);
-                box-shadow: 0 4px 10px rgba(0, 0, 0, 0.3);
-            }
-        """)
+        profile_btn.setStyleSheet(_PROFILE_BTN_QSS)
         profile_btn.clicked.connect(self.main_window.go_to_my_profile)
 
         header.addWidget(menu_btn)
@@ -254,19 +470,7 @@ class MessagingPage(QWidget):
 
         btn.setIcon(QIcon(pixmap))
         btn.setIconSize(btn.size())
-        btn.setStyleSheet("""
-            QPushButton {
-                background: white;
-                border-radius: 32px;
-                border: 3px solid rgba(255, 255, 255, 0.6);
-                box-shadow: 0 3px 6px rgba(0, 0, 0, 0.15);
-            }
-            QPushButton:hover {
-                border: 3px solid white;
-                box-shadow: 0 5px 12px rgba(0, 0, 0, 0.25);
-                transform: translateY(-2px);
-            }
-        """)
+        btn.setStyleSheet(_ACTIVE_USER_BTN_QSS)
 
         btn.clicked.connect(lambda: self.open_conversation(user_data))
         btn.setToolTip(f"{user_data['full_name']}\n@{user_data['username']}")
@@ -289,21 +493,7 @@ class MessagingPage(QWidget):
             btn.setFixedSize(45, 45)
             btn.setCursor(Qt.PointingHandCursor)
             btn.setToolTip(tooltip)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: rgba(255, 255, 255, 0.15);
-                    color: white;
-                    font-size: 18px;
-                    border: none;
-                    border-radius: 22px;
-                }
-                QPushButton:hover {
-                    background: rgba(255, 255, 255, 0.25);
-                }
-                QPushButton:pressed {
-                    background: rgba(255, 255, 255, 0.35);
-                }
-            """)
+            btn.setStyleSheet(_BOTTOM_NAV_BTN_QSS)
 
             if tooltip == "Settings":
                 btn.clicked.connect(self.go_to_settings)
@@ -327,6 +517,12 @@ class MessagingPage(QWidget):
         # Get users with existing conversations
         conversations = self.main_window.app.get_user_conversations()
         conversation_user_ids = [conv['user_data']['user_id'] for conv in conversations]
+        following = self.main_window.app.get_following()
+
+        # Decode every avatar in the list up front, in parallel
+        self.preload_avatars(
+            [conv['user_data']['username'] for conv in conversations] + list(following)
+        )
 
         # Add users with messages
         for conv in conversations:
@@ -335,7 +531,6 @@ class MessagingPage(QWidget):
             self.conversations_layout.addWidget(conv_widget)
 
         # Also add following users (even without messages)
-        following = self.main_window.app.get_following()
         for username in following:
             user_data = self.main_window.app.search_user_by_username(username)
             if user_data:
@@ -347,16 +542,7 @@ class MessagingPage(QWidget):
         # Show message if no one to chat with
         if not conversations and not following:
             no_conv = QLabel("No friends to chat with. Follow users to start messaging!")
-            no_conv.setStyleSheet("""
-                color: rgba(255, 255, 255, 0.7); 
-                font-size: 13px; 
-                padding: 30px; 
-                font-style: italic;
-                text-align: center;
-                border: 2px dashed rgba(255, 255, 255, 0.2);
-                border-radius: 15px;
-                margin: 10px;
-            """)
+            no_conv.setStyleSheet(_NO_CONVERSATIONS_QSS)
             no_conv.setWordWrap(True)
             no_conv.setAlignment(Qt.AlignCenter)
             self.conversations_layout.addWidget(no_conv)
@@ -374,21 +560,20 @@ class MessagingPage(QWidget):
 
         # Profile picture
         profile_pic = QLabel()
-        img_path = self.get_user_image_path(user_data['username'])
-        profile_pic.setPixmap(self.load_circular_image(img_path, 50))
+        profile_pic.setPixmap(self.get_avatar(user_data['username'], 50))
         profile_pic.setFixedSize(50, 50)
-        profile_pic.setStyleSheet("background: transparent; border: none;")
+        profile_pic.setStyleSheet(_TRANSPARENT_QSS)
 
         # User info
         info_layout = QVBoxLayout()
         info_layout.setSpacing(4)
 
         name_label = QLabel(user_data['full_name'])
-        name_label.setStyleSheet("font-weight: 600; font-size: 14px; background: transparent; border: none;")
+        name_label.setStyleSheet(_CONV_NAME_QSS)
 
         # Username label
         username_label = QLabel(f"@{user_data['username']}")
-        username_label.setStyleSheet("font-size: 11px; background: transparent; border: none; opacity: 0.7;")
+        username_label.setStyleSheet(_CONV_USERNAME_QSS)
 
         status_text = "Click to chat"
         if last_date:
@@ -399,14 +584,7 @@ class MessagingPage(QWidget):
                 status_text = "Click to chat"
 
         last_msg = QLabel(status_text)
-        last_msg.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.6);
-                font-size: 11px;
-                background: transparent;
-                font-style: italic;
-            }
-        """)
+        last_msg.setStyleSheet(_LAST_MSG_QSS)
 
         info_layout.addWidget(name_label)
         info_layout.addWidget(username_label)
@@ -479,23 +657,7 @@ class MessagingPage(QWidget):
         back_btn = QPushButton("←")
         back_btn.setFixedSize(45, 45)
         back_btn.setCursor(Qt.PointingHandCursor)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(91, 141, 238, 0.1);
-                color: #5B8DEE;
-                font-size: 22px;
-                font-weight: bold;
-                border-radius: 22px;
-                border: 1px solid rgba(91, 141, 238, 0.2);
-            }
-            QPushButton:hover {
-                background: rgba(91, 141, 238, 0.2);
-                border: 1px solid rgba(91, 141, 238, 0.4);
-            }
-            QPushButton:pressed {
-                background: rgba(91, 141, 238, 0.3);
-            }
-        """)
+        back_btn.setStyleSheet(_CHAT_BACK_BTN_QSS)
         back_btn.clicked.connect(self.show_no_conversation_state)
 
         # Profile pic with gradient border
@@ -509,13 +671,7 @@ class MessagingPage(QWidget):
         profile_container.setLayout(QVBoxLayout())
         profile_container.layout().addWidget(profile_pic)
 
-        profile_container.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #5B8DEE, stop:1 #4A7DDD);
-                border-radius: 25px;
-            }
-        """)
+        profile_container.setStyleSheet(_CHAT_AVATAR_FRAME_QSS)
 
         # User info
         info_layout = QVBoxLayout()
@@ -523,33 +679,18 @@ class MessagingPage(QWidget):
 
         name_label = QLabel(user_data['full_name'])
         name_label.setObjectName("HeaderText")
-        name_label.setStyleSheet("""
-            font-size: 18px;
-            letter-spacing: 0.2px;
-            background: transparent;
-            border: none;
-        """)
+        name_label.setStyleSheet(_CHAT_NAME_QSS)
 
         # Status with online indicator
         status_layout = QHBoxLayout()
         status_layout.setSpacing(6)
 
         online_dot = QLabel("●")
-        online_dot.setStyleSheet("""
-            QLabel {
-                color: #4CAF50;
-                font-size: 10px;
-            }
-        """)
+        online_dot.setStyleSheet(_ONLINE_DOT_QSS)
 
         status_label = QLabel("Online")
         status_label.setObjectName("SubText")
-        status_label.setStyleSheet("""
-            font-size: 12px;
-            font-weight: 500;
-            background: transparent;
-            border: none;
-        """)
+        status_label.setStyleSheet(_CHAT_STATUS_QSS)
 
         status_layout.addWidget(online_dot)
         status_layout.addWidget(status_label)
@@ -572,19 +713,7 @@ class MessagingPage(QWidget):
             btn = QPushButton(icon)
             btn.setFixedSize(42, 42)
             btn.setCursor(Qt.PointingHandCursor)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: rgba({color.replace('#', '')}, 0.1);
-                    color: {color};
-                    font-size: 16px;
-                    border-radius: 21px;
-                    border: 1px solid rgba({color.replace('#', '')}, 0.2);
-                }}
-                QPushButton:hover {{
-                    background: rgba({color.replace('#', '')}, 0.2);
-                    border: 1px solid rgba({color.replace('#', '')}, 0.4);
-                }}
-            """)
+            btn.setStyleSheet(_CHAT_ACTION_BTN_QSS.format(color=color, rgb=color.replace('#', '')))
             action_layout.addWidget(btn)
 
         header.addWidget(back_btn)
@@ -630,25 +759,7 @@ class MessagingPage(QWidget):
         self.send_btn = QPushButton("➤")
         self.send_btn.setFixedSize(52, 52)
         self.send_btn.setCursor(Qt.PointingHandCursor)
-        self.send_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #5B8DEE, stop:1 #4A7DDD);
-                color: white;
-                font-size: 22px;
-                font-weight: bold;
-                border-radius: 26px;
-                border: none;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #4A7DDD, stop:1 #5B8DEE);
-                box-shadow: 0 3px 10px rgba(91, 141, 238, 0.3);
-            }
-            QPushButton:pressed {
-                padding-top: 2px;
-            }
-        """)
+        self.send_btn.setStyleSheet(_SEND_BTN_QSS)
         self.send_btn.clicked.connect(self.send_message)
 
         layout.addWidget(attach_btn)
@@ -687,34 +798,15 @@ class MessagingPage(QWidget):
         layout.setContentsMargins(0, 100, 0, 100)
 
         icon = QLabel("💬")
-        icon.setStyleSheet("""
-            QLabel {
-                font-size: 60px;
-                color: #CBD5E0;
-                opacity: 0.7;
-            }
-        """)
+        icon.setStyleSheet(_EMPTY_ICON_QSS)
         icon.setAlignment(Qt.AlignCenter)
 
         message = QLabel("Select a conversation to start messaging")
-        message.setStyleSheet("""
-            QLabel {
-                color: #718096;
-                font-size: 16px;
-                font-weight: 600;
-                text-align: center;
-            }
-        """)
+        message.setStyleSheet(_EMPTY_MESSAGE_QSS)
         message.setAlignment(Qt.AlignCenter)
 
         sub_message = QLabel("Choose from your conversations on the left")
-        sub_message.setStyleSheet("""
-            QLabel {
-                color: #A0AEC0;
-                font-size: 13px;
-                text-align: center;
-            }
-        """)
+        sub_message.setStyleSheet(_EMPTY_SUB_MESSAGE_QSS)
         sub_message.setAlignment(Qt.AlignCenter)
 
         layout.addWidget(icon)
@@ -751,14 +843,7 @@ class MessagingPage(QWidget):
         if not messages:
             # Show welcome message
             welcome_container = QWidget()
-            welcome_container.setStyleSheet("""
-                QWidget {
-                    background: rgba(91, 141, 238, 0.05);
-                    border-radius: 15px;
-                    border: 1px dashed rgba(91, 141, 238, 0.3);
-                    margin: 20px;
-                }
-            """)
+            welcome_container.setStyleSheet(_WELCOME_CONTAINER_QSS)
 
             welcome_layout = QVBoxLayout(welcome_container)
             welcome_layout.setSpacing(5)
@@ -766,24 +851,12 @@ class MessagingPage(QWidget):
 
             welcome_msg = QLabel(f"Start your conversation with {self.current_conversation_user['full_name']}!")
             welcome_msg.setAlignment(Qt.AlignCenter)
-            welcome_msg.setStyleSheet("""
-                QLabel {
-                    color: #5B8DEE;
-                    font-size: 15px;
-                    font-weight: 600;
-                }
-            """)
+            welcome_msg.setStyleSheet(_WELCOME_MSG_QSS)
             welcome_msg.setWordWrap(True)
 
             tip_msg = QLabel("Send a message to begin chatting!")
             tip_msg.setAlignment(Qt.AlignCenter)
-            tip_msg.setStyleSheet("""
-                QLabel {
-                    color: #718096;
-                    font-size: 12px;
-                    font-style: italic;
-                }
-            """)
+            tip_msg.setStyleSheet(_WELCOME_TIP_QSS)
 
             welcome_layout.addWidget(welcome_msg)
             welcome_layout.addWidget(tip_msg)
@@ -802,9 +875,7 @@ class MessagingPage(QWidget):
             self.messages_layout.addWidget(bubble)
 
         # Scroll to bottom
-        QTimer.singleShot(100, lambda: self.messages_scroll.verticalScrollBar().setValue(
-            self.messages_scroll.verticalScrollBar().maximum()
-        ))
+        self.schedule_scroll_to_bottom()
 
     def create_message_bubble(self, text, is_sent, date_str):
         """Create a message bubble widget"""
@@ -831,7 +902,7 @@ class MessagingPage(QWidget):
         # Message text
         msg_label = QLabel(text)
         msg_label.setWordWrap(True)
-        msg_label.setStyleSheet("background: transparent; border: none; font-size: 14px;")
+        msg_label.setStyleSheet(_BUBBLE_TEXT_QSS)
 
         # Format timestamp
         if isinstance(date_str, str) and date_str:
@@ -847,7 +918,7 @@ class MessagingPage(QWidget):
 
         # Timestamp
         time_label = QLabel(time_text)
-        time_label.setStyleSheet("background: transparent; border: none; font-size: 11px; opacity: 0.7;")
+        time_label.setStyleSheet(_BUBBLE_TIME_QSS)
         time_label.setAlignment(Qt.AlignRight if is_sent else Qt.AlignLeft)
 
         bubble_layout.addWidget(msg_label)
@@ -875,9 +946,11 @@ class MessagingPage(QWidget):
             return
 
         # Send message through backend
+        receiver_id = self.current_conversation_user['user_id']
         success, message = self.main_window.app.send_message(
-            self.current_conversation_user['user_id'],
-            text
+            receiver_id,
+            text,
+            on_failed=lambda reason: self.send_failed.emit(receiver_id, reason)
         )
 
         if success:
@@ -889,22 +962,45 @@ class MessagingPage(QWidget):
             self.message_input.clear()
 
             # Scroll to bottom
-            QTimer.singleShot(100, lambda: self.messages_scroll.verticalScrollBar().setValue(
-                self.messages_scroll.verticalScrollBar().maximum()
-            ))
+            self.schedule_scroll_to_bottom()
         else:
             QMessageBox.warning(self, "Error", f"Failed to send message: {message}")
 
+    def on_send_failed(self, receiver_id, reason):
+        """A message shown optimistically could not be saved"""
+        QMessageBox.warning(self, "Error", f"Failed to send message: {reason}")
+        # Reload so the unsaved bubble disappears
+        if self.current_conversation_user and self.current_conversation_user['user_id'] == receiver_id:
+            self.load_messages(receiver_id)
+
+    def schedule_scroll_to_bottom(self):
+        """Scroll the chat to the bottom once the current burst has laid out"""
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        QTimer.singleShot(100, self._do_scroll_to_bottom)
+
+    def _do_scroll_to_bottom(self):
+        self._scroll_pending = False
+        scroll_bar = self.messages_scroll.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
     def clear_layout(self, layout):
         """Helper to properly clear a layout including child layouts"""
         if layout is None: return
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-            elif item.layout():
-                self.clear_layout(item.layout())
-                item.layout().deleteLater()
+        # Walk nested layouts with an explicit stack rather than recursion
+        stack = deque([layout])
+        while stack:
+            current = stack.pop()
+            while (item := current.takeAt(0)) is not None:
+                widget = item.widget()
+                if widget:
+                    widget.deleteLater()
+                    continue
+                child = item.layout()
+                if child:
+                    stack.append(child)
+                    child.deleteLater()
 
     def go_to_home(self):
         self.main_window.go_to_home()
@@ -915,21 +1011,41 @@ class MessagingPage(QWidget):
     # ================= UTILITY FUNCTIONS =================
     def get_user_image_path(self, username):
         """Get the path to a user's profile image"""
-        IMAGE_DIR = paths.IMAGE_DIR
-
-        # Try multiple formats
-        for ext in ['.png', '.jpg', '.jpeg', '.PNG', '.JPG']:
-            img_path = os.path.join(IMAGE_DIR, f"{username}{ext}")
-            if os.path.exists(img_path):
-                return img_path
+        img_path = paths.find_user_image(username)
+        if img_path:
+            return img_path
 
         # Return default
-        return os.path.join(IMAGE_DIR, "profile.png")
+        return os.path.join(paths.IMAGE_DIR, "profile.png")
+
+    def _load_avatar_image(self, username):
+        """Resolve and decode a user's avatar; safe to run on a worker thread"""
+        return username, QImage(self.get_user_image_path(username))
+
+    def preload_avatars(self, usernames):
+        """Decode avatars for the given users concurrently into QImages"""
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            self._avatar_images = {}
+            return
+
+        with ThreadPoolExecutor(max_workers=_AVATAR_LOAD_WORKERS) as pool:
+            self._avatar_images = dict(pool.map(self._load_avatar_image, usernames))
+
+    def get_avatar(self, username, size):
+        """Circular avatar, using the preloaded image when there is one"""
+        image = self._avatar_images.get(username)
+        if image is None:
+            return self.load_circular_image(self.get_user_image_path(username), size)
+        # QPixmap must be created on the GUI thread, so convert here
+        return self.make_circular(QPixmap.fromImage(image), size)
 
     def load_circular_image(self, path: str, size: int) -> QPixmap:
         """Load an image and make it circular"""
-        pixmap = QPixmap(path)
+        return self.make_circular(QPixmap(path), size)
 
+    def make_circular(self, pixmap: QPixmap, size: int) -> QPixmap:
+        """Crop a pixmap into a circle of the given size"""
         if pixmap.isNull():
             # Create gradient placeholder
             placeholder = QPixmap(size, size)
@@ -951,7 +1067,15 @@ class MessagingPage(QWidget):
             return placeholder
 
         # Resize and crop to square
-        pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        # Pre-sized images skip the scale; exact integer downscales don't need
+        # bilinear filtering
+        width, height = pixmap.width(), pixmap.height()
+        if width != size or height != size:
+            if width % size == 0 and height % size == 0:
+                mode = Qt.FastTransformation
+            else:
+                mode = Qt.SmoothTransformation
+            pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatioByExpanding, mode)
 
         if pixmap.width() != size or pixmap.height() != size:
             x = (pixmap.width() - size) // 2
@@ -963,7 +1087,7 @@ class MessagingPage(QWidget):
         circular.fill(Qt.transparent)
 
         painter = QPainter(circular)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHints(QPainter.SmoothPixmapTransform | QPainter.Antialiasing, True)
 
         path_obj = QPainterPath()
         path_obj.addEllipse(QRectF(0, 0, size, size))
@@ -971,9 +1095,7 @@ class MessagingPage(QWidget):
         painter.setClipPath(path_obj)
         painter.drawPixmap(0, 0, pixmap)
 
-        # Add white border
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(Qt.NoBrush)
+        # Add white border (outline only; the painter's default brush is NoBrush)
         painter.setPen(QColor("white"))
         painter.drawEllipse(0, 0, size - 1, size - 1)
 
@@ -5,7 +5,158 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QPixmap, QIcon, QFont,QPainter, QPainterPath,QColor
 from PySide6.QtCore import Qt,QRectF
+import logging
 import os
+import re
+from app.utils.paths import IMAGE_DIR, find_user_image
+
+logger = logging.getLogger(__name__)
+
+# Splits "a, b ,c" into ["a", "b", "c"]; surrounding whitespace goes with the comma
+_INTEREST_SPLIT = re.compile(r'\s*,\s*')
+
+# Stylesheets are shared module constants so every rebuild hands Qt the same
+# string instead of re-creating a literal per widget.
+_BACK_BTN_QSS = """
+    QPushButton { 
+        border: none; 
+        font-weight: bold; 
+        color: white; 
+    }
+    QPushButton:hover { 
+        color: #6C5CE7; 
+    }
+"""
+
+_TITLE_QSS = "font-size: 20px; font-weight: bold; color: white;"
+
+_CARD_QSS = """
+    QFrame {
+        background: white; 
+        border-radius: 15px; 
+        border: 1px solid #ddd;
+    }
+"""
+
+_SECTION_TITLE_QSS = """
+    font-weight: bold; 
+    font-size: 18px; 
+    margin-top: 10px; 
+    color: #2c3e50;
+"""
+
+_PROFILE_PIC_QSS = """
+    font-size: 60px; 
+    background-color: #6C5CE7; 
+    color: white; 
+    border-radius: 50px; 
+    min-width: 100px; 
+    min-height: 100px; 
+    max-width: 100px; 
+    max-height: 100px;
+"""
+
+_NAME_QSS = """
+    font-size: 26px; 
+    font-weight: bold; 
+    color: #2c3e50;
+"""
+
+_USERNAME_QSS = """
+    color: #7f8c8d; 
+    font-size: 16px;
+"""
+
+_DETAIL_QSS = "color: #95a5a6; font-size: 14px;"
+
+_INTERESTS_QSS = """
+    color: #6C5CE7; 
+    font-size: 14px; 
+    margin-top: 10px;
+"""
+
+_STAT_VAL_QSS = "font-size: 24px; font-weight: bold; color: #2c3e50;"
+
+_STAT_LABEL_QSS = "color: #7f8c8d; font-size: 13px;"
+
+_EDIT_BTN_QSS = """
+    QPushButton {
+        background-color: #6C5CE7; 
+        color: white; 
+        font-weight: bold; 
+        border-radius: 20px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #5A4FD8;
+    }
+"""
+
+_STATS_TITLE_QSS = """
+    font-size: 18px; 
+    font-weight: bold; 
+    color: #2c3e50; 
+    margin-bottom: 15px;
+"""
+
+_ACTIVITY_VAL_QSS = "font-size: 28px; font-weight: bold; color: %s;"
+
+_NO_POSTS_QSS = """
+    color: #95a5a6; 
+    font-size: 16px; 
+    padding: 40px;
+"""
+
+# Post widgets are built this many at a time; the rest are created as the user
+# scrolls towards the end of the feed.
+_POST_BATCH_SIZE = 10
+_LOAD_MORE_MARGIN = 200
+
+# One sheet on the post frame covers all of its children; they are matched by
+# objectName instead of each carrying its own stylesheet.
+_POST_QSS = """
+    QFrame {
+        background: white; 
+        border-radius: 12px; 
+        border: 1px solid #ddd;
+    }
+    QLabel#postDate {
+        color: #95a5a6;
+        font-size: 12px;
+    }
+    QLabel#postContent {
+        font-size: 15px; 
+        line-height: 1.6; 
+        color: #2c3e50;
+        padding: 10px 0;
+    }
+    QLabel#postCategories {
+        color: #6C5CE7;
+        font-size: 13px;
+    }
+    QPushButton#deleteBtn {
+        background-color: #e74c3c;
+        color: white;
+        border-radius: 5px;
+        font-size: 12px;
+    }
+    QPushButton#deleteBtn:hover {
+        background-color: #c0392b;
+    }
+    QPushButton#actionBtn {
+        border: 1px solid #ddd;
+        border-radius: 5px;
+        padding: 5px 15px;
+        background: white;
+        color: #7f8c8d;
+        font-size: 13px;
+    }
+    QPushButton#actionBtn:hover {
+        background-color: #f0f0f0;
+        border-color: #6C5CE7;
+        color: #6C5CE7;
+    }
+"""
 
 class EditProfileDialog(QDialog):
     """Dialog for editing user profile information"""
@@ -67,7 +218,7 @@ class EditProfileDialog(QDialog):
     def get_updated_data(self):
         """Return the updated user data"""
         interests_text = self.interests_input.toPlainText().strip()
-        interests = [i.strip() for i in interests_text.split(',') if i.strip()]
+        interests = [i for i in _INTEREST_SPLIT.split(interests_text) if i]
 
         return {
             'full_name': self.full_name_input.text().strip(),
@@ -90,11 +241,14 @@ class MyProfilePage(QWidget):
         self.email_lbl = None
         self.address_lbl = None
         self.interests_lbl = None
+        self.profile_pic_label = None
         self.posts_val_lbl = None
         self.followers_val_lbl = None
         self.following_val_lbl = None
         self.total_likes_lbl = None
         self.feed_layout = None
+        self.scroll = None
+        self._pending_posts = []
 
         self.build_ui()
 
@@ -110,23 +264,14 @@ class MyProfilePage(QWidget):
         top_bar = QHBoxLayout()
         back_btn = QPushButton("← Back")
         back_btn.setFixedSize(80, 30)
-        back_btn.setStyleSheet("""
-            QPushButton { 
-                border: none; 
-                font-weight: bold; 
-                color: white; 
-            }
-            QPushButton:hover { 
-                color: #6C5CE7; 
-            }
-        """)
+        back_btn.setStyleSheet(_BACK_BTN_QSS)
         back_btn.clicked.connect(self.go_back)
         top_bar.addWidget(back_btn)
         top_bar.addStretch()
 
         # Title
         title = QLabel("My Profile")
-        title.setStyleSheet("font-size: 20px; font-weight: bold; color: white;")
+        title.setStyleSheet(_TITLE_QSS)
         top_bar.addWidget(title)
         top_bar.addStretch()
 
@@ -134,6 +279,7 @@ class MyProfilePage(QWidget):
 
         # Scrollable Content
         scroll = QScrollArea()
+        self.scroll = scroll
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QScrollArea.NoFrame)
 
@@ -144,13 +290,7 @@ class MyProfilePage(QWidget):
 
         # Profile Header Card
         self.header_frame = QFrame()
-        self.header_frame.setStyleSheet("""
-            QFrame {
-                background: white; 
-                border-radius: 15px; 
-                border: 1px solid #ddd;
-            }
-        """)
+        self.header_frame.setStyleSheet(_CARD_QSS)
         self.header_layout = QVBoxLayout(self.header_frame)
         self.header_layout.setContentsMargins(30, 30, 30, 30)
         self.header_layout.setSpacing(15)
@@ -158,25 +298,14 @@ class MyProfilePage(QWidget):
 
         # Statistics Card
         self.stats_frame = QFrame()
-        self.stats_frame.setStyleSheet("""
-            QFrame {
-                background: white; 
-                border-radius: 15px; 
-                border: 1px solid #ddd;
-            }
-        """)
+        self.stats_frame.setStyleSheet(_CARD_QSS)
         self.stats_layout = QVBoxLayout(self.stats_frame)
         self.stats_layout.setContentsMargins(30, 20, 30, 20)
         self.content_layout.addWidget(self.stats_frame)
 
         # Posts Section
         posts_title = QLabel("My Posts")
-        posts_title.setStyleSheet("""
-            font-weight: bold; 
-            font-size: 18px; 
-            margin-top: 10px; 
-            color: #2c3e50;
-        """)
+        posts_title.setStyleSheet(_SECTION_TITLE_QSS)
         self.content_layout.addWidget(posts_title)
 
         # Feed Layout
@@ -187,6 +316,10 @@ class MyProfilePage(QWidget):
         self.content_layout.addStretch()
 
         scroll.setWidget(container)
+        # Only newly exposed strips of the viewport are repainted on resize;
+        # scrolling blits what is already on screen.
+        scroll.viewport().setAttribute(Qt.WA_StaticContents, True)
+        scroll.verticalScrollBar().valueChanged.connect(self._on_scroll)
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
 
@@ -202,35 +335,33 @@ class MyProfilePage(QWidget):
         # Get fresh statistics
         stats = self.main_window.app.get_user_statistics()
 
-        # Clear existing content
-        self.clear_layout(self.header_layout)
-        self.clear_layout(self.stats_layout)
-        self.clear_layout(self.feed_layout)
+        # Rebuild with updates off so the page relayouts once, not per widget
+        container = self.content_layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            # Clear existing content
+            self.clear_layout(self.header_layout)
+            self.clear_layout(self.stats_layout)
+            self.clear_layout(self.feed_layout)
 
-        # Build Profile Header
-        self.build_profile_header(current_user, stats)
+            # Build Profile Header
+            self.build_profile_header(current_user, stats)
 
-        # Build Statistics Section
-        self.build_statistics_section(stats)
+            # Build Statistics Section
+            self.build_statistics_section(stats)
 
-        # Load Posts
-        self.load_posts(current_user.get_id())
+            # Load Posts
+            self.load_posts(current_user.get_id())
+        finally:
+            container.setUpdatesEnabled(True)
+            container.update()
 
     def build_profile_header(self, user, stats):
         """Build the profile header section"""
         # Profile Picture Placeholder
         self.profile_pic_label = QLabel("👤")
         self.profile_pic_label.setAlignment(Qt.AlignCenter)
-        self.profile_pic_label.setStyleSheet("""
-            font-size: 60px; 
-            background-color: #6C5CE7; 
-            color: white; 
-            border-radius: 50px; 
-            min-width: 100px; 
-            min-height: 100px; 
-            max-width: 100px; 
-            max-height: 100px;
-        """)
+        self.profile_pic_label.setStyleSheet(_PROFILE_PIC_QSS)
 
         pic_layout = QHBoxLayout()
         pic_layout.addStretch()
@@ -242,33 +373,26 @@ class MyProfilePage(QWidget):
         # Name
         self.name_lbl = QLabel(user.get_fullname())
         self.name_lbl.setAlignment(Qt.AlignCenter)
-        self.name_lbl.setStyleSheet("""
-            font-size: 26px; 
-            font-weight: bold; 
-            color: #2c3e50;
-        """)
+        self.name_lbl.setStyleSheet(_NAME_QSS)
         self.header_layout.addWidget(self.name_lbl)
 
         # Username
         self.username_lbl = QLabel(f"@{user.get_username()}")
         self.username_lbl.setAlignment(Qt.AlignCenter)
-        self.username_lbl.setStyleSheet("""
-            color: #7f8c8d; 
-            font-size: 16px;
-        """)
+        self.username_lbl.setStyleSheet(_USERNAME_QSS)
         self.header_layout.addWidget(self.username_lbl)
 
         # Email
         self.email_lbl = QLabel(f"📧 {user.get_email()}")
         self.email_lbl.setAlignment(Qt.AlignCenter)
-        self.email_lbl.setStyleSheet("color: #95a5a6; font-size: 14px;")
+        self.email_lbl.setStyleSheet(_DETAIL_QSS)
         self.header_layout.addWidget(self.email_lbl)
 
         # Address (if available)
         if user.get_address():
             self.address_lbl = QLabel(f"📍 {user.get_address()}")
             self.address_lbl.setAlignment(Qt.AlignCenter)
-            self.address_lbl.setStyleSheet("color: #95a5a6; font-size: 14px;")
+            self.address_lbl.setStyleSheet(_DETAIL_QSS)
             self.header_layout.addWidget(self.address_lbl)
 
         # Interests
@@ -277,11 +401,7 @@ class MyProfilePage(QWidget):
             self.interests_lbl = QLabel(f"💡 {interests_text}")
             self.interests_lbl.setAlignment(Qt.AlignCenter)
             self.interests_lbl.setWordWrap(True)
-            self.interests_lbl.setStyleSheet("""
-                color: #6C5CE7; 
-                font-size: 14px; 
-                margin-top: 10px;
-            """)
+            self.interests_lbl.setStyleSheet(_INTERESTS_QSS)
             self.header_layout.addWidget(self.interests_lbl)
 
         # Stats Row
@@ -290,7 +410,7 @@ class MyProfilePage(QWidget):
 
         # Posts
         self.posts_val_lbl = QLabel(str(stats.get('total_posts', 0)))
-        self.posts_val_lbl.setStyleSheet("font-size: 24px; font-weight: bold; color: #2c3e50;")
+        self.posts_val_lbl.setStyleSheet(_STAT_VAL_QSS)
         self.posts_val_lbl.setAlignment(Qt.AlignCenter)
         stats_box.addLayout(self.make_stat_box(self.posts_val_lbl, "Posts"))
 
@@ -298,7 +418,7 @@ class MyProfilePage(QWidget):
 
         # Followers
         self.followers_val_lbl = QLabel(str(stats.get('followers', 0)))
-        self.followers_val_lbl.setStyleSheet("font-size: 24px; font-weight: bold; color: #2c3e50;")
+        self.followers_val_lbl.setStyleSheet(_STAT_VAL_QSS)
         self.followers_val_lbl.setAlignment(Qt.AlignCenter)
         stats_box.addLayout(self.make_stat_box(self.followers_val_lbl, "Followers"))
 
@@ -306,7 +426,7 @@ class MyProfilePage(QWidget):
 
         # Following
         self.following_val_lbl = QLabel(str(stats.get('following', 0)))
-        self.following_val_lbl.setStyleSheet("font-size: 24px; font-weight: bold; color: #2c3e50;")
+        self.following_val_lbl.setStyleSheet(_STAT_VAL_QSS)
         self.following_val_lbl.setAlignment(Qt.AlignCenter)
         stats_box.addLayout(self.make_stat_box(self.following_val_lbl, "Following"))
 
@@ -316,18 +436,7 @@ class MyProfilePage(QWidget):
         # Edit Profile Button
         edit_btn = QPushButton("✏️ Edit Profile")
         edit_btn.setFixedSize(160, 40)
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6C5CE7; 
-                color: white; 
-                font-weight: bold; 
-                border-radius: 20px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #5A4FD8;
-            }
-        """)
+        edit_btn.setStyleSheet(_EDIT_BTN_QSS)
         edit_btn.clicked.connect(self.edit_profile)
 
         btn_layout = QHBoxLayout()
@@ -338,60 +447,41 @@ class MyProfilePage(QWidget):
 
     def update_profile_pic(self):
         """Update the profile picture with user's image"""
-        # Check if profile_pic_label exists
-        if not hasattr(self, 'profile_pic_label') or not self.profile_pic_label:
-            print("❌ profile_pic_label not initialized")
+        if self.profile_pic_label is None:
             return
 
         # Get current user
         current_user = self.main_window.app.get_current_user()
         if not current_user:
-            print("❌ No current user logged in")
+            logger.debug("No current user logged in")
             return
 
         username = current_user.get_username()
 
-        # Build path to user's profile image
-        BASE_DIR = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "..")
-        )
-        IMAGE_DIR = os.path.join(BASE_DIR, "resources", "images")
-
-        # Try multiple image formats
-        possible_extensions = ['.png', '.jpg', '.jpeg', '.PNG', '.JPG', '.JPEG']
-        img_path = None
-
-        for ext in possible_extensions:
-            test_path = os.path.join(IMAGE_DIR, f"{username}{ext}")
-            if os.path.exists(test_path):
-                img_path = test_path
-                print(f"✅ Found profile image: {img_path}")
-                break
+        img_path = find_user_image(username)
+        if img_path:
+            logger.debug("Found profile image: %s", img_path)
 
         # If no user-specific image found, use default
         if not img_path:
-            print(f"⚠️ No profile image found for {username}, using default")
+            logger.debug("No profile image found for %s, using default", username)
             default_path = os.path.join(IMAGE_DIR, "profile.png")
-            if os.path.exists(default_path):
-                img_path = default_path
-            else:
-                # Create a placeholder
-                placeholder = QPixmap(80, 80)
-                placeholder.fill(QColor("#6C5CE7"))
-                self.profile_pic_label.setPixmap(placeholder)
+            if not os.path.exists(default_path):
+                # Keep the emoji placeholder from build_profile_header
                 return
+            img_path = default_path
 
         # Load and set the circular image
         circular_pixmap = self.load_circular_image(img_path, 80)
         self.profile_pic_label.setPixmap(circular_pixmap)
-        print(f"✅ Profile picture updated for {username}")
+        logger.debug("Profile picture updated for %s", username)
 
     def load_circular_image(self, path: str, size: int) -> QPixmap:
         """Load an image, crop it into a circle, and resize."""
         pixmap = QPixmap(path)
 
         if pixmap.isNull():
-            print(f"❌ Image not found: {path}")
+            logger.debug("Image not found: %s", path)
             # Create a gray circular placeholder
             placeholder = QPixmap(size, size)
             placeholder.fill(Qt.transparent)
@@ -406,7 +496,15 @@ class MyProfilePage(QWidget):
             return placeholder
 
         # Resize to square maintaining aspect ratio
-        pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        # Pre-sized images skip the scale; exact integer downscales don't need
+        # bilinear filtering
+        width, height = pixmap.width(), pixmap.height()
+        if width != size or height != size:
+            if width % size == 0 and height % size == 0:
+                mode = Qt.FastTransformation
+            else:
+                mode = Qt.SmoothTransformation
+            pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatioByExpanding, mode)
 
         # Crop to exact square if needed
         if pixmap.width() != size or pixmap.height() != size:
@@ -419,7 +517,7 @@ class MyProfilePage(QWidget):
         circular.fill(Qt.transparent)
 
         painter = QPainter(circular)
-        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHints(QPainter.SmoothPixmapTransform | QPainter.Antialiasing, True)
 
         # Create circular clipping path
         clip_path = QPainterPath()
@@ -434,12 +532,7 @@ class MyProfilePage(QWidget):
     def build_statistics_section(self, stats):
         """Build the detailed statistics section"""
         title = QLabel("📊 Activity Statistics")
-        title.setStyleSheet("""
-            font-size: 18px; 
-            font-weight: bold; 
-            color: #2c3e50; 
-            margin-bottom: 15px;
-        """)
+        title.setStyleSheet(_STATS_TITLE_QSS)
         self.stats_layout.addWidget(title)
 
         # Stats Grid
@@ -449,10 +542,10 @@ class MyProfilePage(QWidget):
         # Total Likes
         likes_box = QVBoxLayout()
         likes_val = QLabel(str(stats.get('total_likes', 0)))
-        likes_val.setStyleSheet("font-size: 28px; font-weight: bold; color: #e74c3c;")
+        likes_val.setStyleSheet(_ACTIVITY_VAL_QSS % "#e74c3c")
         likes_val.setAlignment(Qt.AlignCenter)
         likes_label = QLabel("❤️ Total Likes")
-        likes_label.setStyleSheet("color: #7f8c8d; font-size: 13px;")
+        likes_label.setStyleSheet(_STAT_LABEL_QSS)
         likes_label.setAlignment(Qt.AlignCenter)
         likes_box.addWidget(likes_val)
         likes_box.addWidget(likes_label)
@@ -461,10 +554,10 @@ class MyProfilePage(QWidget):
         # Total Dislikes
         dislikes_box = QVBoxLayout()
         dislikes_val = QLabel(str(stats.get('total_dislikes', 0)))
-        dislikes_val.setStyleSheet("font-size: 28px; font-weight: bold; color: #95a5a6;")
+        dislikes_val.setStyleSheet(_ACTIVITY_VAL_QSS % "#95a5a6")
         dislikes_val.setAlignment(Qt.AlignCenter)
         dislikes_label = QLabel("👎 Total Dislikes")
-        dislikes_label.setStyleSheet("color: #7f8c8d; font-size: 13px;")
+        dislikes_label.setStyleSheet(_STAT_LABEL_QSS)
         dislikes_label.setAlignment(Qt.AlignCenter)
         dislikes_box.addWidget(dislikes_val)
         dislikes_box.addWidget(dislikes_label)
@@ -473,10 +566,10 @@ class MyProfilePage(QWidget):
         # Total Comments
         comments_box = QVBoxLayout()
         comments_val = QLabel(str(stats.get('total_comments', 0)))
-        comments_val.setStyleSheet("font-size: 28px; font-weight: bold; color: #3498db;")
+        comments_val.setStyleSheet(_ACTIVITY_VAL_QSS % "#3498db")
         comments_val.setAlignment(Qt.AlignCenter)
         comments_label = QLabel("💬 Total Comments")
-        comments_label.setStyleSheet("color: #7f8c8d; font-size: 13px;")
+        comments_label.setStyleSheet(_STAT_LABEL_QSS)
         comments_label.setAlignment(Qt.AlignCenter)
         comments_box.addWidget(comments_val)
         comments_box.addWidget(comments_label)
@@ -489,7 +582,7 @@ class MyProfilePage(QWidget):
         box = QVBoxLayout()
         box.addWidget(val_lbl)
         label = QLabel(title)
-        label.setStyleSheet("color: #7f8c8d; font-size: 13px;")
+        label.setStyleSheet(_STAT_LABEL_QSS)
         label.setAlignment(Qt.AlignCenter)
         box.addWidget(label)
         return box
@@ -506,36 +599,52 @@ class MyProfilePage(QWidget):
     def load_posts(self, user_id):
         """Load and display user's posts"""
         posts = self.main_window.app.get_user_posts(user_id)
+        self._pending_posts = []
 
         if not posts:
             no_posts = QLabel("📝 No posts yet. Share your first post!")
             no_posts.setAlignment(Qt.AlignCenter)
-            no_posts.setStyleSheet("""
-                color: #95a5a6; 
-                font-size: 16px; 
-                padding: 40px;
-            """)
+            no_posts.setStyleSheet(_NO_POSTS_QSS)
             self.feed_layout.addWidget(no_posts)
             return
 
-        # Add each post
+        current_user = self.main_window.app.get_current_user()
+        fullname = current_user.get_fullname()
+        username = current_user.get_username()
         for post in posts:
-            current_user = self.main_window.app.get_current_user()
-            post['author_name'] = current_user.get_fullname()
-            post['author_username'] = current_user.get_username()
+            post['author_name'] = fullname
+            post['author_username'] = username
+
+        # Only the first batch gets widgets now; _on_scroll builds the rest
+        self._pending_posts = list(posts)
+        self._append_posts()
+
+    def _append_posts(self):
+        """Build widgets for the next batch of pending posts"""
+        batch = self._pending_posts[:_POST_BATCH_SIZE]
+        del self._pending_posts[:_POST_BATCH_SIZE]
+
+        for post in batch:
             widget = self.create_post_widget(post)
             self.feed_layout.addWidget(widget)
 
+    def _on_scroll(self, value):
+        """Load the next batch of posts when scrolled near the bottom"""
+        if not self._pending_posts:
+            return
+        if value >= self.scroll.verticalScrollBar().maximum() - _LOAD_MORE_MARGIN:
+            container = self.content_layout.parentWidget()
+            container.setUpdatesEnabled(False)
+            try:
+                self._append_posts()
+            finally:
+                container.setUpdatesEnabled(True)
+                container.update()
+
     def create_post_widget(self, post_data):
         """Create a post widget"""
         frame = QFrame()
-        frame.setStyleSheet("""
-            QFrame {
-                background: white; 
-                border-radius: 12px; 
-                border: 1px solid #ddd;
-            }
-        """)
+        frame.setStyleSheet(_POST_QSS)
 
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
@@ -544,27 +653,16 @@ class MyProfilePage(QWidget):
         # Header with date
         header = QHBoxLayout()
         date_label = QLabel(f"📅 {post_data.get('date', 'Unknown date')}")
-        date_label.setStyleSheet("color: #95a5a6; font-size: 12px;")
+        date_label.setObjectName("postDate")
         header.addWidget(date_label)
         header.addStretch()
 
         # Delete button
         delete_btn = QPushButton("🗑️ Delete")
         delete_btn.setFixedSize(80, 25)
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border-radius: 5px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
-        delete_btn.clicked.connect(
-            lambda: self.handle_delete_post(post_data['post_id'])
-        )
+        delete_btn.setObjectName("deleteBtn")
+        delete_btn.setProperty("post_id", post_data['post_id'])
+        delete_btn.clicked.connect(self._on_delete_clicked)
         header.addWidget(delete_btn)
 
         layout.addLayout(header)
@@ -572,12 +670,7 @@ class MyProfilePage(QWidget):
         # Content
         content_label = QLabel(post_data.get('content', ''))
         content_label.setWordWrap(True)
-        content_label.setStyleSheet("""
-            font-size: 15px; 
-            line-height: 1.6; 
-            color: #2c3e50;
-            padding: 10px 0;
-        """)
+        content_label.setObjectName("postContent")
         layout.addWidget(content_label)
 
         # Categories (if any)
@@ -586,7 +679,7 @@ class MyProfilePage(QWidget):
             if isinstance(categories, list) and categories:
                 cat_text = " ".join([f"#{cat}" for cat in categories])
                 cat_label = QLabel(cat_text)
-                cat_label.setStyleSheet("color: #6C5CE7; font-size: 13px;")
+                cat_label.setObjectName("postCategories")
                 layout.addWidget(cat_label)
 
         # Actions
@@ -596,24 +689,8 @@ class MyProfilePage(QWidget):
         dislike_btn = QPushButton(f"👎 {post_data.get('dislike_count', 0)}")
         comment_btn = QPushButton(f"💬 {post_data.get('comment_count', 0)}")
 
-        action_style = """
-            QPushButton {
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                padding: 5px 15px;
-                background: white;
-                color: #7f8c8d;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-                border-color: #6C5CE7;
-                color: #6C5CE7;
-            }
-        """
-
         for btn in [like_btn, dislike_btn, comment_btn]:
-            btn.setStyleSheet(action_style)
+            btn.setObjectName("actionBtn")
             actions_layout.addWidget(btn)
 
         actions_layout.addStretch()
@@ -622,6 +699,10 @@ class MyProfilePage(QWidget):
         frame.setLayout(layout)
         return frame
 
+    def _on_delete_clicked(self):
+        """Shared slot for every post's delete button"""
+        self.handle_delete_post(self.sender().property("post_id"))
+
     def handle_delete_post(self, post_id):
         """Handle post deletion"""
         reply = QMessageBox.question(
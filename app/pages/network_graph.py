@@ -1,109 +1,648 @@
 from PySide6.QtWidgets import (
     QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem,
-    QGraphicsItem, QPushButton, QGraphicsTextItem, QGraphicsDropShadowEffect,
+    QGraphicsItem, QPushButton, QGraphicsTextItem,
     QGraphicsPolygonItem, QGraphicsRectItem, QFrame, QVBoxLayout, QLabel, QWidget,
-    QGraphicsOpacityEffect
+    QGraphicsOpacityEffect, QApplication
 )
-from PySide6.QtGui import QBrush, QPen, QColor, QPainter, QRadialGradient, QFont, QPolygonF
-from PySide6.QtCore import Qt, QTimer, QPointF, QPropertyAnimation, QEasingCurve, QRectF, QUrl
+from PySide6.QtGui import (QBrush, QPen, QColor, QPainter, QRadialGradient, QFont, QPolygonF, QOpenGLContext,
+                           QPixmap)
+from PySide6.QtCore import (Qt, QTimer, QPointF, QPropertyAnimation, QVariantAnimation, QEasingCurve, QRectF, QUrl,
+                            QObject, QThread, Signal, Slot)
 import math
 import random
-from app.utils.audio import AudioManager
+from functools import lru_cache
+import numpy as np
+from app.utils.audio import get_audio_manager
+
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Qt built without OpenGL: keep the raster viewport
+    QOpenGLWidget = None
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Physics falls back to plain NumPy
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@lru_cache(maxsize=None)
+def ease_out_cubic_table(steps):
+    """Ease-out-cubic progress after 0..steps animation steps"""
+    return tuple(1 - (1 - i / steps) ** 3 for i in range(steps + 1))
+
+
+@lru_cache(maxsize=None)
+def opengl_available():
+    """True when Qt has OpenGL widgets and can actually create a GL context"""
+    return QOpenGLWidget is not None and QOpenGLContext().create()
+
+
+# ---------- PHYSICS ----------
+# numba reads these module globals as compile-time constants, so the compiled
+# kernels are already specialized with them inlined. Its on-disk cache is keyed
+# on this file, so edits here take effect on the next start.
+DAMPING = 0.85
+SPRING_STRENGTH = 0.01  # Increased slightly for snappier edges
+IDEAL_DISTANCE = 150
+REPULSION_STRENGTH = 10000
+REPULSION_CUTOFF = 4 * IDEAL_DISTANCE  # Pairs further apart than this don't repel
+REPULSION_CUTOFF_SQ = REPULSION_CUTOFF * REPULSION_CUTOFF
+MIN_DISTANCE = 0.1
+MIN_DISTANCE_SQ = MIN_DISTANCE * MIN_DISTANCE
+COLLISION_PADDING = 10
+COLLISION_STIFFNESS = 0.5
+BASE_GRAVITY = 0.002  # Keeps nodes from flying off into space
+CENTRALITY_GRAVITY = 0.005  # Influencers get pulled harder towards the center
+JITTER_THRESHOLD = 0.05
+REST_ENERGY = 1e-3  # Kinetic energy per moving node below which the layout counts as settled
+REST_FRAMES = 30  # Settled frames in a row before the physics timer stops
+
+# Barnes-Hut: cells that look smaller than THETA (size / distance) act as one body
+BARNES_HUT_THETA = 0.8
+BARNES_HUT_MIN_NODES = 100  # Below this the all-pairs version is faster
+QUADTREE_MAX_DEPTH = 24  # Deeper cells keep a list of (near-)coincident nodes
+PAIRWISE_BLOCK = 128  # Rows per chunk in the NumPy pairwise pass
+
+EDGE_CULL_MARGIN = 20  # Scene px around the viewport where edges still get redrawn
+NODE_CULL_MARGIN = 60  # Extra room for node radius (hover-scaled) and shadow
+SNAPSHOT_MAX_SIZE = 4096  # Largest side (device px) of the picture used to pan a settled graph
+
+
+def compute_forces(pos, radius, gravity, edge_src, edge_dst, movable):
+    """Net force on every node, as an (N, 2) array.
+
+    pos is (N, 2); radius and gravity are per-node (N,) arrays; edge_src and
+    edge_dst are the endpoint indices of every edge. Forces on nodes that
+    aren't movable may be left at zero.
+    """
+    # 1. Repulsion + 3. Collision
+    if HAVE_NUMBA and len(pos) >= BARNES_HUT_MIN_NODES:
+        force = barnes_hut_forces(pos, radius, movable, BARNES_HUT_THETA)
+    else:
+        force = pairwise_forces(pos, radius)
+
+    # 2. Springs (connections pull both endpoints together)
+    if len(edge_src):
+        spring = pos[edge_dst] - pos[edge_src]
+        length = np.maximum(np.sqrt((spring * spring).sum(axis=1)), MIN_DISTANCE)
+        spring *= ((length - IDEAL_DISTANCE) * SPRING_STRENGTH / length)[:, None]
+        np.add.at(force, edge_src, spring)
+        np.subtract.at(force, edge_dst, spring)
+
+    # 4. Variable central gravity
+    force -= pos * gravity[:, None]
+    return force
+
+
+def pairwise_forces(pos, radius):
+    """Exact repulsion and collision forces, only testing nearby pairs.
+
+    Nodes are bucketed into a grid whose cells are at least the interaction
+    range wide, so every pair that can interact lies in neighbouring cells.
+    """
+    if len(pos) <= PAIRWISE_BLOCK:
+        # Small graphs: one block, bucketing would cost more than it saves
+        every = np.arange(len(pos))
+        return block_forces(pos, radius, every, every)
+
+    cell_size = max(REPULSION_CUTOFF, 2 * radius.max() + COLLISION_PADDING)
+    cells = np.floor(pos / cell_size).astype(np.int64)
+    keys, inverse = np.unique(cells, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    order = np.argsort(inverse, kind='stable')
+    bounds = np.searchsorted(inverse[order], np.arange(len(keys) + 1))
+    grid = {(cx, cy): order[bounds[c]:bounds[c + 1]] for c, (cx, cy) in enumerate(keys.tolist())}
+
+    force = np.zeros_like(pos)
+    for (cx, cy), members in grid.items():
+        near = np.concatenate([grid[cell] for cell in ((cx + dx, cy + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1))
+                               if cell in grid])
+        # A block of rows at a time, so the (rows, near) temporaries stay cache-sized
+        for start in range(0, len(members), PAIRWISE_BLOCK):
+            rows = members[start:start + PAIRWISE_BLOCK]
+            force[rows] = block_forces(pos, radius, rows, near)
+    return force
+
+
+def block_forces(pos, radius, rows, cols):
+    """Repulsion and collision on the nodes in rows from the nodes in cols"""
+    # Repulsion and collision share the pairwise deltas (node - other); work on
+    # x and y planes in place so each (rows, cols) array is swept as few times as possible
+    dx = pos[rows, 0, None] - pos[None, cols, 0]
+    dy = pos[rows, 1, None] - pos[None, cols, 1]
+    d2 = dx * dx
+    d2 += dy * dy
+    safe = np.maximum(d2, MIN_DISTANCE_SQ)
+    np.sqrt(safe, out=safe)
+    inv = np.reciprocal(safe)
+
+    magnitude = inv * inv
+    magnitude *= REPULSION_STRENGTH
+    magnitude[d2 > REPULSION_CUTOFF_SQ] = 0.0
+
+    combined = radius[rows, None] + radius[None, cols]
+    combined += COLLISION_PADDING
+    collides = d2 < combined * combined
+    magnitude[collides] += (combined[collides] - safe[collides]) * COLLISION_STIFFNESS
+    magnitude *= inv
+
+    # A node against itself has dx = dy = 0 and adds nothing
+    force = np.empty((len(rows), 2))
+    force[:, 0] = np.einsum('ij,ij->i', dx, magnitude)
+    force[:, 1] = np.einsum('ij,ij->i', dy, magnitude)
+    return force
+
+
+@njit(cache=True)
+def build_quadtree(pos):
+    """Flat PR-quadtree over pos.
+
+    Every cell has a center, half-width, body count and center of mass.
+    first[cell] is -2 for internal cells, otherwise the first body of a leaf
+    (-1 when empty); next_body chains the bodies that share a leaf.
+    """
+    n = pos.shape[0]
+    capacity = 1 + n * (QUADTREE_MAX_DEPTH + 1)
+    child = np.empty((capacity, 4), np.int64)
+    first = np.empty(capacity, np.int64)
+    count = np.empty(capacity)
+    com = np.empty((capacity, 2))
+    center = np.empty((capacity, 2))
+    half = np.empty(capacity)
+    next_body = np.full(n, -1, np.int64)
+
+    min_x, min_y = pos[0, 0], pos[0, 1]
+    max_x, max_y = min_x, min_y
+    for i in range(1, n):
+        min_x = min(min_x, pos[i, 0])
+        max_x = max(max_x, pos[i, 0])
+        min_y = min(min_y, pos[i, 1])
+        max_y = max(max_y, pos[i, 1])
+
+    child[0] = -1
+    first[0] = -1
+    count[0] = 0.0
+    com[0] = 0.0
+    center[0, 0] = (min_x + max_x) / 2
+    center[0, 1] = (min_y + max_y) / 2
+    half[0] = max(max_x - min_x, max_y - min_y) / 2 + 1.0
+    cells = 1
+
+    for i in range(n):
+        x, y = pos[i, 0], pos[i, 1]
+        cell = 0
+        depth = 0
+        count[0] += 1.0
+        com[0, 0] += x
+        com[0, 1] += y
+        while True:
+            if first[cell] == -2:
+                quadrant = (1 if x >= center[cell, 0] else 0) + (2 if y >= center[cell, 1] else 0)
+                sub = child[cell, quadrant]
+                if sub == -1:
+                    sub = cells
+                    cells += 1
+                    h = half[cell] / 2
+                    child[sub] = -1
+                    first[sub] = -1
+                    count[sub] = 0.0
+                    com[sub] = 0.0
+                    center[sub, 0] = center[cell, 0] + (h if quadrant & 1 else -h)
+                    center[sub, 1] = center[cell, 1] + (h if quadrant & 2 else -h)
+                    half[sub] = h
+                    child[cell, quadrant] = sub
+                count[sub] += 1.0
+                com[sub, 0] += x
+                com[sub, 1] += y
+                cell = sub
+                depth += 1
+            elif first[cell] == -1 or depth >= QUADTREE_MAX_DEPTH:
+                next_body[i] = first[cell]
+                first[cell] = i
+                break
+            else:
+                # Split the leaf: push its single body one level down, then retry
+                j = first[cell]
+                first[cell] = -2
+                quadrant = (1 if pos[j, 0] >= center[cell, 0] else 0) + (2 if pos[j, 1] >= center[cell, 1] else 0)
+                sub = cells
+                cells += 1
+                h = half[cell] / 2
+                child[sub] = -1
+                first[sub] = j
+                count[sub] = 1.0
+                com[sub, 0] = pos[j, 0]
+                com[sub, 1] = pos[j, 1]
+                center[sub, 0] = center[cell, 0] + (h if quadrant & 1 else -h)
+                center[sub, 1] = center[cell, 1] + (h if quadrant & 2 else -h)
+                half[sub] = h
+                child[cell, quadrant] = sub
+
+    for cell in range(cells):
+        com[cell, 0] /= count[cell]
+        com[cell, 1] /= count[cell]
+    return child, first, count, com, center, half, next_body
+
+
+@njit(cache=True)
+def pair_force(dx, dy, combined):
+    """Repulsion + collision between two nodes dx, dy apart (node - other)"""
+    d2 = dx * dx + dy * dy
+    repels = d2 <= REPULSION_CUTOFF_SQ
+    collides = d2 < combined * combined
+    # Most pairs are far apart: reject them before paying for a sqrt
+    if not (repels or collides):
+        return 0.0, 0.0
+
+    # One sqrt and one division; the distance itself is d2 * inv
+    d2 = max(d2, MIN_DISTANCE_SQ)
+    inv = 1.0 / math.sqrt(d2)
+    magnitude = 0.0
+    if repels:
+        magnitude += REPULSION_STRENGTH * inv * inv
+    if collides:
+        magnitude += (combined - d2 * inv) * COLLISION_STIFFNESS
+    magnitude *= inv
+    return dx * magnitude, dy * magnitude
+
+
+@njit(parallel=True, cache=True)
+def barnes_hut_forces(pos, radius, movable, theta):
+    """Repulsion and collision forces using a Barnes-Hut quadtree.
+
+    Far cells are treated as one body at their center of mass. Cells close
+    enough to hold a colliding node are always opened, so collisions stay exact.
+    """
+    n = pos.shape[0]
+    child, first, count, com, center, half, next_body = build_quadtree(pos)
+    max_radius = radius.max()
+    force = np.zeros((n, 2))
+
+    for i in prange(n):
+        if not movable[i]:
+            continue
+        x, y = pos[i, 0], pos[i, 1]
+        reach = radius[i] + max_radius + COLLISION_PADDING
+        reach_sq = reach * reach
+        stack = np.empty(4 * QUADTREE_MAX_DEPTH + 4, np.int64)
+        stack[0] = 0
+        top = 1
+        fx = 0.0
+        fy = 0.0
+        while top > 0:
+            top -= 1
+            cell = stack[top]
+            if first[cell] == -2:
+                # Squared distance from the node to the cell's bounding box
+                bx = max(abs(x - center[cell, 0]) - half[cell], 0.0)
+                by = max(abs(y - center[cell, 1]) - half[cell], 0.0)
+                box_d2 = bx * bx + by * by
+                if box_d2 > REPULSION_CUTOFF_SQ and box_d2 > reach_sq:
+                    continue
 
+                dx = x - com[cell, 0]
+                dy = y - com[cell, 1]
+                d2 = dx * dx + dy * dy
+                size = 2 * half[cell]
+                if box_d2 > reach_sq and size * size < theta * theta * d2:
+                    if d2 <= REPULSION_CUTOFF_SQ:
+                        inv = 1.0 / math.sqrt(d2)
+                        magnitude = count[cell] * REPULSION_STRENGTH * inv * inv * inv
+                        fx += dx * magnitude
+                        fy += dy * magnitude
+                else:
+                    for quadrant in range(4):
+                        if child[cell, quadrant] != -1:
+                            stack[top] = child[cell, quadrant]
+                            top += 1
+            else:
+                j = first[cell]
+                while j != -1:
+                    if j != i:
+                        px, py = pair_force(x - pos[j, 0], y - pos[j, 1], radius[i] + radius[j] + COLLISION_PADDING)
+                        fx += px
+                        fy += py
+                    j = next_body[j]
+        force[i, 0] = fx
+        force[i, 1] = fy
+    return force
+
+
+@njit(fastmath=True, cache=True)
+def direct_forces(pos, radius):
+    """Exact all-pairs repulsion and collision, each pair computed once"""
+    n = pos.shape[0]
+    # Contiguous coordinates and a branch-free inner loop let LLVM vectorize it
+    xs = pos[:, 0].copy()
+    ys = pos[:, 1].copy()
+    fxs = np.zeros(n)
+    fys = np.zeros(n)
+    for i in range(n):
+        x, y = xs[i], ys[i]
+        reach = radius[i] + COLLISION_PADDING
+        fx = 0.0
+        fy = 0.0
+        for j in range(i + 1, n):
+            dx = x - xs[j]
+            dy = y - ys[j]
+            d2 = dx * dx + dy * dy
+            clamped = max(d2, MIN_DISTANCE_SQ)
+            inv = 1.0 / math.sqrt(clamped)
+            combined = reach + radius[j]
+            magnitude = REPULSION_STRENGTH * inv * inv if d2 <= REPULSION_CUTOFF_SQ else 0.0
+            magnitude += (combined - clamped * inv) * COLLISION_STIFFNESS if d2 < combined * combined else 0.0
+            magnitude *= inv
+            # Newton's third law: j gets the opposite push
+            fx += dx * magnitude
+            fy += dy * magnitude
+            fxs[j] -= dx * magnitude
+            fys[j] -= dy * magnitude
+        fxs[i] += fx
+        fys[i] += fy
+
+    force = np.zeros((n, 2))
+    force[:, 0] = fxs
+    force[:, 1] = fys
+    return force
+
+
+@njit(parallel=True, fastmath=True, cache=True, nogil=True)
+def _step_physics(pos, prev_pos, radius, gravity, edge_src, edge_dst, movable):
+    """Advance the layout one (Verlet) tick, updating pos and prev_pos in place"""
+    n = pos.shape[0]
+    if n >= BARNES_HUT_MIN_NODES:
+        force = barnes_hut_forces(pos, radius, movable, BARNES_HUT_THETA)
+    else:
+        force = direct_forces(pos, radius)
+
+    for e in range(edge_src.shape[0]):
+        s, t = edge_src[e], edge_dst[e]
+        dx = pos[t, 0] - pos[s, 0]
+        dy = pos[t, 1] - pos[s, 1]
+        length = max(math.sqrt(dx * dx + dy * dy), MIN_DISTANCE)
+        spring = (length - IDEAL_DISTANCE) * SPRING_STRENGTH / length
+        force[s, 0] += dx * spring
+        force[s, 1] += dy * spring
+        force[t, 0] -= dx * spring
+        force[t, 1] -= dy * spring
+
+    for i in prange(n):
+        if not movable[i]:
+            continue
+        for axis in range(2):
+            x = pos[i, axis]
+            v = (x - prev_pos[i, axis] + force[i, axis] - x * gravity[i]) * DAMPING
+            if abs(v) < JITTER_THRESHOLD:
+                v = 0.0
+            prev_pos[i, axis] = x
+            pos[i, axis] = x + v
+
+
+def _step_physics_numpy(pos, prev_pos, radius, gravity, edge_src, edge_dst, movable):
+    """NumPy version of _step_physics for installs without numba"""
+    force = compute_forces(pos, radius, gravity, edge_src, edge_dst, movable)
+    current = pos[movable]
+    moved = (current - prev_pos[movable] + force[movable]) * DAMPING
+
+    # Stop micro-movements (jitter fix)
+    moved[np.abs(moved) < JITTER_THRESHOLD] = 0
+    prev_pos[movable] = current
+    pos[movable] = current + moved
+
+
+step_physics = _step_physics if HAVE_NUMBA else _step_physics_numpy
+
+
+class PhysicsWorker(QObject):
+    """Runs physics steps on a background thread so a slow step never blocks the UI"""
+    stepped = Signal(object)
+
+    @Slot(object)
+    def step(self, job):
+        # job: (generation, idx, pos, prev_pos, radius, gravity, edge_src, edge_dst, movable, active, dragging)
+        generation, idx, pos, prev_pos, radius, gravity, edge_src, edge_dst, movable, active, dragging = job
+        step_physics(pos, prev_pos, radius, gravity, edge_src, edge_dst, movable)
+        self.stepped.emit((generation, idx, pos, prev_pos, active, dragging))
+
+
+COS30 = math.cos(math.pi / 6)
+SIN30 = math.sin(math.pi / 6)
+
+# Painted shadows as (y offset, blur, alpha), standing in for QGraphicsDropShadowEffect
+NODE_SHADOW = (3, 15, 100)
+NODE_HOVER_SHADOW = (5, 25, 160)
+TOOLTIP_SHADOW = (2, 10, 80)
+SHADOW_LAYERS = 4
+
+
+def paint_soft_shadow(painter, rect, shadow, ellipse=False):
+    """Fake a blurred drop shadow without an offscreen blur pass.
+
+    Circles get a radial falloff across the blur width; rectangles get a few
+    stacked translucent layers.
+    """
+    offset, blur, alpha = shadow
+    base = rect.translated(0, offset)
+    painter.setPen(Qt.NoPen)
+    if ellipse:
+        outer = base.width() / 2 + blur / 2
+        falloff = QRadialGradient(base.center(), outer)
+        falloff.setColorAt(max(0.0, 1 - blur / outer), QColor(0, 0, 0, alpha))
+        falloff.setColorAt(1, QColor(0, 0, 0, 0))
+        painter.setBrush(falloff)
+        painter.drawEllipse(base.center(), outer, outer)
+        return
+
+    painter.setBrush(QColor(0, 0, 0, alpha // SHADOW_LAYERS))
+    for i in range(SHADOW_LAYERS):
+        # From a quarter blur inside the shape to half a blur outside it
+        grow = blur * (3 * (i + 1) / SHADOW_LAYERS - 1) / 4
+        painter.drawRect(base.adjusted(-grow, -grow, grow, grow))
+
+
+def shadow_margin(shadow):
+    offset, blur, _ = shadow
+    return blur / 2 + offset
+
+
+def _palette(*colors):
+    return tuple(QColor(c) for c in colors)
+
+
+@lru_cache(maxsize=None)
+def node_styles(dark, tier, size):
+    """(normal brush, normal pen, hover brush, hover pen) shared by same-looking nodes"""
+    c_start, c_end, border, hover_start, hover_end, hover_border, _ = Node._PALETTES[(dark, tier)]
+
+    normal_gradient = QRadialGradient(0, -5, size / 2)
+    normal_gradient.setColorAt(0, c_start)
+    normal_gradient.setColorAt(1, c_end)
+
+    hover_gradient = QRadialGradient(0, -8, (size * 1.4) / 2)
+    hover_gradient.setColorAt(0, hover_start)
+    hover_gradient.setColorAt(1, hover_end)
 
+    return (
+        QBrush(normal_gradient),
+        QPen(border, 2.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin),
+        QBrush(hover_gradient),
+        QPen(hover_border, 3, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin),
+    )
 
 
+# ---------- ANIMATION ----------
+class FadeMixin:
+    """fade_to() for graphics items, driven by one reusable QVariantAnimation.
+
+    Graphics items aren't QObjects, so there is no opacity property to hand to
+    QPropertyAnimation; the animation feeds setOpacity directly instead.
+    """
+    _fade_anim = None
+
+    def fade_to(self, target_opacity, duration=300):
+        """Smoothly animates opacity changes"""
+        anim = self._fade_anim
+        if anim is None:
+            anim = self._fade_anim = QVariantAnimation()
+            anim.setEasingCurve(QEasingCurve.OutQuad)
+            anim.valueChanged.connect(self.setOpacity)
+        anim.stop()
+        anim.setDuration(duration)
+        anim.setStartValue(float(self.opacity()))
+        anim.setEndValue(float(target_opacity))
+        anim.start()
+
 
 # ---------- DIRECTED EDGE (ARROW) ----------
-class DirectedEdge(QGraphicsPolygonItem):
+class DirectedEdge(FadeMixin, QGraphicsPolygonItem):
+    # Shared by every edge; Qt pens and brushes are implicitly shared values
+    NORMAL_BRUSH = QBrush(QColor("#AAAAAA"))
+    NORMAL_PEN = QPen(QColor("#AAAAAA"), 2.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+
+    #darker_purple = QColor("#4834D4")
+    HIGHLIGHT_BRUSH = QBrush(QColor("#6C5CE7"))
+    HIGHLIGHT_PEN = QPen(QColor("#6C5CE7"), 4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+
     def __init__(self, source, dest):
         super().__init__()
         self.source = source
         self.dest = dest
 
-        self.normal_brush = QBrush(QColor("#AAAAAA"))
-        self.normal_pen = QPen(QColor("#AAAAAA"), 2.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-
-        #darker_purple = QColor("#4834D4")
-        self.highlight_brush = QBrush(QColor("#6C5CE7"))
-        self.highlight_pen = QPen(QColor("#6C5CE7"), 4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-
         self.setZValue(-1)
         self.setOpacity(0.7)
 
         self.line = QGraphicsLineItem(self)
+        self.pending_highlight = None  # Hover state to apply once back on screen
+        self.arrow = QPolygonF([QPointF(), QPointF(), QPointF()])  # Reused by update_position
 
         self.update_theme()
         self.update_position()
 
     def update_theme(self):
-        self.setBrush(self.normal_brush)
-        self.setPen(self.normal_pen)
-        self.line.setPen(self.normal_pen)
+        self.setBrush(self.NORMAL_BRUSH)
+        self.setPen(self.NORMAL_PEN)
+        self.line.setPen(self.NORMAL_PEN)
 
     def highlight(self, enabled):
         if enabled:
-            self.setBrush(self.highlight_brush)
-            self.setPen(self.highlight_pen)
-            self.line.setPen(self.highlight_pen)
-            self._animate_opacity(0.7, 1.0, 5)
+            self.setBrush(self.HIGHLIGHT_BRUSH)
+            self.setPen(self.HIGHLIGHT_PEN)
+            self.line.setPen(self.HIGHLIGHT_PEN)
+            self.fade_to(1.0, 100)
         else:
-            self.setBrush(self.normal_brush)
-            self.setPen(self.normal_pen)
-            self.line.setPen(self.normal_pen)
-            self._animate_opacity(1.0, 0.7, 5)
-
-    def _animate_opacity(self, start, end, steps):
-        for i in range(steps + 1):
-            opacity = start + (end - start) * (i / steps)
-            QTimer.singleShot(i * 20, lambda o=opacity: self.setOpacity(o))
+            self.setBrush(self.NORMAL_BRUSH)
+            self.setPen(self.NORMAL_PEN)
+            self.line.setPen(self.NORMAL_PEN)
+            self.fade_to(0.7, 100)
 
     def update_position(self):
-        start = self.source.pos()
-        end = self.dest.pos()
-        dx = end.x() - start.x()
-        dy = end.y() - start.y()
-        length = math.sqrt(dx * dx + dy * dy)
+        start_x, start_y = self.source.x(), self.source.y()
+        end_x, end_y = self.dest.x(), self.dest.y()
+        dx = end_x - start_x
+        dy = end_y - start_y
+        length = math.hypot(dx, dy)
 
         if length == 0:
             return
 
-        dx /= length
-        dy /= length
+        inv_length = 1.0 / length
+        dx *= inv_length
+        dy *= inv_length
         target_radius = self.dest.normal_size / 2
         offset = target_radius + 2
-        end_x = end.x() - dx * offset
-        end_y = end.y() - dy * offset
+        end_x -= dx * offset
+        end_y -= dy * offset
 
-        self.line.setLine(start.x(), start.y(), end_x, end_y)
+        self.line.setLine(start_x, start_y, end_x, end_y)
 
+        # Arrow barbs: the unit direction rotated by -/+30 degrees
         arrow_size = 12
-        angle = math.atan2(dy, dx)
-        tip = QPointF(end_x, end_y)
-        p1 = QPointF(end_x - arrow_size * math.cos(angle - math.pi / 6),
-                     end_y - arrow_size * math.sin(angle - math.pi / 6))
-        p2 = QPointF(end_x - arrow_size * math.cos(angle + math.pi / 6),
-                     end_y - arrow_size * math.sin(angle + math.pi / 6))
-
-        arrow = QPolygonF([tip, p1, p2])
+        arrow = self.arrow
+        arrow[0] = QPointF(end_x, end_y)
+        arrow[1] = QPointF(end_x - arrow_size * (dx * COS30 + dy * SIN30),
+                           end_y - arrow_size * (dy * COS30 - dx * SIN30))
+        arrow[2] = QPointF(end_x - arrow_size * (dx * COS30 - dy * SIN30),
+                           end_y - arrow_size * (dy * COS30 + dx * SIN30))
         self.setPolygon(arrow)
 
-    def fade_to(self, target_opacity, duration=300):
-        start_opacity = self.opacity()
-        steps = 15
-        interval = duration // steps
-        for i in range(steps + 1):
-            t = i / steps
-            new_op = start_opacity + (target_opacity - start_opacity) * t
-            QTimer.singleShot(i * interval, lambda val=new_op: self.setOpacity(val))
+
+# ---------- TOOLTIP ----------
+class TooltipBackground(QGraphicsRectItem):
+    """Tooltip box that paints its own shadow instead of using a graphics effect"""
+
+    def boundingRect(self):
+        margin = shadow_margin(TOOLTIP_SHADOW)
+        return super().boundingRect().adjusted(-margin, -margin, margin, margin)
+
+    def paint(self, painter, option, widget=None):
+        paint_soft_shadow(painter, self.rect(), TOOLTIP_SHADOW)
+        super().paint(painter, option, widget)
 
 
 # ---------- NODE ----------
-class Node(QGraphicsEllipseItem):
+class Node(FadeMixin, QGraphicsEllipseItem):
+    # (dark, centrality tier) -> (start, end, border, hover start, hover end, hover border, label)
+    # Tiers are centrality < 0.25 / < 0.50 / < 0.75 / above
+    _PALETTES = {
+        # --- LIGHT MODE PALETTES ---
+        # Level 1: Weak (Very Pale Lavender)
+        (False, 0): _palette("#E6E6FA", "#D1D1F0", "#B0B0D0", "#F0F0FF", "#E0E0FF", "#9999BB", "#555555"),
+        # Level 2: Medium (Soft Purple)
+        (False, 1): _palette("#D6D1F5", "#A29BFE", "#8880C0", "#E6E1FF", "#B3ACFF", "#9990D0", "white"),
+        # Level 3: ORIGINAL (Standard Purple)
+        (False, 2): _palette("#A29BFE", "#6C5CE7", "#5948C3", "#B8B3FF", "#7E6FF2", "#6C5CE7", "white"),
+        # Level 4: Stronger Purple (Deep Indigo) - starts where L3 ends, navy-purple border
+        (False, 3): _palette("#6C5CE7", "#4834D4", "#30336B", "#7E6FF2", "#5948C3", "#4834D4", "white"),
+
+        # --- DARK MODE PALETTES ---
+        # Level 1: Weak (Dark Grey)
+        (True, 0): _palette("#666666", "#444444", "#333333", "#777777", "#555555", "#666666", "#CCCCCC"),
+        # Level 2: Medium (Light Grey)
+        (True, 1): _palette("#AAAAAA", "#888888", "#666666", "#BBBBBB", "#999999", "#888888", "#2D3436"),
+        # Level 3: Bright Silver (Closer to white)
+        (True, 2): _palette("#DDDDDD", "#BBBBBB", "#999999", "#EEEEEE", "#CCCCCC", "#AAAAAA", "#2D3436"),
+        # Level 4: "Glow" (White body with a tiny cool tint, bright purple border)
+        (True, 3): _palette("#FFFFFF", "#F0F0F5", "#A29BFE", "#FFFFFF", "#E0E0FF", "#6C5CE7", "#2D3436"),
+    }
+
+    # dark -> (info text color, tooltip brush, tooltip pen)
+    _INFO_STYLES = {
+        False: (QColor("#2D3436"), QBrush(QColor(255, 255, 255, 240)), QPen(QColor("#6C5CE7"), 2)),
+        True: (QColor("#EDEDED"), QBrush(QColor("#444444")), QPen(QColor("#666666"), 2)),
+    }
+
     def __init__(self, node_id, x, y, main_window=None, graph_view=None, audio_manager=None, centrality=0.0):
         # 1. Calculate Dynamic Base Size based on centrality (0.0 to 1.0)
         # Base size 50, max extra 30. An influencer will be size 80.
         self.centrality = centrality
+        self.tier = min(3, int(self.centrality * 4))
         self.normal_size = 50 + (self.centrality * 30)
 
         # Center the larger node correctly
@@ -115,10 +654,11 @@ class Node(QGraphicsEllipseItem):
         self.graph_view = graph_view
         self.audio = audio_manager
 
-        self.velocity_x = 0
-        self.velocity_y = 0
+        self.index = None  # Row in the graph's physics arrays
         self.is_being_dragged = False
         self.is_hovered = False
+        self.is_static = False  # Pinned in place, ignored by the physics step
+        self.shadow = NODE_SHADOW
 
         self.id = node_id
         self.username = f"user_{node_id}"
@@ -136,6 +676,7 @@ class Node(QGraphicsEllipseItem):
 
         self.outgoing_edges = []
         self.incoming_edges = []
+        self.all_edges = []  # outgoing + incoming, filled in by NetworkGraph.build_physics_arrays
 
         if self.is_valid:
             self.setFlags(
@@ -144,13 +685,16 @@ class Node(QGraphicsEllipseItem):
                 QGraphicsItem.ItemSendsGeometryChanges
             )
             self.setAcceptHoverEvents(True)
-            self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
-            self.shadow = QGraphicsDropShadowEffect()
-            self.shadow.setBlurRadius(15)
-            self.shadow.setColor(QColor(0, 0, 0, 100))
-            self.shadow.setOffset(0, 3)
-            self.setGraphicsEffect(self.shadow)
+            # One reusable hover-scale animation, restarted from the current size
+            self.size_anim = QVariantAnimation()
+            self.size_anim.setDuration(150)
+            self.size_anim.setEasingCurve(QEasingCurve.OutCubic)
+            self.size_anim.valueChanged.connect(self.set_scale_factor)
+            # Appearance only changes with hover/theme, so rasterize once in item
+            # coordinates and let zooming and panning reuse the pixmap
+            self.setCacheMode(QGraphicsItem.ItemCoordinateCache)
+
 
             # Label
             self.label = QGraphicsTextItem(str(node_id), self)
@@ -160,14 +704,10 @@ class Node(QGraphicsEllipseItem):
             self.label.setPos(-label_rect.width() / 2, -label_rect.height() / 2)
 
             # Tooltip (Floating above node)
-            self.info_bg = QGraphicsRectItem(self)
+            self.info_bg = TooltipBackground(self)
             self.info_bg.setVisible(False)
             self.info_bg.setZValue(99)
-            self.info_shadow = QGraphicsDropShadowEffect()
-            self.info_shadow.setBlurRadius(10)
-            self.info_shadow.setColor(QColor(0, 0, 0, 80))
-            self.info_shadow.setOffset(0, 2)
-            self.info_bg.setGraphicsEffect(self.info_shadow)
+            self.info_bg.setCacheMode(QGraphicsItem.ItemCoordinateCache)
 
             self.info_text = QGraphicsTextItem(self)
             # Add score to the floating tooltip
@@ -189,133 +729,30 @@ class Node(QGraphicsEllipseItem):
         if self.main_window and hasattr(self.main_window, 'dark_mode'):
             dark = self.main_window.dark_mode
 
-        # Initialize Defaults
-        c_start = QColor()
-        c_end = QColor()
-        border = QColor()
-        hover_start = QColor()
-        hover_end = QColor()
-        hover_border = QColor()
-        label_col = QColor()
-        info_col = QColor()
-
-        # --- LIGHT MODE PALETTES ---
-        if not dark:
-            # Common text/info colors
-            label_col = QColor("white")
-            info_col = QColor("#2D3436")
-            self.info_bg.setBrush(QBrush(QColor(255, 255, 255, 240)))
-            self.info_bg.setPen(QPen(QColor("#6C5CE7"), 2))
-
-            if self.centrality < 0.25:
-                # Level 1: Weak (Very Pale Lavender)
-                c_start = QColor("#E6E6FA")
-                c_end = QColor("#D1D1F0")
-                border = QColor("#B0B0D0")
-                label_col = QColor("#555555")
-
-                hover_start = QColor("#F0F0FF")
-                hover_end = QColor("#E0E0FF")
-                hover_border = QColor("#9999BB")
-
-            elif self.centrality < 0.50:
-                # Level 2: Medium (Soft Purple)
-                c_start = QColor("#D6D1F5")
-                c_end = QColor("#A29BFE")
-                border = QColor("#8880C0")
-
-                hover_start = QColor("#E6E1FF")
-                hover_end = QColor("#B3ACFF")
-                hover_border = QColor("#9990D0")
-
-            elif self.centrality < 0.75:
-                # Level 3: ORIGINAL (Standard Purple)
-                c_start = QColor("#A29BFE")
-                c_end = QColor("#6C5CE7")
-                border = QColor("#5948C3")
-
-                hover_start = QColor("#B8B3FF")
-                hover_end = QColor("#7E6FF2")
-                hover_border = QColor("#6C5CE7")
-
-            else:
-                # Level 4: Stronger Purple (Deep Indigo) - FIX: No Red!
-                c_start = QColor("#6C5CE7")  # Starts where L3 ends
-                c_end = QColor("#4834D4")  # Deep Royal Indigo
-                border = QColor("#30336B")  # Navy-Purple Border
-
-                hover_start = QColor("#7E6FF2")
-                hover_end = QColor("#5948C3")
-                hover_border = QColor("#4834D4")
-
-        # --- DARK MODE PALETTES ---
-        else:
-            # Common text/info colors
-            label_col = QColor("#2D3436")
-            info_col = QColor("#EDEDED")
-            self.info_bg.setBrush(QBrush(QColor("#444444")))
-            self.info_bg.setPen(QPen(QColor("#666666"), 2))
-
-            if self.centrality < 0.25:
-                # Level 1: Weak (Dark Grey)
-                c_start = QColor("#666666")
-                c_end = QColor("#444444")
-                border = QColor("#333333")
-                label_col = QColor("#CCCCCC")
-
-                hover_start = QColor("#777777")
-                hover_end = QColor("#555555")
-                hover_border = QColor("#666666")
-
-            elif self.centrality < 0.50:
-                # Level 2: Medium (Light Grey)
-                c_start = QColor("#AAAAAA")
-                c_end = QColor("#888888")
-                border = QColor("#666666")
-
-                hover_start = QColor("#BBBBBB")
-                hover_end = QColor("#999999")
-                hover_border = QColor("#888888")
-
-            elif self.centrality < 0.75:
-                # Level 3: Bright Silver (Closer to white)
-                c_start = QColor("#DDDDDD")
-                c_end = QColor("#BBBBBB")
-                border = QColor("#999999")
-
-                hover_start = QColor("#EEEEEE")
-                hover_end = QColor("#CCCCCC")
-                hover_border = QColor("#AAAAAA")
-
-            else:
-                # Level 4: "Glow" (White body, Purple Border) - FIX: Body is Greyscale
-                c_start = QColor("#FFFFFF")
-                c_end = QColor("#F0F0F5")  # Almost white, tiny cool tint
+        tier = self.tier
+        label_col = self._PALETTES[(dark, tier)][-1]
+        info_col, info_brush, info_pen = self._INFO_STYLES[dark]
 
-                # THE GLOW: Use a bright purple border
-                border = QColor("#A29BFE")
+        self.info_bg.setBrush(info_brush)
+        self.info_bg.setPen(info_pen)
+        self.normal_brush, self.normal_pen, self.hover_brush, self.hover_pen = node_styles(
+            dark, tier, round(self.normal_size)
+        )
 
-                hover_start = QColor("#FFFFFF")
-                hover_end = QColor("#E0E0FF")
-                hover_border = QColor("#6C5CE7")  # Stronger purple on hover
-
-        # --- APPLY GRADIENTS ---
-        self.normal_gradient = QRadialGradient(0, -5, self.normal_size / 2)
-        self.normal_gradient.setColorAt(0, c_start)
-        self.normal_gradient.setColorAt(1, c_end)
-
-        self.hover_gradient = QRadialGradient(0, -8, (self.normal_size * 1.4) / 2)
-        self.hover_gradient.setColorAt(0, hover_start)
-        self.hover_gradient.setColorAt(1, hover_end)
-
-        self.border_color = border
-        self.hover_border_color = hover_border
-
-        self.setBrush(QBrush(self.normal_gradient))
-        self.setPen(QPen(self.border_color, 2.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        self.setBrush(self.normal_brush)
+        self.setPen(self.normal_pen)
         self.label.setDefaultTextColor(label_col)
         self.info_text.setDefaultTextColor(info_col)
 
+    def boundingRect(self):
+        # Leave room for the largest (hover) shadow so it never changes geometry
+        margin = shadow_margin(NODE_HOVER_SHADOW)
+        return super().boundingRect().adjusted(-margin, -margin, margin, margin)
+
+    def paint(self, painter, option, widget=None):
+        paint_soft_shadow(painter, self.rect(), self.shadow, ellipse=True)
+        super().paint(painter, option, widget)
+
     def update_tooltip_pos(self):
         text_rect = self.info_text.boundingRect()
         padding = 8
@@ -328,24 +765,37 @@ class Node(QGraphicsEllipseItem):
         self.info_bg.setRect(-bg_width / 2, y_offset, bg_width, bg_height)
         self.info_text.setPos(-text_rect.width() / 2, y_offset + padding / 2)
 
+    def set_profile(self, user_data):
+        """Pick up a renamed user or changed interests without rebuilding the node"""
+        self.username = user_data.get('username', self.username)
+        self.interests = user_data.get('interests', [])
+        self.info_text.setPlainText(f"@{self.username}\nInf: {int(self.centrality * 100)}%")
+        self.update_tooltip_pos()
+
+    def set_centrality(self, centrality):
+        """Resize and recolor for a new influence score"""
+        self.centrality = centrality
+        self.tier = min(3, int(self.centrality * 4))
+        self.normal_size = 50 + (self.centrality * 30)
+        self.set_scale_factor(1.3 if self.is_hovered else 1.0)
+        self.info_text.setPlainText(f"@{self.username}\nInf: {int(self.centrality * 100)}%")
+        self.update_tooltip_pos()
+        self.update_theme()
+        if self.is_hovered:
+            self.setBrush(self.hover_brush)
+            self.setPen(self.hover_pen)
+
     def animate_size(self, target_scale):
-        # Calculate target rect based on SELF.NORMAL_SIZE (which is dynamic)
-        # This ensures we scale relative to the influencer size, not 50px
-        base = self.normal_size
-        scaled = base * target_scale
-
-        target_rect = QRectF(-scaled / 2, -scaled / 2, scaled, scaled)
-        steps = 10
-        for i in range(steps + 1):
-            QTimer.singleShot(i * 15, lambda s=i / steps, tr=target_rect: self._update_size(s, tr))
-
-    def _update_size(self, progress, target_rect):
-        current_rect = self.rect()
-        new_width = current_rect.width() + (target_rect.width() - current_rect.width()) * 0.3
-        new_height = current_rect.height() + (target_rect.height() - current_rect.height()) * 0.3
-        half_w = new_width / 2
-        half_h = new_height / 2
-        self.setRect(-half_w, -half_h, new_width, new_height)
+        # Scale relative to SELF.NORMAL_SIZE (which is dynamic), not 50px,
+        # starting from wherever a previous animation left off
+        self.size_anim.stop()
+        self.size_anim.setStartValue(self.rect().width() / self.normal_size)
+        self.size_anim.setEndValue(float(target_scale))
+        self.size_anim.start()
+
+    def set_scale_factor(self, scale):
+        scaled = self.normal_size * scale
+        self.setRect(-scaled / 2, -scaled / 2, scaled, scaled)
 
     def hoverEnterEvent(self, event):
         self.is_hovered = True
@@ -353,19 +803,21 @@ class Node(QGraphicsEllipseItem):
         # Scale UP (1.3x of normal_size)
         self.animate_size(1.3)
 
-        self.setBrush(QBrush(self.hover_gradient))
-        self.setPen(QPen(self.hover_border_color, 3, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        self.setBrush(self.hover_brush)
+        self.setPen(self.hover_pen)
         self.setZValue(10)
-        self.shadow.setBlurRadius(25)
-        self.shadow.setOffset(0, 5)
-        self.shadow.setColor(QColor(0, 0, 0, 160))
+        self.shadow = NODE_HOVER_SHADOW
+        self.update()
 
         # Show Floating Tooltip
         self.info_text.setVisible(True)
         self.info_bg.setVisible(True)
 
-        for edge in self.outgoing_edges + self.incoming_edges:
-            edge.highlight(True)
+        if self.graph_view:
+            self.graph_view.highlight_edges(self.all_edges, True)
+        else:
+            for edge in self.all_edges:
+                edge.highlight(True)
 
         # Show Info Panel (Bottom Corner)
         if self.graph_view:
@@ -379,19 +831,21 @@ class Node(QGraphicsEllipseItem):
         # Scale DOWN (Return to 1.0x of normal_size)
         self.animate_size(1.0)
 
-        self.setBrush(QBrush(self.normal_gradient))
-        self.setPen(QPen(self.border_color, 2.5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        self.setBrush(self.normal_brush)
+        self.setPen(self.normal_pen)
         self.setZValue(0)
-        self.shadow.setBlurRadius(15)
-        self.shadow.setOffset(0, 3)
-        self.shadow.setColor(QColor(0, 0, 0, 100))
+        self.shadow = NODE_SHADOW
+        self.update()
 
         # Hide Floating Tooltip
         self.info_text.setVisible(False)
         self.info_bg.setVisible(False)
 
-        for edge in self.outgoing_edges + self.incoming_edges:
-            edge.highlight(False)
+        if self.graph_view:
+            self.graph_view.highlight_edges(self.all_edges, False)
+        else:
+            for edge in self.all_edges:
+                edge.highlight(False)
 
         # Hide Info Panel (Bottom Corner)
         if self.graph_view:
@@ -401,115 +855,142 @@ class Node(QGraphicsEllipseItem):
 
     def itemChange(self, change, value):
         if change == QGraphicsItem.ItemPositionHasChanged:
-            for edge in self.outgoing_edges + self.incoming_edges:
-                edge.update_position()
+            if self.graph_view:
+                self.graph_view.mark_edges_dirty(self.all_edges)
+                if not self.graph_view.scattering:
+                    self.graph_view.moved_items.add(self)
+            else:
+                for edge in self.all_edges:
+                    edge.update_position()
         return super().itemChange(change, value)
 
     def mousePressEvent(self, event):
-        # --- NEW: Path Finding Logic ---
-        if self.graph_view and self.graph_view.path_mode:
-            if self.graph_view.path_start_node is None:
-                # First Click: Select Start Node
-                self.graph_view.path_start_node = self
-                self.graph_view.path_btn.setText("Click End Node")
-                # Highlight this node Green to show selection
-                self.setBrush(QBrush(QColor("#00B894")))
-                return
-            else:
-                # Second Click: Select End Node & Calculate
-                start = self.graph_view.path_start_node
-                self.graph_view.visualize_path(start, self)
-                return
-        # -------------------------------
-
-        # --- NEW: Recommendation Logic ---
-        if self.graph_view and self.graph_view.rec_mode:
-            self.graph_view.visualize_recommendations(self)
+        # Path / recommendation / AI modes consume the click before any drag
+        if self.graph_view and self.graph_view.click_handler(self):
             return
-        # ---------------------------------
-
-        # --- AI Logic (Two-Step Selection) ---
-        if self.graph_view and self.graph_view.ai_mode:
-
-            # Step 1: Select First Node
-            if self.graph_view.ai_start_node is None:
-                self.graph_view.ai_start_node = self
-                self.graph_view.ai_btn.setText("Click User 2")
-                # Highlight Green
-                self.setBrush(QBrush(QColor("#00CEC9")))
-                return
-
-            # Step 2: Select Second Node & Execute
-            else:
-                u1 = self.graph_view.ai_start_node
-                u2 = self
-
-                # Prevent clicking same node twice
-                if u1 == u2: return
-
-                self.graph_view.visualize_ai_predictions(u1, u2)
-                return
-        # -------------------------------------
 
         self.is_being_dragged = True
-        self.velocity_x = 0
-        self.velocity_y = 0
+        if self.graph_view:
+            self.graph_view.stop_node(self)
+            self.graph_view.wake_physics()
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
         self.is_being_dragged = False
+        if self.graph_view:
+            self.graph_view.wake_physics()
         super().mouseReleaseEvent(event)
 
-    def fade_to(self, target_opacity, duration=300):
-        """Smoothly animates opacity changes"""
-        start_opacity = self.opacity()
-        steps = 15  # Number of animation frames
-        interval = duration // steps
+    def make_static(self):
+        """Pin the node where it is; it still pushes other nodes away"""
+        self.is_static = True
+        if self.graph_view:
+            self.graph_view.stop_node(self)
+
+    def make_dynamic(self):
+        self.is_static = False
+        if self.graph_view:
+            self.graph_view.wake_physics()
 
-        for i in range(steps + 1):
-            t = i / steps
-            # Linear interpolation
-            new_op = start_opacity + (target_opacity - start_opacity) * t
-            QTimer.singleShot(i * interval, lambda val=new_op: self.setOpacity(val))
+
+def matrix_edges(matrix):
+    """Yield (i, j) for every matrix[i][j] == 1, in row order.
+
+    list.index scans each row in C, so the Python-level work is per edge
+    rather than per cell.
+    """
+    for i, row in enumerate(matrix):
+        j = -1
+        while True:
+            try:
+                j = row.index(1, j + 1)
+            except ValueError:
+                break
+            yield i, j
 
 
 # ---------- NETWORK GRAPH PAGE ----------
 class NetworkGraph(QGraphicsView):
+    physics_step_requested = Signal(object)
+
     def __init__(self, matrix=None, main_window=None):
         super().__init__()
+        self.nodes = []
+        self.nodes_by_id = {}
+        self.edges_by_pair = {}  # (source id, dest id) -> DirectedEdge
+        self.graph_size = 0  # Matrix size the items were built for
+        self.physics_generation = 0  # Bumped whenever the physics arrays are rebuilt
+        self.moved_items = set()  # Nodes moved by anything but scatter_positions
+        self.scattering = False
+        self.view_rect = None  # Visible scene area, None until first laid out
+        self.view_bounds = None  # The same as plain (left, top, right, bottom) floats
+        self.dirty_edges = set()  # Edges whose endpoints moved since they were last redrawn
+        self.flush_pending = False
         self.main_window = main_window
         self.matrix = matrix if matrix is not None else []
 
         # Initialize Audio
-        self.audio_manager = AudioManager()
+        self.audio_manager = get_audio_manager()
 
         self.scene = QGraphicsScene(self)
         self.scene.setSceneRect(-400, -400, 800, 800)
+        # Nodes move every tick, so a BSP index would be rebuilt constantly;
+        # a few hundred items are quick to search linearly
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
 
         self.setRenderHint(QPainter.Antialiasing, True)
-        self.setRenderHint(QPainter.SmoothPixmapTransform, True)
         self.setDragMode(QGraphicsView.ScrollHandDrag)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        if opengl_available():
+            # Let the GPU fill and composite; a full redraw is cheap there and
+            # avoids partial-update bookkeeping (bilinear pixmap scaling is free)
+            self.setViewport(QOpenGLWidget())
+            self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        else:
+            self.setRenderHint(QPainter.SmoothPixmapTransform, True)
+            # Only repaint the regions that changed
+            self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        # Items restore their own painter state and keep their paint inside boundingRect()
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState, True)
+        self.setOptimizationFlag(QGraphicsView.DontAdjustForAntialiasing, True)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
 
         self.matrix = matrix
         self.nodes = []
+        self.build_physics_arrays()
         self.initial_positions = []
         self.final_positions = []
 
         self.physics_enabled = True
+        self.rest_frames = 0
+        # Steps run on a worker thread; the timer only hands out work and one
+        # step is in flight at a time
+        self.physics_pending = False
+        self.physics_thread = QThread(self)
+        self.physics_worker = PhysicsWorker()
+        self.physics_worker.moveToThread(self.physics_thread)
+        self.physics_step_requested.connect(self.physics_worker.step)
+        self.physics_worker.stepped.connect(self.finish_physics_step)
+        self.physics_thread.start()
+        QApplication.instance().aboutToQuit.connect(self.stop_physics_thread)
         self.physics_timer = QTimer()
         self.physics_timer.timeout.connect(self.apply_physics)
         self.physics_timer.start(16)
 
+        # Pre-rendered picture of a settled graph, dragged around while panning
+        self.snapshot = None
+        self.snapshot_rect = None
+        self.snapshot_hidden = []
+
         self.setup_graph()
         self.setup_info_panel()
         self.update_theme()
 
         self.path_mode = False
         self.path_start_node = None
+        # Whatever mode is active decides what a node click does
+        self.click_handler = self.default_click
 
         # --- NEW: Recommendation Mode State ---
         self.rec_mode = False
@@ -668,6 +1149,60 @@ class NetworkGraph(QGraphicsView):
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.update_panel_position()
+        self.update_view_rect()
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self.update_view_rect()
+
+    def update_view_rect(self):
+        """Recompute the visible scene area and catch up edges that came into it"""
+        margin = EDGE_CULL_MARGIN
+        self.view_rect = self.mapToScene(self.viewport().rect()).boundingRect().adjusted(
+            -margin, -margin, margin, margin
+        )
+        rect = self.view_rect
+        self.view_bounds = (rect.left(), rect.top(), rect.right(), rect.bottom())
+        self.scatter_positions()
+        self.flush_dirty_edges()
+
+    def mark_edges_dirty(self, edges):
+        """Queue edges for one redraw at the end of the tick / event batch"""
+        self.dirty_edges.update(edges)
+        if not self.flush_pending:
+            self.flush_pending = True
+            QTimer.singleShot(0, self.flush_dirty_edges)
+
+    def flush_dirty_edges(self):
+        """Redraw queued edges; off-screen ones wait until they scroll into view"""
+        self.flush_pending = False
+        if self.dirty_edges:
+            visible = [edge for edge in self.dirty_edges if self.edge_in_view(edge)]
+            self.dirty_edges.difference_update(visible)
+            for edge in visible:
+                edge.update_position()
+                if edge.pending_highlight is not None:
+                    edge.highlight(edge.pending_highlight)
+                    edge.pending_highlight = None
+
+    def highlight_edges(self, edges, enabled):
+        """Highlight on-screen edges now; off-screen ones when they scroll into view"""
+        for edge in edges:
+            if self.edge_in_view(edge):
+                edge.pending_highlight = None
+                edge.highlight(enabled)
+            else:
+                edge.pending_highlight = enabled
+                self.dirty_edges.add(edge)
+
+    def edge_in_view(self, edge):
+        if self.view_bounds is None:
+            return True
+        left, top, right, bottom = self.view_bounds
+        ax, ay = edge.source.x(), edge.source.y()
+        bx, by = edge.dest.x(), edge.dest.y()
+        return (min(ax, bx) <= right and max(ax, bx) >= left and
+                min(ay, by) <= bottom and max(ay, by) >= top)
 
     def update_panel_position(self):
         if hasattr(self, 'info_panel') and self.info_panel.isVisible():
@@ -704,8 +1239,8 @@ class NetworkGraph(QGraphicsView):
 
         for node in self.nodes:
             node.update_theme()
-            for edge in node.outgoing_edges:
-                edge.update_theme()
+        for edge in self.edges_by_index:
+            edge.update_theme()
 
         # 2. Handle Button Styles (THE FIX)
         if is_dark:
@@ -742,90 +1277,187 @@ class NetworkGraph(QGraphicsView):
             self.main_window.go_to_login()
 
     def apply_physics(self):
-        if not self.physics_enabled:
+        if not self.physics_enabled or not self.nodes or self.physics_pending:
             return
 
-        damping = 0.85
-        spring_strength = 0.01  # Increased slightly for snappier edges
-        ideal_distance = 150
-        repulsion_strength = 10000
-        collision_radius = 60  # Increased to prevent big nodes overlapping
+        self.update_view_rect()
+        self.sync_moved_items()
+
+        nodes = self.nodes
+        # Per-node flags in one pass each, written into the arrays by slice
+        # rather than element by element
+        visible = self._visible
+        visible[:] = [node.isVisible() for node in nodes]
+        dragging = [node.is_being_dragged for node in nodes]
+        # Dragged and hovered nodes stay put but still push the others
+        movable = self._movable
+        movable[:] = [not (dragged or node.is_hovered or node.is_static) for dragged, node in zip(dragging, nodes)]
+        active = movable & visible
+
+        if visible.all():
+            idx = None
+            job = (self._pos.copy(), self._prev_pos.copy(), self._radius, self._gravity,
+                   self.edge_src, self.edge_dst, movable.copy())
+        else:
+            idx, job = self.visible_physics_job(visible)
 
-        # Base gravity for everyone (keeps nodes from flying off into space)
-        base_gravity = 0.002
+        self.physics_pending = True
+        self.physics_step_requested.emit((self.physics_generation, idx) + job + (active, any(dragging)))
 
-        for node in self.nodes:
-            if node.is_being_dragged or node.is_hovered:
-                continue
+    @Slot(object)
+    def finish_physics_step(self, result):
+        """Take a finished step back from the worker and show it"""
+        generation, idx, pos, prev_pos, active, dragging = result
+        self.physics_pending = False
+        if generation != self.physics_generation:
+            return  # The graph was rebuilt while this step was running
 
-            force_x = 0
-            force_y = 0
-
-            # 1. Repulsion (Nodes push each other away)
-            for other in self.nodes:
-                if other == node: continue
-                dx = node.pos().x() - other.pos().x()
-                dy = node.pos().y() - other.pos().y()
-                distance = math.sqrt(dx * dx + dy * dy)
-
-                if distance > 600: continue  # Optimization
-
-                if distance < 0.1: distance = 0.1
-                repulsion = repulsion_strength / (distance * distance)
-                force_x += (dx / distance) * repulsion
-                force_y += (dy / distance) * repulsion
-
-            # 2. Springs (Connections pull nodes together)
-            for edge in node.outgoing_edges + node.incoming_edges:
-                other = edge.dest if edge.source == node else edge.source
-                dx = other.pos().x() - node.pos().x()
-                dy = other.pos().y() - node.pos().y()
-                distance = math.sqrt(dx * dx + dy * dy)
-                if distance < 0.1: distance = 0.1
-                spring_force = (distance - ideal_distance) * spring_strength
-                force_x += (dx / distance) * spring_force
-                force_y += (dy / distance) * spring_force
-
-            # 3. Collision (Prevent Overlap)
-            for other in self.nodes:
-                if other == node: continue
-                dx = node.pos().x() - other.pos().x()
-                dy = node.pos().y() - other.pos().y()
-                distance = math.sqrt(dx * dx + dy * dy)
-
-                # Use dynamic sizes for collision calculation
-                # (Assuming node.normal_size is available from our previous Node class update)
-                combined_radius = (node.normal_size / 2) + (other.normal_size / 2) + 10
-
-                if distance < combined_radius:
-                    if distance < 0.1: distance = 0.1
-                    collision_force = (combined_radius - distance) * 0.5
-                    force_x += (dx / distance) * collision_force
-                    force_y += (dy / distance) * collision_force
-
-            # 4. VARIABLE CENTRAL GRAVITY (The Logic You Wanted)
-            # - Weak nodes (0.0 score) get 0.002 gravity (Base)
-            # - Strong nodes (1.0 score) get 0.032 gravity (16x stronger pull!)
-            centrality_pull = node.centrality * 0.005
-            total_gravity = base_gravity + centrality_pull
-
-            force_x -= node.x() * total_gravity
-            force_y -= node.y() * total_gravity
-
-            # Apply forces
-            node.velocity_x = (node.velocity_x + force_x) * damping
-            node.velocity_y = (node.velocity_y + force_y) * damping
-
-            # Stop micro-movements (jitter fix)
-            if abs(node.velocity_x) < 0.05: node.velocity_x = 0
-            if abs(node.velocity_y) < 0.05: node.velocity_y = 0
-
-            if abs(node.velocity_x) > 0 or abs(node.velocity_y) > 0:
-                node.setPos(node.pos() + QPointF(node.velocity_x, node.velocity_y))
+        if idx is None:
+            self._pos, self._prev_pos = pos, prev_pos
+        else:
+            self._pos[idx] = pos
+            self._prev_pos[idx] = prev_pos
+        # Items moved while the step was running keep where they were put
+        self.sync_moved_items()
+
+        self.scatter_positions()
+        self.flush_dirty_edges()
+
+        # Stop ticking once the layout has settled (a drag keeps it awake)
+        vel = self._pos[active] - self._prev_pos[active]
+        if float((vel * vel).sum()) < REST_ENERGY * len(vel) and not dragging:
+            self.rest_frames += 1
+            if self.rest_frames >= REST_FRAMES:
+                self.physics_timer.stop()
+                # Nothing will move for a while: bring off-screen items up to date
+                self.scatter_positions(everything=True)
+        else:
+            self.rest_frames = 0
+
+    def sync_moved_items(self):
+        """Take over positions of items moved outside the simulation"""
+        # self._pos is the simulation's truth; off-screen items may lag behind it.
+        # Anything moved outside the step (drags, setPos calls) wins...
+        if not self.moved_items:
+            return
+        moved = [node for node in self.moved_items if node.index is not None]
+        self.moved_items.clear()
+        idx = np.array([node.index for node in moved], dtype=np.intp)
+        seen = np.array([(node.x(), node.y()) for node in moved], dtype=float).reshape(-1, 2)
+        # ...and starts from rest where it was put
+        self._pos[idx] = seen
+        self._prev_pos[idx] = seen
+        self._qt_pos[idx] = seen
+
+    def stop_physics_thread(self):
+        self.physics_timer.stop()
+        self.physics_thread.quit()
+        self.physics_thread.wait()
+
+    def scatter_positions(self, everything=False):
+        """Copy simulated positions to node items that are (or touch) the viewport"""
+        if not self.nodes:
+            return
+        pos = self._pos
+        stale = (pos != self._qt_pos).any(axis=1)
+        if not everything and self.view_rect is not None:
+            stale &= self.nodes_near_view()
+
+        nodes = self.nodes
+        idx = np.flatnonzero(stale)
+        self.scattering = True
+        for i, (x, y) in zip(idx.tolist(), pos[idx].tolist()):
+            nodes[i].setPos(x, y)
+        self.scattering = False
+        self._qt_pos[idx] = pos[idx]
+
+    def nodes_near_view(self):
+        """Mask of nodes that are on screen or have an edge crossing the screen"""
+        margin = NODE_CULL_MARGIN
+        rect = self.view_rect.adjusted(-margin, -margin, margin, margin)
+        left, right, top, bottom = rect.left(), rect.right(), rect.top(), rect.bottom()
+
+        x = self._pos[:, 0]
+        y = self._pos[:, 1]
+        near = (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+
+        src, dst = self.edge_src, self.edge_dst
+        crossing = ((np.minimum(x[src], x[dst]) <= right) & (np.maximum(x[src], x[dst]) >= left) &
+                    (np.minimum(y[src], y[dst]) <= bottom) & (np.maximum(y[src], y[dst]) >= top))
+        near[src[crossing]] = True
+        near[dst[crossing]] = True
+        return near
+
+    def wake_physics(self):
+        """Restart the physics timer after the layout was disturbed"""
+        self.drop_snapshot()
+        self.rest_frames = 0
+        if not self.physics_timer.isActive():
+            self.physics_timer.start()
+
+    def visible_physics_job(self, visible):
+        """Physics inputs for visible nodes (and edges between them) only"""
+        idx = np.flatnonzero(visible)
+        remap = np.full(len(visible), -1, dtype=np.int32)
+        remap[idx] = np.arange(len(idx))
+        keep = visible[self.edge_src] & visible[self.edge_dst]
+
+        return idx, (self._pos[idx], self._prev_pos[idx], self._radius[idx], self._gravity[idx],
+                     remap[self.edge_src[keep]], remap[self.edge_dst[keep]], self._movable[idx])
+
+    def stop_node(self, node):
+        """Zero a node's velocity, e.g. when the user grabs it"""
+        if node.index is not None:
+            self._prev_pos[node.index] = self._pos[node.index]
+
+    def build_physics_arrays(self):
+        """Pack node sizes, gravity and edge endpoints into NumPy arrays"""
+        # Any step still running on the worker belongs to the old arrays
+        self.physics_generation += 1
+        # Per-node state lives in one contiguous float64 array per field (SoA),
+        # indexed by node.index; the kernels never touch the Node objects
+        for i, node in enumerate(self.nodes):
+            node.index = i
+
+        self._radius = np.array([node.normal_size / 2 for node in self.nodes], dtype=float)
+        self._gravity = np.array(
+            [BASE_GRAVITY + node.centrality * CENTRALITY_GRAVITY for node in self.nodes], dtype=float
+        )
+        # Edges as parallel index arrays; listing them node by node keeps them
+        # grouped by source, so out_offsets slices both arrays (CSR)
+        n = len(self.nodes)
+        edges = [edge for node in self.nodes for edge in node.outgoing_edges]
+        self.edges_by_index = edges
+        self.edge_src = np.array([edge.source.index for edge in edges], dtype=np.int32)
+        self.edge_dst = np.array([edge.dest.index for edge in edges], dtype=np.int32)
+        self.out_offsets = np.zeros(n + 1, dtype=np.int32)
+        self.out_offsets[1:] = np.cumsum(np.bincount(self.edge_src, minlength=n))
+        self.out_neighbors = self.edge_dst
+        # Incoming edges: edge indices sorted by destination
+        self.in_edges = np.argsort(self.edge_dst, kind='stable').astype(np.int32)
+        self.in_offsets = np.zeros(n + 1, dtype=np.int32)
+        self.in_offsets[1:] = np.cumsum(np.bincount(self.edge_dst, minlength=n))
+
+        out_offsets = self.out_offsets.tolist()
+        in_offsets = self.in_offsets.tolist()
+        in_edges = self.in_edges.tolist()
+        for i, node in enumerate(self.nodes):
+            node.all_edges = (edges[out_offsets[i]:out_offsets[i + 1]] +
+                              [edges[k] for k in in_edges[in_offsets[i]:in_offsets[i + 1]]])
+        self._pos = np.array([(node.x(), node.y()) for node in self.nodes], dtype=float).reshape(-1, 2)
+        self._qt_pos = self._pos.copy()  # Last position handed to (or read from) each item
+        self._prev_pos = self._pos.copy()  # Verlet: velocity is pos - prev_pos
+        self.moved_items = set()
+        self._visible = np.ones(len(self.nodes), dtype=bool)
+        self._movable = np.ones(len(self.nodes), dtype=bool)
+        self.dirty_edges = set()
 
     def setup_graph(self):
         self.scene.clear()
         self.nodes = []
+        self.nodes_by_id = {}
+        self.edges_by_pair = {}
+        self.graph_size = 0
 
         # 1. Get Graph Data
         if self.matrix:
@@ -837,14 +1469,11 @@ class NetworkGraph(QGraphicsView):
 
         num_nodes = len(matrix)
         if num_nodes == 0: return
+        # The backend hands out its live matrix, so remember the size built for
+        self.graph_size = num_nodes
 
         ## 2. Calculate Influence
-        scores = {}
-        if self.main_window:
-            try:
-                scores = self.main_window.app.network.calculate_influence()
-            except AttributeError:
-                scores = {i: 0.0 for i in range(num_nodes)}
+        scores = self.influence_scores(num_nodes)
 
         # 3. Create Nodes
         # Layout Logic: 1 Node = Center, >1 Nodes = Circle
@@ -875,47 +1504,211 @@ class NetworkGraph(QGraphicsView):
             if node.is_valid:
                 self.scene.addItem(node)
                 self.nodes.append(node)
+                self.nodes_by_id[node.id] = node
                 node.setPos(x, y)
 
         # 4. Create Edges
-        for i in range(num_nodes):
-            for j in range(num_nodes):
-                if matrix[i][j] == 1:
-                    n1 = next((n for n in self.nodes if n.id == i), None)
-                    n2 = next((n for n in self.nodes if n.id == j), None)
+        for i, j in matrix_edges(matrix):
+            n1 = self.nodes_by_id.get(i)
+            n2 = self.nodes_by_id.get(j)
 
-                    if n1 and n2:
-                        edge = DirectedEdge(n1, n2)
-                        self.scene.addItem(edge)
-                        n1.outgoing_edges.append(edge)
-                        n2.incoming_edges.append(edge)
+            if n1 and n2:
+                edge = DirectedEdge(n1, n2)
+                self.scene.addItem(edge)
+                n1.outgoing_edges.append(edge)
+                n2.incoming_edges.append(edge)
+                self.edges_by_pair[(i, j)] = edge
 
         # 5. Reset Z-Values so nodes stay above edges
         for node in self.nodes:
             node.setZValue(0)
 
+        self.build_physics_arrays()
+        self.wake_physics()
+
+    def influence_scores(self, num_nodes):
+        scores = {}
+        if self.main_window:
+            try:
+                scores = self.main_window.app.network.calculate_influence()
+            except AttributeError:
+                scores = {i: 0.0 for i in range(num_nodes)}
+        return scores
+
+    def update_graph_in_place(self, matrix):
+        """Apply a new matrix to the existing items, keeping the layout.
+
+        Only works while the set of users is unchanged; returns False when the
+        graph has to be rebuilt instead.
+        """
+        if not self.nodes or len(matrix) != self.graph_size:
+            return False
+        app = self.main_window.app
+        users = {i: app.search_user_by_id(i) for i in range(len(matrix))}
+        if {i for i, user in users.items() if user} != self.nodes_by_id.keys():
+            return False
+
+        # Bring off-screen items up to date: the arrays are rebuilt from them
+        self.scatter_positions(everything=True)
+        self.matrix = matrix
+
+        pairs = {(i, j) for i, j in matrix_edges(matrix) if i in self.nodes_by_id and j in self.nodes_by_id}
+        for pair in self.edges_by_pair.keys() - pairs:
+            edge = self.edges_by_pair.pop(pair)
+            edge.source.outgoing_edges.remove(edge)
+            edge.dest.incoming_edges.remove(edge)
+            self.scene.removeItem(edge)
+        added = []
+        for i, j in sorted(pairs - self.edges_by_pair.keys()):
+            n1, n2 = self.nodes_by_id[i], self.nodes_by_id[j]
+            edge = DirectedEdge(n1, n2)
+            self.scene.addItem(edge)
+            n1.outgoing_edges.append(edge)
+            n2.incoming_edges.append(edge)
+            self.edges_by_pair[(i, j)] = edge
+            added.append(edge)
+
+        scores = self.influence_scores(len(matrix))
+        for node in self.nodes:
+            node.set_profile(users[node.id])
+            score = scores.get(node.id, 0.0)
+            if score != node.centrality:
+                node.set_centrality(score)
+                # Arrow tips sit on the node's rim
+                added.extend(node.incoming_edges)
+
+        self.build_physics_arrays()
+        for edge in added:
+            edge.update_position()
+        self.wake_physics()
+        return True
+
     def animate_nodes(self):
         if self.animation_step >= self.total_steps:
             self.timer.stop()
             return
-        t = (self.animation_step + 1) / self.total_steps
-        if t < 1: t = 1 - math.pow(1 - t, 3)
-        for node, start, end in zip(self.nodes, self.initial_positions, self.final_positions):
-            node.setPos(start.x() * (1 - t) + end.x() * t, start.y() * (1 - t) + end.y() * t)
-            if self.animation_step < 20:
-                node.setOpacity(self.animation_step / 20)
+        step = self.animation_step
+        if step == 0:
+            self.animation_deltas = [(end.x() - start.x(), end.y() - start.y())
+                                     for start, end in zip(self.initial_positions, self.final_positions)]
+        ease = ease_out_cubic_table(self.total_steps)
+        t = ease[step + 1]
+        frame = t - ease[step]
+        last = step + 1 == self.total_steps
+        for node, start, (dx, dy) in zip(self.nodes, self.initial_positions, self.animation_deltas):
+            # Skip moves under half a pixel, except on the last frame
+            if last or (abs(dx) + abs(dy)) * frame >= 0.5:
+                node.setPos(start.x() + dx * t, start.y() + dy * t)
+            if step < 20:
+                node.setOpacity(step / 20)
         self.animation_step += 1
 
+    def mousePressEvent(self, event):
+        # Panning a settled graph: move one picture instead of repainting every item
+        if (event.button() == Qt.LeftButton and not self.physics_timer.isActive()
+                and self.itemAt(event.position().toPoint()) is None):
+            self.take_snapshot()
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        super().mouseReleaseEvent(event)
+        self.drop_snapshot()
+
+    def take_snapshot(self):
+        """Render the scene once at the current zoom and hide the items behind it"""
+        self.drop_snapshot()
+        rect = self.scene.itemsBoundingRect()
+        ratio = self.viewport().devicePixelRatioF()
+        scale = self.transform().m11() * ratio
+        width, height = math.ceil(rect.width() * scale), math.ceil(rect.height() * scale)
+        if not 0 < width <= SNAPSHOT_MAX_SIZE or not 0 < height <= SNAPSHOT_MAX_SIZE:
+            return
+
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        self.scene.render(painter, QRectF(0, 0, width, height), rect)
+        painter.end()
+        pixmap.setDevicePixelRatio(ratio)
+
+        self.snapshot = pixmap
+        self.snapshot_rect = rect
+        self.snapshot_hidden = [item for item in self.scene.items()
+                                if item.parentItem() is None and item.isVisible()]
+        for item in self.snapshot_hidden:
+            item.setVisible(False)
+
+    def drop_snapshot(self):
+        """Bring the real items back"""
+        if self.snapshot is None:
+            return
+        for item in self.snapshot_hidden:
+            item.setVisible(True)
+        self.snapshot = None
+        self.snapshot_rect = None
+        self.snapshot_hidden = []
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        if self.snapshot is not None:
+            painter.drawPixmap(self.snapshot_rect, self.snapshot, QRectF(self.snapshot.rect()))
+
     def wheelEvent(self, event):
+        self.drop_snapshot()
         zoom = 1.15
         if event.angleDelta().y() > 0:
             self.scale(zoom, zoom)
         else:
             self.scale(1 / zoom, 1 / zoom)
+        self.update_view_rect()
+
+    # --- Node click handlers: return True when the click is consumed ---
+    def update_click_handler(self):
+        if self.path_mode:
+            self.click_handler = self.path_click
+        elif self.rec_mode:
+            self.click_handler = self.rec_click
+        elif self.ai_mode:
+            self.click_handler = self.ai_click
+        else:
+            self.click_handler = self.default_click
+
+    def default_click(self, node):
+        return False
+
+    def path_click(self, node):
+        if self.path_start_node is None:
+            # First Click: Select Start Node
+            self.path_start_node = node
+            self.path_btn.setText("Click End Node")
+            # Highlight this node Green to show selection
+            node.setBrush(QBrush(QColor("#00B894")))
+        else:
+            # Second Click: Select End Node & Calculate
+            self.visualize_path(self.path_start_node, node)
+        return True
+
+    def rec_click(self, node):
+        self.visualize_recommendations(node)
+        return True
+
+    def ai_click(self, node):
+        # Step 1: Select First Node
+        if self.ai_start_node is None:
+            self.ai_start_node = node
+            self.ai_btn.setText("Click User 2")
+            # Highlight Green
+            node.setBrush(QBrush(QColor("#00CEC9")))
+        # Step 2: Select Second Node & Execute (ignore the same node twice)
+        elif self.ai_start_node != node:
+            self.visualize_ai_predictions(self.ai_start_node, node)
+        return True
 
     def toggle_path_mode(self):
         self.path_mode = self.path_btn.isChecked()
         self.path_start_node = None
+        self.update_click_handler()
         self.reset_path_visuals()
 
         if self.path_mode:
@@ -942,16 +1735,15 @@ class NetworkGraph(QGraphicsView):
                 node.setZValue(0)
 
         # 3. Reset Edges
-        for node in self.nodes:
-            for edge in node.outgoing_edges:
-                edge.fade_to(0.7)
+        for edge in self.edges_by_index:
+            edge.fade_to(0.7)
 
-                # --- THE FIX ---
-                # Force the edge back to the background layer
-                edge.setZValue(-1)
-                # ---------------
+            # --- THE FIX ---
+            # Force the edge back to the background layer
+            edge.setZValue(-1)
+            # ---------------
 
-                edge.update_theme()
+            edge.update_theme()
 
     def reset_path_ui(self):
         """Resets the Path Button text and color after animation ends"""
@@ -959,6 +1751,11 @@ class NetworkGraph(QGraphicsView):
         self.update_theme()
         self.reset_path_visuals()
 
+    def graph_items(self):
+        """Every node and edge, without walking labels and overlays in the scene"""
+        yield from self.nodes
+        yield from self.edges_by_index
+
     def visualize_path(self, start_node, end_node):
         if not self.main_window: return
 
@@ -971,16 +1768,15 @@ class NetworkGraph(QGraphicsView):
             return
 
         # 1. Dim Everything Smoothly EXCEPT the Start Node
-        for item in self.scene.items():
-            if isinstance(item, (Node, DirectedEdge)):
-                # --- THE FIX: Skip the Start Node so it stays visible ---
-                if item == start_node:
-                    item.setOpacity(1.0)  # Force full visibility just in case
-                    item.setZValue(10) # Force Start Node above the coming edge (which is Z=5)
-                    continue
-                    # --------------------------------------------------------
+        for item in self.graph_items():
+            # --- THE FIX: Skip the Start Node so it stays visible ---
+            if item is start_node:
+                item.setOpacity(1.0)  # Force full visibility just in case
+                item.setZValue(10) # Force Start Node above the coming edge (which is Z=5)
+                continue
+                # --------------------------------------------------------
 
-                item.fade_to(0.15)
+            item.fade_to(0.15)
 
                 # 2. Setup Animation
         self.current_path_ids = path_ids
@@ -989,7 +1785,7 @@ class NetworkGraph(QGraphicsView):
         # Construct path string
         names = []
         for uid in path_ids:
-            node = next((n for n in self.nodes if n.id == uid), None)
+            node = self.nodes_by_id.get(uid)
             names.append(node.username if node else f"User {uid}")
         self.final_path_str = "Path: " + " ➜ ".join(names)
 
@@ -1003,6 +1799,7 @@ class NetworkGraph(QGraphicsView):
         if self.path_step_index >= len(self.current_path_ids) - 1:
             self.path_btn.setText("Path Found!")
             self.path_mode = False
+            self.update_click_handler()
             self.path_btn.setChecked(False)
 
             # --- DYNAMIC LABEL COLOR ---
@@ -1048,8 +1845,8 @@ class NetworkGraph(QGraphicsView):
         u1 = self.current_path_ids[self.path_step_index]
         u2 = self.current_path_ids[self.path_step_index + 1]
 
-        n1 = next((n for n in self.nodes if n.id == u1), None)
-        n2 = next((n for n in self.nodes if n.id == u2), None)
+        n1 = self.nodes_by_id.get(u1)
+        n2 = self.nodes_by_id.get(u2)
 
         if n1 and n2:
             # --- COLOR SELECTION LOGIC ---
@@ -1066,14 +1863,13 @@ class NetworkGraph(QGraphicsView):
             # -----------------------------
 
             # Animate Edge
-            for edge in n1.outgoing_edges:
-                if edge.dest.id == u2:
-                    edge.setPen(path_pen)
-                    edge.line.setPen(path_pen)
-                    edge.setBrush(QBrush(path_color))
-                    edge.setZValue(5)
-                    edge.fade_to(1.0)
-                    break
+            edge = self.edges_by_pair.get((u1, u2))
+            if edge:
+                edge.setPen(path_pen)
+                edge.line.setPen(path_pen)
+                edge.setBrush(QBrush(path_color))
+                edge.setZValue(5)
+                edge.fade_to(1.0)
 
             # Animate Destination Node
             n2.setZValue(10)
@@ -1086,6 +1882,7 @@ class NetworkGraph(QGraphicsView):
 
     def toggle_rec_mode(self):
         self.rec_mode = self.rec_btn.isChecked()
+        self.update_click_handler()
         self.clear_recommendations()  # Clear any existing lines
 
         # Turn off Path Mode if it's on (avoid conflict)
@@ -1137,28 +1934,28 @@ class NetworkGraph(QGraphicsView):
             self.reset_timer.start(2000)  # Reset in 2s
             return
 
-        recommended_ids = [r[0] for r in recs]
+        # Source and recommended nodes stay fully visible
+        highlighted = {user_node}
+        highlighted.update(self.nodes_by_id[r[0]] for r in recs if r[0] in self.nodes_by_id)
 
         # 4. Apply Visuals (Force Opacity for targets to prevent conflicts)
-        for item in self.scene.items():
-            if isinstance(item, (Node, DirectedEdge)):
-
-                # Case A: Important Nodes (Source or Recommended)
-                if item == user_node or (isinstance(item, Node) and item.id in recommended_ids):
-                    # FORCE Instant visibility (No animation)
-                    item.setOpacity(1.0)
-                    item.setZValue(10)
-                    continue
+        for item in self.graph_items():
+            # Case A: Important Nodes (Source or Recommended)
+            if item in highlighted:
+                # FORCE Instant visibility (No animation)
+                item.setOpacity(1.0)
+                item.setZValue(10)
+                continue
 
-                # Case B: Everyone else
-                # Only animate if it's not already faded
-                if item.opacity() > 0.15:
-                    item.fade_to(0.1)
-                item.setZValue(0)
+            # Case B: Everyone else
+            # Only animate if it's not already faded
+            if item.opacity() > 0.15:
+                item.fade_to(0.1)
+            item.setZValue(0)
 
         # 5. Draw Lines & Labels
         for rec_id, score in recs:
-            target_node = next((n for n in self.nodes if n.id == rec_id), None)
+            target_node = self.nodes_by_id.get(rec_id)
             if target_node:
                 # Line -> Change to PINK (#FD79A8)
                 line = QGraphicsLineItem(user_node.x(), user_node.y(), target_node.x(), target_node.y())
@@ -1180,6 +1977,7 @@ class NetworkGraph(QGraphicsView):
 
         self.rec_btn.setText("Matches Found!")
         self.rec_mode = False
+        self.update_click_handler()
         self.rec_btn.setChecked(False)
 
         # 6. Restart the 5-second timer
@@ -1188,13 +1986,15 @@ class NetworkGraph(QGraphicsView):
     def refresh_graph(self):
         """Reload the graph data from the backend"""
         if self.main_window:
-            # 1. Clear current items
-            self.scene.clear()
-            # 2. Fetch latest matrix from social_network.py
-            self.matrix = self.main_window.app.network.get_graph()
+            # 1. Fetch latest matrix from social_network.py
+            matrix = self.main_window.app.network.get_graph()
             # 2. Debug Print (Optional: Check your console to see if data exists!)
-            print(f"DEBUG: Refreshing Graph. Matrix size: {len(self.matrix)}")
-            # 3. Re-run setup
+            print(f"DEBUG: Refreshing Graph. Matrix size: {len(matrix)}")
+            # 3. Same users as before: only patch what changed, keeping the layout
+            if self.update_graph_in_place(matrix):
+                return
+            # 4. Otherwise re-run setup
+            self.matrix = matrix
             self.setup_graph()
 
     def showEvent(self, event):
@@ -1211,6 +2011,7 @@ class NetworkGraph(QGraphicsView):
 
     def toggle_ai_mode(self):
         self.ai_mode = self.ai_btn.isChecked()
+        self.update_click_handler()
         self.clear_recommendations()
 
         # Reset the selection state
@@ -1220,9 +2021,10 @@ class NetworkGraph(QGraphicsView):
         if self.rec_mode: self.rec_btn.setChecked(False); self.toggle_rec_mode()
 
         if self.ai_mode:
-            # Force retrain to be safe
+            # Force retrain to be safe; runs in the background while the user
+            # picks two nodes, and predict_follow waits for it if needed
             if self.main_window:
-                self.main_window.app.predictor.train_model()
+                self.main_window.app.predictor.warmup()
 
             self.ai_btn.setText("Click User 1")
             self.ai_btn.setStyleSheet(
@@ -1275,6 +2077,7 @@ class NetworkGraph(QGraphicsView):
         # 3. Reset UI
         self.ai_btn.setText("Result Shown")
         self.ai_mode = False
+        self.update_click_handler()
         self.ai_btn.setChecked(False)
         self.ai_start_node = None
         self.update_theme()
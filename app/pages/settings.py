@@ -1,53 +1,199 @@
 # settings.py
-import os
 from PySide6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout,
     QPushButton, QFrame, QLineEdit, QComboBox,
     QScrollArea, QSizePolicy, QSpacerItem, QMessageBox,
-    QDialog, QDialogButtonBox
+    QDialog, QDialogButtonBox, QApplication
 )
-from PySide6.QtGui import QFont, QPixmap
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool
+from app.backend_files import db_manager
+from app.utils.labels import set_text_if_changed
+
+# Colours repeated across the page stylesheet
+_ACCENT = "#6C5CE7"
+_TEXT = "#333"
+_TEXT_MUTED = "#666"
+_DANGER = "#e74c3c"
+_DANGER_DARK = "#c0392b"
+_DIVIDER = "#e0e0e0"
+_INPUT_BORDER = "#ddd"
+
+# One stylesheet for the whole page, applied once in __init__; widgets pick up
+# their rules through setObjectName. The scroll-area reset has the lowest
+# specificity so every named rule below overrides it, and the card rules also
+# match nested QFrames (labels included) as the old per-card sheets did.
+_PAGE_QSS = f"""
+    #settingsScroll, #settingsScroll * {{
+        border: none;
+        background: transparent;
+    }}
+
+    QLabel#pageTitle {{ font-size: 32px; font-weight: bold; color: {_TEXT}; }}
+    QLabel#sectionTitle {{ font-size: 20px; font-weight: bold; color: {_TEXT}; }}
+    QLabel#dangerTitle {{ font-size: 20px; font-weight: bold; color: {_DANGER}; }}
+    QLabel#fieldLabel {{ font-size: 16px; color: {_TEXT_MUTED}; width: 120px; }}
+    QLabel#fieldValue {{ font-size: 16px; color: {_TEXT}; font-weight: 500; }}
+    QLabel#hintLabel {{ font-size: 14px; color: {_TEXT_MUTED}; }}
+    QLabel#themeTitle {{ font-size: 16px; font-weight: bold; color: {_TEXT}; }}
+    QLabel#warningText {{ font-size: 14px; color: {_TEXT_MUTED}; line-height: 1.5; }}
+    QLabel#dialogLabel {{ font-size: 14px; color: {_TEXT}; font-weight: bold; }}
+    QLabel#dangerLabel {{ font-size: 14px; color: {_TEXT_MUTED}; margin-top: 10px; }}
+    QLabel#warningIcon {{ font-size: 48px; }}
+    QLabel#dialogWarningText {{ font-size: 14px; color: {_TEXT}; line-height: 1.5; }}
+
+    /* Sections are divided by a bottom border rather than separate HLine widgets */
+    QFrame#SettingsSection {{ border-bottom: 1px solid {_DIVIDER}; }}
+
+    /* Cards share their shape; only the colours differ */
+    QFrame#settingsCard, QFrame#settingsCard QFrame,
+    QFrame#dangerCard, QFrame#dangerCard QFrame {{
+        border-radius: 12px;
+        padding: 20px;
+    }}
+    QFrame#settingsCard, QFrame#settingsCard QFrame {{ background-color: #f8f9fa; }}
+    QFrame#dangerCard, QFrame#dangerCard QFrame {{
+        background-color: #fff5f5;
+        border: 2px solid #ffebee;
+    }}
+    QFrame#settingsCard QFrame#themeCard, QFrame#themeCard QFrame {{
+        background-color: white;
+        border-radius: 10px;
+        padding: 15px;
+        border: 1px solid {_DIVIDER};
+    }}
+
+    QPushButton#sectionToggle, QPushButton#dangerToggle {{
+        background-color: transparent;
+        border: none;
+        text-align: left;
+        font-size: 20px;
+        font-weight: bold;
+        color: {_TEXT};
+    }}
+    QPushButton#sectionToggle {{ border-bottom: 1px solid {_DIVIDER}; }}
+    QPushButton#dangerToggle {{ color: {_DANGER}; }}
+    QPushButton#sectionToggle:hover, QPushButton#dangerToggle:hover {{ color: {_ACCENT}; }}
+
+    QPushButton#outlineBtn {{
+        background-color: transparent;
+        border: 2px solid {_ACCENT};
+        color: {_ACCENT};
+        border-radius: 8px;
+        font-size: 14px;
+        font-weight: bold;
+    }}
+    QPushButton#outlineBtn:hover {{
+        background-color: {_ACCENT};
+        color: white;
+    }}
+
+    QPushButton#primaryBtn {{
+        background-color: {_ACCENT};
+        color: white;
+        border-radius: 8px;
+        font-size: 16px;
+        font-weight: bold;
+        border: none;
+    }}
+    QPushButton#primaryBtn:hover {{ background-color: #5A4FD8; }}
+    QPushButton#primaryBtn:disabled {{
+        background-color: #ccc;
+        color: {_TEXT_MUTED};
+    }}
+
+    QPushButton#themeBtn {{
+        background-color: transparent;
+        border: 2px solid {_ACCENT};
+        border-radius: 25px;
+        font-size: 24px;
+    }}
+    QPushButton#themeBtn:hover {{ background-color: #f0f0f0; }}
+
+    QPushButton#dangerBtn {{
+        background-color: {_DANGER};
+        color: white;
+        border-radius: 8px;
+        font-size: 16px;
+        font-weight: bold;
+        border: none;
+    }}
+    QPushButton#dangerBtn:hover {{ background-color: {_DANGER_DARK}; }}
+    QPushButton#dangerBtn:pressed {{ background-color: #a93226; }}
+
+    QPushButton#deleteConfirmBtn {{
+        background-color: {_DANGER};
+        color: white;
+        font-weight: bold;
+        padding: 8px 20px;
+    }}
+    QPushButton#deleteConfirmBtn:hover {{ background-color: {_DANGER_DARK}; }}
+
+    QLineEdit#passwordInput {{
+        padding: 12px;
+        border: 1px solid {_INPUT_BORDER};
+        border-radius: 8px;
+        font-size: 14px;
+        background-color: white;
+    }}
+    QLineEdit#passwordInput:focus {{ border: 2px solid {_ACCENT}; }}
+
+    QLineEdit#dialogInput {{
+        padding: 10px;
+        border: 1px solid {_INPUT_BORDER};
+        border-radius: 6px;
+        font-size: 14px;
+    }}
+    QLineEdit#dialogInput:focus {{ border: 2px solid {_ACCENT}; }}
+
+    QLineEdit#dangerInput {{
+        padding: 10px;
+        border: 2px solid {_DANGER};
+        border-radius: 6px;
+        font-size: 14px;
+    }}
+    QLineEdit#dangerInput:focus {{ border: 2px solid {_DANGER_DARK}; }}
+"""
+
+class AuthSignals(QObject):
+    done = Signal(object)
+
+
+class AuthTask(QRunnable):
+    """Runs db_manager.authenticate_user on a pool thread and emits the result,
+    or None if it raises, so the wait cursor and pending flag are always cleared"""
+
+    def __init__(self, username, password):
+        super().__init__()
+        self.username = username
+        self.password = password
+        self.signals = AuthSignals()
 
-# ---------- SAFE IMAGE PATH ----------
-BASE_DIR = os.path.abspath(
-    os.path.join(os.path.dirname(__file__), "..", "..")
-)
-IMAGE_DIR = os.path.join(BASE_DIR, "resources", "images")
+    def run(self):
+        try:
+            user_data = db_manager.authenticate_user(self.username, self.password)
+        except Exception as e:
+            print(f"Error checking password: {e}")
+            user_data = None
+        self.signals.done.emit(user_data)
 
 
 class SettingsPage(QWidget):
-    # Signal to notify main window about theme change
-    theme_changed = Signal(str)
+    """Account settings. Built in Python like the other pages; only the top bar
+    and the section headers exist up front, each section is built on first expand."""
 
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
-        self.load_logos()
+        # Signals of password checks still running on the thread pool
+        self.auth_signals = set()
+        # Input dialogs by title, built on first use and reused afterwards
+        self.input_dialogs = {}
+        self.password_check_pending = False
+        self.setStyleSheet(_PAGE_QSS)
         self.build_ui()
         self.apply_theme()
 
-    def load_logos(self):
-        """Load theme icons like login page"""
-        light_path = os.path.join(IMAGE_DIR, "logo_light.png")
-        dark_path = os.path.join(IMAGE_DIR, "logo_dark.png")
-
-        self.light_logo = QPixmap(light_path)
-        self.dark_logo = QPixmap(dark_path)
-
-        if self.light_logo.isNull():
-            print("❌ Light logo missing:", light_path)
-        if self.dark_logo.isNull():
-            print("❌ Dark logo missing:", dark_path)
-
-        # Scale logos for settings page if needed
-        self.light_logo = self.light_logo.scaled(
-            120, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-        self.dark_logo = self.dark_logo.scaled(
-            120, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        )
-
     def build_ui(self):
         # Main layout
         main_layout = QVBoxLayout()
@@ -60,28 +206,16 @@ class SettingsPage(QWidget):
         # Back button
         back_btn = QPushButton("← Back")
         back_btn.setFixedSize(80, 35)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #6C5CE7;
-                border: 2px solid #6C5CE7;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #6C5CE7;
-                color: white;
-            }
-        """)
+        back_btn.setObjectName("outlineBtn")
         back_btn.clicked.connect(self.go_to_home)
         top_layout.addWidget(back_btn)
 
         top_layout.addStretch()
+        main_layout.addLayout(top_layout)
 
         # Title
         title_label = QLabel("Settings")
-        title_label.setStyleSheet("font-size: 32px; font-weight: bold; color: #333;")
+        title_label.setObjectName("pageTitle")
         title_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title_label)
 
@@ -89,53 +223,30 @@ class SettingsPage(QWidget):
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll_area.setStyleSheet("border: none; background: transparent;")
+        scroll_area.setObjectName("settingsScroll")
 
         # Container widget
         container = QWidget()
         container_layout = QVBoxLayout()
         container_layout.setSpacing(30)
 
-        home_btn = QPushButton("Back")
-        home_btn.setFixedSize(140, 42)
-        home_btn.clicked.connect(self.go_to_home)
-        main_layout.addWidget(home_btn)
-
-        self.setLayout(main_layout)
-
-        # ========== PERSONAL INFORMATION SECTION ==========
-        personal_info_section = self.create_personal_info_section()
-        container_layout.addWidget(personal_info_section)
-
-        # Add separator line
-        separator1 = QFrame()
-        separator1.setFrameShape(QFrame.HLine)
-        separator1.setStyleSheet("background-color: #e0e0e0;")
-        container_layout.addWidget(separator1)
-
-        # ========== CHANGE PASSWORD SECTION ==========
-        password_section = self.create_password_section()
-        container_layout.addWidget(password_section)
-
-        # Add separator line
-        separator2 = QFrame()
-        separator2.setFrameShape(QFrame.HLine)
-        separator2.setStyleSheet("background-color: #e0e0e0;")
-        container_layout.addWidget(separator2)
-
-        # ========== PREFERENCES SECTION ==========
-        preferences_section = self.create_preferences_section()
-        container_layout.addWidget(preferences_section)
-
-        # Add separator line
-        separator3 = QFrame()
-        separator3.setFrameShape(QFrame.HLine)
-        separator3.setStyleSheet("background-color: #e0e0e0;")
-        container_layout.addWidget(separator3)
-
-        # ========== DANGER ZONE SECTION ==========
-        danger_zone_section = self.create_danger_zone_section()
-        container_layout.addWidget(danger_zone_section)
+        # Sections are built on first expand; until then each is a header button
+        self.name_value = self.email_value = self.theme_btn = None
+        self.built_sections = set()
+        sections = [
+            ("Personal Information", self.create_personal_info_section),
+            ("Change Password", self.create_password_section),
+            ("Preferences", self.create_preferences_section),
+            ("Danger Zone", self.create_danger_zone_section),
+        ]
+        for title, create_section in sections:
+            placeholder = QPushButton(f"{title} ▸")
+            placeholder.setObjectName("dangerToggle" if title == "Danger Zone" else "sectionToggle")
+            placeholder.clicked.connect(
+                lambda _=False, p=placeholder, t=title, c=create_section:
+                    self.expand_section(container_layout, p, t, c)
+            )
+            container_layout.addWidget(placeholder)
 
         container_layout.addStretch()
         container.setLayout(container_layout)
@@ -144,26 +255,37 @@ class SettingsPage(QWidget):
         main_layout.addWidget(scroll_area)
         self.setLayout(main_layout)
 
+    def expand_section(self, layout, placeholder, title, create_section):
+        """Swap a section's header button for the real section, building it once"""
+        if title in self.built_sections:
+            return
+        self.built_sections.add(title)
+        # The page is on screen here, so hold repaints until the swap is done
+        container = placeholder.parentWidget()
+        container.setUpdatesEnabled(False)
+        try:
+            section = create_section()
+            layout.replaceWidget(placeholder, section)
+            placeholder.deleteLater()
+            self.update_theme_button()
+        finally:
+            container.setUpdatesEnabled(True)
+
     def create_personal_info_section(self):
         """Create the Personal Information section"""
         section_frame = QFrame()
+        section_frame.setObjectName("SettingsSection")
         section_layout = QVBoxLayout()
         section_layout.setSpacing(15)
 
         # Section title
         title_label = QLabel("Personal Information")
-        title_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #333;")
+        title_label.setObjectName("sectionTitle")
         section_layout.addWidget(title_label)
 
         # User information card
         info_card = QFrame()
-        info_card.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        info_card.setObjectName("settingsCard")
         info_layout = QVBoxLayout()
         info_layout.setSpacing(15)
 
@@ -176,64 +298,10 @@ class SettingsPage(QWidget):
             user_name = "Guest User"
             user_email = "guest@example.com"
 
-        # Name field
-        name_layout = QHBoxLayout()
-        name_label = QLabel("Name")
-        name_label.setStyleSheet("font-size: 16px; color: #666; width: 120px;")
-        self.name_value = QLabel(user_name)
-        self.name_value.setStyleSheet("font-size: 16px; color: #333; font-weight: 500;")
-        change_name_btn = QPushButton("Change")
-        change_name_btn.setFixedSize(80, 35)
-        change_name_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 2px solid #6C5CE7;
-                color: #6C5CE7;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #6C5CE7;
-                color: white;
-            }
-        """)
-        change_name_btn.clicked.connect(self.change_name)
-
-        name_layout.addWidget(name_label)
-        name_layout.addWidget(self.name_value)
-        name_layout.addStretch()
-        name_layout.addWidget(change_name_btn)
+        # Name and email fields
+        name_layout, self.name_value = self.make_value_row("Name", user_name, self.change_name)
         info_layout.addLayout(name_layout)
-
-        # Email field
-        email_layout = QHBoxLayout()
-        email_label = QLabel("Email")
-        email_label.setStyleSheet("font-size: 16px; color: #666; width: 120px;")
-        self.email_value = QLabel(user_email)
-        self.email_value.setStyleSheet("font-size: 16px; color: #333; font-weight: 500;")
-        change_email_btn = QPushButton("Change")
-        change_email_btn.setFixedSize(80, 35)
-        change_email_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 2px solid #6C5CE7;
-                color: #6C5CE7;
-                border-radius: 8px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #6C5CE7;
-                color: white;
-            }
-        """)
-        change_email_btn.clicked.connect(self.change_email)
-
-        email_layout.addWidget(email_label)
-        email_layout.addWidget(self.email_value)
-        email_layout.addStretch()
-        email_layout.addWidget(change_email_btn)
+        email_layout, self.email_value = self.make_value_row("Email", user_email, self.change_email)
         info_layout.addLayout(email_layout)
 
         info_card.setLayout(info_layout)
@@ -242,123 +310,59 @@ class SettingsPage(QWidget):
         section_frame.setLayout(section_layout)
         return section_frame
 
+    def make_value_row(self, label, value, on_change):
+        """Build a "label  value  [Change]" row; returns (layout, value label)"""
+        row = QHBoxLayout()
+        name_label = QLabel(label)
+        name_label.setObjectName("fieldLabel")
+        value_label = QLabel(value)
+        value_label.setObjectName("fieldValue")
+        change_btn = QPushButton("Change")
+        change_btn.setFixedSize(80, 35)
+        change_btn.setObjectName("outlineBtn")
+        change_btn.clicked.connect(on_change)
+
+        row.addWidget(name_label)
+        row.addWidget(value_label)
+        row.addStretch()
+        row.addWidget(change_btn)
+        return row, value_label
+
     def create_password_section(self):
         """Create the Change Password section"""
         section_frame = QFrame()
+        section_frame.setObjectName("SettingsSection")
         section_layout = QVBoxLayout()
         section_layout.setSpacing(15)
 
         # Section title
         title_label = QLabel("Change Password")
-        title_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #333;")
+        title_label.setObjectName("sectionTitle")
         section_layout.addWidget(title_label)
 
         # Password form
         form_card = QFrame()
-        form_card.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        form_card.setObjectName("settingsCard")
         form_layout = QVBoxLayout()
         form_layout.setSpacing(15)
 
-        # Old password
-        old_pass_layout = QVBoxLayout()
-        old_pass_layout.setSpacing(8)
-        old_pass_label = QLabel("Old Password")
-        old_pass_label.setStyleSheet("font-size: 14px; color: #666;")
-        self.old_password_input = QLineEdit()
-        self.old_password_input.setPlaceholderText("Enter your current password")
-        self.old_password_input.setEchoMode(QLineEdit.Password)
-        self.old_password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                font-size: 14px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #6C5CE7;
-            }
-        """)
-        old_pass_layout.addWidget(old_pass_label)
-        old_pass_layout.addWidget(self.old_password_input)
+        # Old, new and confirm password fields
+        old_pass_layout, self.old_password_input = self.make_password_field(
+            "Old Password", "Enter your current password")
         form_layout.addLayout(old_pass_layout)
-
-        # New password
-        new_pass_layout = QVBoxLayout()
-        new_pass_layout.setSpacing(8)
-        new_pass_label = QLabel("New Password")
-        new_pass_label.setStyleSheet("font-size: 14px; color: #666;")
-        self.new_password_input = QLineEdit()
-        self.new_password_input.setPlaceholderText("Enter your new password")
-        self.new_password_input.setEchoMode(QLineEdit.Password)
-        self.new_password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                font-size: 14px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #6C5CE7;
-            }
-        """)
-        new_pass_layout.addWidget(new_pass_label)
-        new_pass_layout.addWidget(self.new_password_input)
+        new_pass_layout, self.new_password_input = self.make_password_field(
+            "New Password", "Enter your new password")
         form_layout.addLayout(new_pass_layout)
-
-        # Confirm new password
-        confirm_pass_layout = QVBoxLayout()
-        confirm_pass_layout.setSpacing(8)
-        confirm_pass_label = QLabel("Confirm New Password")
-        confirm_pass_label.setStyleSheet("font-size: 14px; color: #666;")
-        self.confirm_password_input = QLineEdit()
-        self.confirm_password_input.setPlaceholderText("Re-enter your new password")
-        self.confirm_password_input.setEchoMode(QLineEdit.Password)
-        self.confirm_password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 12px;
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                font-size: 14px;
-                background-color: white;
-            }
-            QLineEdit:focus {
-                border: 2px solid #6C5CE7;
-            }
-        """)
-        confirm_pass_layout.addWidget(confirm_pass_label)
-        confirm_pass_layout.addWidget(self.confirm_password_input)
+        confirm_pass_layout, self.confirm_password_input = self.make_password_field(
+            "Confirm New Password", "Re-enter your new password")
         form_layout.addLayout(confirm_pass_layout)
 
         # Save button
-        save_pass_btn = QPushButton("Save Changes")
-        save_pass_btn.setFixedHeight(40)
-        save_pass_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6C5CE7;
-                color: white;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: bold;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #5A4FD8;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-                color: #666;
-            }
-        """)
-        save_pass_btn.clicked.connect(self.change_password)
-        form_layout.addWidget(save_pass_btn)
+        self.save_pass_btn = QPushButton("Save Changes")
+        self.save_pass_btn.setFixedHeight(40)
+        self.save_pass_btn.setObjectName("primaryBtn")
+        self.save_pass_btn.clicked.connect(self.change_password)
+        form_layout.addWidget(self.save_pass_btn)
 
         form_card.setLayout(form_layout)
         section_layout.addWidget(form_card)
@@ -366,47 +370,49 @@ class SettingsPage(QWidget):
         section_frame.setLayout(section_layout)
         return section_frame
 
+    def make_password_field(self, label, placeholder):
+        """Build a labelled password input; returns (layout, line edit)"""
+        field_layout = QVBoxLayout()
+        field_layout.setSpacing(8)
+        field_label = QLabel(label)
+        field_label.setObjectName("hintLabel")
+        field_input = QLineEdit()
+        field_input.setPlaceholderText(placeholder)
+        field_input.setEchoMode(QLineEdit.Password)
+        field_input.setObjectName("passwordInput")
+        field_layout.addWidget(field_label)
+        field_layout.addWidget(field_input)
+        return field_layout, field_input
+
     def create_preferences_section(self):
         """Create the Preferences section with theme toggle"""
         section_frame = QFrame()
+        section_frame.setObjectName("SettingsSection")
         section_layout = QVBoxLayout()
         section_layout.setSpacing(15)
 
         # Section title
         title_label = QLabel("Preferences")
-        title_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #333;")
+        title_label.setObjectName("sectionTitle")
         section_layout.addWidget(title_label)
 
         # Preferences card
         pref_card = QFrame()
-        pref_card.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-radius: 12px;
-                padding: 20px;
-            }
-        """)
+        pref_card.setObjectName("settingsCard")
         pref_layout = QVBoxLayout()
         pref_layout.setSpacing(20)
 
         # Theme preference with icon like login page
         theme_card = QFrame()
-        theme_card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 10px;
-                padding: 15px;
-                border: 1px solid #e0e0e0;
-            }
-        """)
+        theme_card.setObjectName("themeCard")
         theme_card_layout = QHBoxLayout()
 
         # Theme label
         theme_label_layout = QVBoxLayout()
         theme_title = QLabel("Theme")
-        theme_title.setStyleSheet("font-size: 16px; font-weight: bold; color: #333;")
+        theme_title.setObjectName("themeTitle")
         theme_desc = QLabel("Change between light and dark mode")
-        theme_desc.setStyleSheet("font-size: 14px; color: #666;")
+        theme_desc.setObjectName("hintLabel")
         theme_label_layout.addWidget(theme_title)
         theme_label_layout.addWidget(theme_desc)
 
@@ -416,17 +422,7 @@ class SettingsPage(QWidget):
         # Theme toggle button (like login page)
         self.theme_btn = QPushButton("🌙")
         self.theme_btn.setFixedSize(50, 50)
-        self.theme_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 2px solid #6C5CE7;
-                border-radius: 25px;
-                font-size: 24px;
-            }
-            QPushButton:hover {
-                background-color: #f0f0f0;
-            }
-        """)
+        self.theme_btn.setObjectName("themeBtn")
         self.theme_btn.clicked.connect(self.toggle_theme)
         theme_card_layout.addWidget(self.theme_btn)
 
@@ -447,19 +443,12 @@ class SettingsPage(QWidget):
 
         # Section title in red
         title_label = QLabel("Danger Zone")
-        title_label.setStyleSheet("font-size: 20px; font-weight: bold; color: #e74c3c;")
+        title_label.setObjectName("dangerTitle")
         section_layout.addWidget(title_label)
 
         # Danger zone card with red accent
         danger_card = QFrame()
-        danger_card.setStyleSheet("""
-            QFrame {
-                background-color: #fff5f5;
-                border-radius: 12px;
-                padding: 20px;
-                border: 2px solid #ffebee;
-            }
-        """)
+        danger_card.setObjectName("dangerCard")
         danger_layout = QVBoxLayout()
         danger_layout.setSpacing(15)
 
@@ -469,28 +458,13 @@ class SettingsPage(QWidget):
             "connections will be removed and cannot be recovered."
         )
         warning_text.setWordWrap(True)
-        warning_text.setStyleSheet("font-size: 14px; color: #666; line-height: 1.5;")
+        warning_text.setObjectName("warningText")
         danger_layout.addWidget(warning_text)
 
         # Delete account button
         delete_account_btn = QPushButton("Delete Account")
         delete_account_btn.setFixedHeight(40)
-        delete_account_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: bold;
-                border: none;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
+        delete_account_btn.setObjectName("dangerBtn")
         delete_account_btn.clicked.connect(self.delete_account)
         danger_layout.addWidget(delete_account_btn)
 
@@ -500,186 +474,173 @@ class SettingsPage(QWidget):
         section_frame.setLayout(section_layout)
         return section_frame
 
+    def run_auth(self, username, password, on_done):
+        """Authenticate on the global thread pool; on_done(user_data) runs on the GUI thread"""
+        task = AuthTask(username, password)
+        signals = task.signals
+        self.auth_signals.add(signals)
+
+        def finish(user_data):
+            self.auth_signals.discard(signals)
+            QApplication.restoreOverrideCursor()
+            on_done(user_data)
+
+        # The signals object lives on the GUI thread, so the result is queued back here
+        signals.done.connect(finish)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        QThreadPool.globalInstance().start(task)
+
+    def input_dialog(self, title, size, header, fields, label_name="dialogLabel",
+                     input_name="dialogInput", ok_text=None, ok_name=None):
+        """Run a modal dialog with a header and one labelled line edit per field.
+
+        The header is either text for a hint label or a callable returning a
+        layout. Each field is (label, placeholder, initial text, echo mode).
+        Dialogs are built on first use and kept per title; later calls only
+        refresh the header text, placeholders and inputs. Returns the stripped
+        texts in field order, or None if the dialog was cancelled.
+        """
+        cached = self.input_dialogs.get(title)
+        if cached is None:
+            dialog = QDialog(self)
+            dialog.setWindowTitle(title)
+            dialog.setFixedSize(*size)
+
+            layout = QVBoxLayout()
+            if callable(header):
+                header_label = None
+                layout.addLayout(header())
+            else:
+                header_label = QLabel()
+                header_label.setObjectName("hintLabel")
+                layout.addWidget(header_label)
+
+            inputs = []
+            for label, _placeholder, _text, echo in fields:
+                field_label = QLabel(label)
+                field_label.setObjectName(label_name)
+                layout.addWidget(field_label)
+
+                field_input = QLineEdit()
+                field_input.setEchoMode(echo)
+                field_input.setObjectName(input_name)
+                layout.addWidget(field_input)
+                inputs.append(field_input)
+
+            # Buttons
+            button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+            if ok_text:
+                button_box.button(QDialogButtonBox.Ok).setText(ok_text)
+            if ok_name:
+                button_box.button(QDialogButtonBox.Ok).setObjectName(ok_name)
+            button_box.accepted.connect(dialog.accept)
+            button_box.rejected.connect(dialog.reject)
+            layout.addWidget(button_box)
+
+            dialog.setLayout(layout)
+            cached = self.input_dialogs[title] = (dialog, header_label, inputs)
+
+        dialog, header_label, inputs = cached
+        if header_label is not None:
+            header_label.setText(header)
+        for field_input, (_label, placeholder, text, _echo) in zip(inputs, fields):
+            field_input.setPlaceholderText(placeholder)
+            field_input.setText(text)
+
+        if dialog.exec() != QDialog.Accepted:
+            return None
+        return [field_input.text().strip() for field_input in inputs]
+
     def change_name(self):
         """Handle name change with a dialog"""
         current_user = self.main_window.app.get_current_user()
         if not current_user:
             QMessageBox.warning(self, "Error", "No user logged in")
             return
+        current_name = current_user.get_fullname()
 
-        # Create a simple dialog for name change
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Change Name")
-        dialog.setFixedSize(400, 200)
-
-        layout = QVBoxLayout()
-
-        # Current name
-        current_label = QLabel(f"Current Name: {current_user.get_fullname()}")
-        current_label.setStyleSheet("font-size: 14px; color: #666;")
-        layout.addWidget(current_label)
-
-        # New name input
-        new_name_label = QLabel("New Name:")
-        new_name_label.setStyleSheet("font-size: 14px; color: #333; font-weight: bold;")
-        layout.addWidget(new_name_label)
-
-        new_name_input = QLineEdit()
-        new_name_input.setPlaceholderText("Enter your new name")
-        new_name_input.setText(current_user.get_fullname())
-        new_name_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 1px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #6C5CE7;
+        values = self.input_dialog("Change Name", (400, 200), f"Current Name: {current_name}", [
+            ("New Name:", "Enter your new name", current_name, QLineEdit.Normal),
+        ])
+        if values is None:
+            return
+
+        new_name, = values
+        if new_name and new_name != current_name:
+            # Update database through SocialMedia application
+            user_data = {
+                'full_name': new_name
             }
-        """)
-        layout.addWidget(new_name_input)
-
-        # Buttons
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
-        layout.addWidget(button_box)
-
-        dialog.setLayout(layout)
-
-        if dialog.exec() == QDialog.Accepted:
-            new_name = new_name_input.text().strip()
-            if new_name and new_name != current_user.get_fullname():
-                # Update database through SocialMedia application
-                user_data = {
-                    'full_name': new_name
-                }
-
-                # Call update_user_profile method from SocialMedia
-                success, message = self.main_window.app.update_user_profile(user_data)
-
-                if success:
-                    QMessageBox.information(self, "Success", "Name updated successfully!")
-                    # Refresh the displayed name
-                    self.name_value.setText(new_name)
-                    # Also update the main window if needed
-                    if hasattr(self.main_window, 'update_user_display'):
-                        self.main_window.update_user_display()
-                else:
-                    QMessageBox.warning(self, "Error", message)
+
+            # Call update_user_profile method from SocialMedia
+            success, message = self.main_window.app.update_user_profile(user_data)
+
+            if success:
+                QMessageBox.information(self, "Success", "Name updated successfully!")
+                # Refresh the displayed name
+                self.name_value.setText(new_name)
+                # Also update the main window if needed
+                if hasattr(self.main_window, 'update_user_display'):
+                    self.main_window.update_user_display()
+            else:
+                QMessageBox.warning(self, "Error", message)
 
     def change_email(self):
         """Handle email change with a dialog"""
-        from app.backend_files import db_manager  # Import here to avoid circular imports
-
         current_user = self.main_window.app.get_current_user()
         if not current_user:
             QMessageBox.warning(self, "Error", "No user logged in")
             return
+        current_email = current_user.get_email()
 
-        # Create a dialog for email change
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Change Email")
-        dialog.setFixedSize(400, 250)
-
-        layout = QVBoxLayout()
-
-        # Current email
-        current_label = QLabel(f"Current Email: {current_user.get_email()}")
-        current_label.setStyleSheet("font-size: 14px; color: #666;")
-        layout.addWidget(current_label)
-
-        # New email input
-        new_email_label = QLabel("New Email:")
-        new_email_label.setStyleSheet("font-size: 14px; color: #333; font-weight: bold;")
-        layout.addWidget(new_email_label)
-
-        new_email_input = QLineEdit()
-        new_email_input.setPlaceholderText("Enter your new email address")
-        new_email_input.setText(current_user.get_email())
-        new_email_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 1px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #6C5CE7;
-            }
-        """)
-        layout.addWidget(new_email_input)
-
-        # Confirm password
-        password_label = QLabel("Confirm with Password:")
-        password_label.setStyleSheet("font-size: 14px; color: #333; font-weight: bold;")
-        layout.addWidget(password_label)
-
-        password_input = QLineEdit()
-        password_input.setPlaceholderText("Enter your password to confirm")
-        password_input.setEchoMode(QLineEdit.Password)
-        password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 1px solid #ddd;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #6C5CE7;
-            }
-        """)
-        layout.addWidget(password_input)
-
-        # Buttons
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
-        layout.addWidget(button_box)
-
-        dialog.setLayout(layout)
+        values = self.input_dialog("Change Email", (400, 250), f"Current Email: {current_email}", [
+            ("New Email:", "Enter your new email address", current_email, QLineEdit.Normal),
+            ("Confirm with Password:", "Enter your password to confirm", "", QLineEdit.Password),
+        ])
+        if values is None:
+            return
 
-        if dialog.exec() == QDialog.Accepted:
-            new_email = new_email_input.text().strip()
-            password = password_input.text().strip()
+        new_email, password = values
 
-            if not new_email:
-                QMessageBox.warning(self, "Error", "Please enter a new email address")
-                return
+        if not new_email:
+            QMessageBox.warning(self, "Error", "Please enter a new email address")
+            return
 
-            if not password:
-                QMessageBox.warning(self, "Error", "Please enter your password to confirm")
-                return
+        if not password:
+            QMessageBox.warning(self, "Error", "Please enter your password to confirm")
+            return
 
-            # Verify password using database authentication
-            # We'll authenticate with the current username and password
-            username = current_user.get_username()
-            user_data = db_manager.authenticate_user(username, password)
+        # Verify password using database authentication, then finish the update
+        self.run_auth(current_user.get_username(), password,
+                      lambda user_data: self.finish_change_email(user_data, new_email))
 
-            if not user_data:
-                QMessageBox.warning(self, "Error", "Incorrect password")
-                return
+    def finish_change_email(self, user_data, new_email):
+        """Update the email once the password check has come back"""
+        if not user_data:
+            QMessageBox.warning(self, "Error", "Incorrect password")
+            return
 
-            # Update email through the SocialMedia application
-            user_data = {
-                'email': new_email
-            }
+        # Update email through the SocialMedia application
+        user_data = {
+            'email': new_email
+        }
 
-            # Call update_user_profile method from SocialMedia
-            success, message = self.main_window.app.update_user_profile(user_data)
+        # Call update_user_profile method from SocialMedia
+        success, message = self.main_window.app.update_user_profile(user_data)
 
-            if success:
-                QMessageBox.information(self, "Success", "Email updated successfully!")
-                # Refresh the displayed email
-                self.email_value.setText(new_email)
-            else:
-                QMessageBox.warning(self, "Error", message)
+        if success:
+            QMessageBox.information(self, "Success", "Email updated successfully!")
+            # Refresh the displayed email
+            self.email_value.setText(new_email)
+        else:
+            QMessageBox.warning(self, "Error", message)
 
     def change_password(self):
         """Handle password change using the SocialMedia application methods"""
-        from app.backend_files import db_manager  # Import here to avoid circular imports
+        if self.password_check_pending:
+            return
 
+        # Trimmed once, on submit; nothing runs per keystroke
         old_pass = self.old_password_input.text().strip()
         new_pass = self.new_password_input.text().strip()
         confirm_pass = self.confirm_password_input.text().strip()
@@ -702,10 +663,17 @@ class SettingsPage(QWidget):
             QMessageBox.warning(self, "Error", "No user logged in")
             return
 
-        # First, verify the old password by authenticating
-        username = current_user.get_username()
-        user_data = db_manager.authenticate_user(username, old_pass)
-
+        # First, verify the old password by authenticating; Save stays disabled
+        # until the answer is back so a double click can't start a second check
+        self.password_check_pending = True
+        self.save_pass_btn.setEnabled(False)
+        self.run_auth(current_user.get_username(), old_pass,
+                      lambda user_data: self.finish_change_password(user_data, new_pass))
+
+    def finish_change_password(self, user_data, new_pass):
+        """Save the new password once the old one has been verified"""
+        self.password_check_pending = False
+        self.save_pass_btn.setEnabled(True)
         if not user_data:
             QMessageBox.warning(self, "Error", "Current password is incorrect")
             return
@@ -736,6 +704,8 @@ class SettingsPage(QWidget):
 
     def update_theme_button(self):
         """Update theme button icon based on current mode"""
+        if self.theme_btn is None:
+            return
         if self.main_window.dark_mode:
             self.theme_btn.setText("☀")
         else:
@@ -744,24 +714,41 @@ class SettingsPage(QWidget):
 
     def delete_account(self):
         """Handle account deletion with confirmation dialog"""
-        from app.backend_files import db_manager  # Import here to avoid circular imports
-
         current_user = self.main_window.app.get_current_user()
         if not current_user:
             QMessageBox.warning(self, "Error", "No user logged in")
             return
+        current_username = current_user.get_username()
+
+        # Ask for the username and password before the final confirmation
+        values = self.input_dialog("Delete Account", (500, 300), self.build_delete_warning, [
+            ("Please type your username to confirm:", f"Type '{current_username}' to confirm",
+             "", QLineEdit.Normal),
+            ("Enter your password:", "Enter your password", "", QLineEdit.Password),
+        ], label_name="dangerLabel", input_name="dangerInput",
+            ok_text="Delete Account", ok_name="deleteConfirmBtn")
+        if values is None:
+            return
 
-        # Create a serious confirmation dialog
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Delete Account")
-        dialog.setFixedSize(500, 300)
+        username, password = values
 
-        layout = QVBoxLayout()
+        if username != current_username:
+            QMessageBox.warning(self, "Error", "Username does not match")
+            return
 
+        if not password:
+            QMessageBox.warning(self, "Error", "Please enter your password")
+            return
+
+        # Verify password by authenticating
+        self.run_auth(username, password, self.finish_delete_account)
+
+    def build_delete_warning(self):
+        """Build the warning icon and text shown at the top of the delete dialog"""
         # Warning icon and text
         warning_layout = QHBoxLayout()
         warning_icon = QLabel("⚠️")
-        warning_icon.setStyleSheet("font-size: 48px;")
+        warning_icon.setObjectName("warningIcon")
         warning_layout.addWidget(warning_icon)
 
         warning_text = QLabel(
@@ -770,115 +757,37 @@ class SettingsPage(QWidget):
             "This will permanently delete your account and remove all your data from our servers."
         )
         warning_text.setWordWrap(True)
-        warning_text.setStyleSheet("font-size: 14px; color: #333; line-height: 1.5;")
+        warning_text.setObjectName("dialogWarningText")
         warning_text.setTextFormat(Qt.RichText)
         warning_layout.addWidget(warning_text, 1)
+        return warning_layout
 
-        layout.addLayout(warning_layout)
+    def finish_delete_account(self, user_data):
+        """Ask for final confirmation once the password has been verified"""
+        if not user_data:
+            QMessageBox.warning(self, "Error", "Incorrect password")
+            return
 
-        # Confirmation text
-        confirm_label = QLabel(
-            "Please type your username to confirm:"
+        # Final confirmation
+        reply = QMessageBox.question(
+            self, "Final Confirmation",
+            "This is your last chance to cancel. Are you REALLY sure you want to delete your account?",
+            QMessageBox.Yes | QMessageBox.No,
+            QDialogButtonBox.No
         )
-        confirm_label.setStyleSheet("font-size: 14px; color: #666; margin-top: 20px;")
-        layout.addWidget(confirm_label)
-
-        # Username confirmation
-        username_input = QLineEdit()
-        username_input.setPlaceholderText(f"Type '{current_user.get_username()}' to confirm")
-        username_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #e74c3c;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #c0392b;
-            }
-        """)
-        layout.addWidget(username_input)
-
-        # Password confirmation
-        password_label = QLabel("Enter your password:")
-        password_label.setStyleSheet("font-size: 14px; color: #666; margin-top: 10px;")
-        layout.addWidget(password_label)
-
-        password_input = QLineEdit()
-        password_input.setPlaceholderText("Enter your password")
-        password_input.setEchoMode(QLineEdit.Password)
-        password_input.setStyleSheet("""
-            QLineEdit {
-                padding: 10px;
-                border: 2px solid #e74c3c;
-                border-radius: 6px;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #c0392b;
-            }
-        """)
-        layout.addWidget(password_input)
-
-        # Buttons
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.button(QDialogButtonBox.Ok).setText("Delete Account")
-        button_box.button(QDialogButtonBox.Ok).setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                font-weight: bold;
-                padding: 8px 20px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
-        layout.addWidget(button_box)
-
-        dialog.setLayout(layout)
-
-        if dialog.exec() == QDialog.Accepted:
-            username = username_input.text().strip()
-            password = password_input.text().strip()
-
-            if username != current_user.get_username():
-                QMessageBox.warning(self, "Error", "Username does not match")
-                return
-
-            if not password:
-                QMessageBox.warning(self, "Error", "Please enter your password")
-                return
-
-            # Verify password by authenticating
-            user_data = db_manager.authenticate_user(username, password)
-
-            if not user_data:
-                QMessageBox.warning(self, "Error", "Incorrect password")
-                return
-
-            # Final confirmation
-            reply = QMessageBox.question(
-                self, "Final Confirmation",
-                "This is your last chance to cancel. Are you REALLY sure you want to delete your account?",
-                QMessageBox.Yes | QMessageBox.No,
-                QDialogButtonBox.No
-            )
 
-            if reply == QMessageBox.Yes:
-                QMessageBox.warning(self, "Not Implemented",
-                                    "Account deletion feature is not yet implemented in the backend.")
-                # If you implement delete_account in SocialMedia, uncomment below:
-                # success, message = self.main_window.app.delete_account(current_user.get_id())
-                # if success:
-                #     QMessageBox.information(self, "Account Deleted",
-                #                             "Your account has been deleted successfully. You will be logged out.")
-                #     self.main_window.app.logout()
-                #     self.main_window.go_to_login()
-                # else:
-                #     QMessageBox.warning(self, "Error", message)
+        if reply == QMessageBox.Yes:
+            QMessageBox.warning(self, "Not Implemented",
+                                "Account deletion feature is not yet implemented in the backend.")
+            # If you implement delete_account in SocialMedia, uncomment below:
+            # success, message = self.main_window.app.delete_account(current_user.get_id())
+            # if success:
+            #     QMessageBox.information(self, "Account Deleted",
+            #                             "Your account has been deleted successfully. You will be logged out.")
+            #     self.main_window.app.logout()
+            #     self.main_window.go_to_login()
+            # else:
+            #     QMessageBox.warning(self, "Error", message)
 
     def apply_theme(self):
         """Apply theme based on main window's dark mode setting"""
@@ -895,9 +804,9 @@ class SettingsPage(QWidget):
     def refresh_user_info(self):
         """Refresh displayed user information"""
         current_user = self.main_window.app.get_current_user()
-        if current_user:
-            self.name_value.setText(current_user.get_fullname())
-            self.email_value.setText(current_user.get_email())
+        if current_user and self.name_value is not None:
+            set_text_if_changed(self.name_value, current_user.get_fullname())
+            set_text_if_changed(self.email_value, current_user.get_email())
 
     def go_to_home(self):
         """Navigate back to home page"""
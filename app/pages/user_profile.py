@@ -1,8 +1,71 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QScrollArea, QFrame, QMessageBox, QInputDialog
+    QPushButton, QScrollArea, QFrame, QInputDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QTimer
+
+from app.utils.labels import set_text_if_changed
+
+# Posts are fetched and built this many at a time as the feed is scrolled
+POSTS_PAGE_SIZE = 20
+# Fetch the next page once the scroll bar is this close to the bottom (px)
+POSTS_PREFETCH_MARGIN = 200
+# Follow clicks within this many ms of each other are sent as one request
+FOLLOW_DEBOUNCE_MS = 300
+
+_BACK_BTN_QSS = """
+    QPushButton { border: none; font-weight: bold; color: white; }
+    QPushButton:hover { color: #6C5CE7; }
+"""
+_HEADER_FRAME_QSS = "background: white; border-radius: 15px; border: 1px solid #ddd;"
+_POST_TITLE_QSS = "font-weight: bold; font-size: 18px; margin-top: 10px; color: #2c3e50;"
+_NAME_LBL_QSS = "font-size: 26px; font-weight: bold; color: #2c3e50;"
+_USER_LBL_QSS = "color: #7f8c8d; font-size: 16px; margin-bottom: 15px;"
+_STAT_VAL_QSS = "font-size:20px; font-weight:bold;"
+_STAT_LBL_QSS = "color:#7f8c8d; font-size:12px;"
+_VLINE_QSS = "color: #ccc;"
+_FOLLOW_QSS = """
+    QPushButton { background-color: #6C5CE7; color: white; font-weight: bold; border-radius: 20px; }
+    QPushButton:hover { background-color: #5A4FD8; }
+"""
+_UNFOLLOW_QSS = """
+    QPushButton { background-color: #e74c3c; color: white; font-weight: bold; border-radius: 20px; }
+    QPushButton:hover { background-color: #c0392b; }
+"""
+# Post action button labels
+_LIKE_FMT = "❤️ %d"
+_DISLIKE_FMT = "👎 %d"
+_COMMENT_FMT = "💬 %d"
+
+_POST_FRAME_QSS = "background: white; border-radius: 12px; border: 1px solid #ddd;"
+_POST_BTN_QSS = """
+    QPushButton { border: 1px solid #ddd; border-radius: 5px; padding: 5px 15px; background: white; }
+    QPushButton:hover { background-color: #f0f0f0; border-color: #6C5CE7; color: #6C5CE7; }
+"""
+
+
+class BackendSignals(QObject):
+    done = Signal(object)
+
+
+class BackendTask(QRunnable):
+    """Runs fn(*args) on a pool thread and emits its return value, or failed
+    if it raises, so the caller's pending state is always cleared"""
+
+    def __init__(self, fn, *args, failed=None):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.failed = failed
+        self.signals = BackendSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            print(f"Error in background task {getattr(self.fn, '__name__', self.fn)}: {e}")
+            result = self.failed
+        self.signals.done.emit(result)
 
 
 class UserProfilePage(QWidget):
@@ -11,12 +74,34 @@ class UserProfilePage(QWidget):
         self.main_window = main_window
         self.current_profile_user = None
         self.is_following_user = False
+        # Logged-in user's id, read once per load_user
+        self.viewer_id = None
+        # Comment prompt, built on first use and reused afterwards
+        self.comment_dialog = None
 
         # UI References
         self.followers_val_lbl = None
         self.following_val_lbl = None
         self.follow_btn = None
         self.feed_layout = None
+        # post_id -> post frame in the feed, for in-place counter updates
+        self.post_widgets = {}
+        # Detached post frames, refilled and reused by the next refresh
+        self.post_widget_pool = []
+        self.posts_loaded = 0
+        self.posts_exhausted = True
+        self.posts_pending = False
+        self.follow_pending = False
+        # Follow state the backend is known to hold for the shown profile
+        self.follow_committed = False
+        self.follow_timer = QTimer(self)
+        self.follow_timer.setSingleShot(True)
+        self.follow_timer.setInterval(FOLLOW_DEBOUNCE_MS)
+        self.follow_timer.timeout.connect(self.commit_follow_state)
+        # Bumped whenever the page is rebuilt, so late worker results are dropped
+        self.generation = 0
+        # Signals of running BackendTasks, kept alive until their result arrives
+        self.backend_signals = set()
 
         self.build_ui()
 
@@ -27,10 +112,7 @@ class UserProfilePage(QWidget):
         top_bar = QHBoxLayout()
         back_btn = QPushButton("← Back")
         back_btn.setFixedSize(80, 30)
-        back_btn.setStyleSheet("""
-            QPushButton { border: none; font-weight: bold; color: white; }
-            QPushButton:hover { color: #6C5CE7; }
-        """)
+        back_btn.setStyleSheet(_BACK_BTN_QSS)
         back_btn.clicked.connect(self.go_back)
         top_bar.addWidget(back_btn)
         top_bar.addStretch()
@@ -40,6 +122,10 @@ class UserProfilePage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QScrollArea.NoFrame)
+        self.scroll_bar = scroll.verticalScrollBar()
+        self.scroll_bar.valueChanged.connect(self.maybe_load_more_posts)
+        # A short first page may leave nothing to scroll, so also check on resize
+        self.scroll_bar.rangeChanged.connect(self.maybe_load_more_posts)
 
         container = QWidget()
         self.content_layout = QVBoxLayout(container)
@@ -48,14 +134,14 @@ class UserProfilePage(QWidget):
 
         # Header
         self.header_frame = QFrame()
-        self.header_frame.setStyleSheet("background: white; border-radius: 15px; border: 1px solid #ddd;")
+        self.header_frame.setStyleSheet(_HEADER_FRAME_QSS)
         self.header_layout = QVBoxLayout(self.header_frame)
         self.header_layout.setContentsMargins(30, 30, 30, 30)
         self.content_layout.addWidget(self.header_frame)
 
         # Posts Title
         lbl = QLabel("User Posts")
-        lbl.setStyleSheet("font-weight: bold; font-size: 18px; margin-top: 10px; color: #2c3e50;")
+        lbl.setStyleSheet(_POST_TITLE_QSS)
         self.content_layout.addWidget(lbl)
 
         # Feed
@@ -68,36 +154,78 @@ class UserProfilePage(QWidget):
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
 
+    def run_backend(self, on_done, fn, *args, failed=None):
+        """Call fn(*args) on the global thread pool; on_done(result) runs on the GUI
+        thread, with failed as the result if fn raised"""
+        task = BackendTask(fn, *args, failed=failed)
+        signals = task.signals
+        self.backend_signals.add(signals)
+
+        def finish(result):
+            self.backend_signals.discard(signals)
+            on_done(result)
+
+        # The signals object lives on the GUI thread, so the result is queued back here
+        signals.done.connect(finish)
+        QThreadPool.globalInstance().start(task)
+
     def load_user(self, user_data):
+        # Send a follow click still waiting out its debounce before leaving
+        if self.follow_timer.isActive():
+            self.follow_timer.stop()
+            self.commit_follow_state()
         self.current_profile_user = user_data
 
-        # 1. Fetch fresh Data
+        # 1. Show what the caller passed in straight away and fetch the current
+        # profile behind it (app.get_profile_view is cached, and invalidated by
+        # every follow/unfollow/profile save wherever it happens)
         user_id = user_data['user_id']
-        fresh = self.main_window.app.search_user_by_id(user_id)
-        if fresh: self.current_profile_user = fresh
+        curr = self.main_window.app.get_current_user()
+        self.viewer_id = curr.get_id() if curr else None
 
-        # 2. CHECK FOLLOW STATUS FROM BACKEND (Crucial Fix)
-        self.is_following_user = self.main_window.app.is_following(user_id)
+        # 2. Follow status comes with the get_profile_view dict; the worker
+        # fetch below corrects it when the caller's dict didn't have it
+        self.is_following_user = self.current_profile_user.get('is_following', False)
 
         self.refresh_profile()
+        generation = self.generation
+        self.run_backend(lambda result: self.on_user_loaded(generation, result),
+                         self.main_window.app.get_profile_view, user_id)
+
+    def on_user_loaded(self, generation, fresh):
+        """Swap in the fetched profile and update the header labels in place"""
+        if not fresh: return
+        # Skip if another profile was opened or a follow is still unsent or in flight
+        if generation != self.generation or self.follow_pending: return
+        if self.is_following_user != self.follow_committed: return
+
+        self.current_profile_user = fresh
+        self.is_following_user = self.follow_committed = fresh['is_following']
+        set_text_if_changed(self.followers_val_lbl, str(fresh.get('follower_count', 0)))
+        set_text_if_changed(self.following_val_lbl, str(fresh.get('following_count', 0)))
+        if self.follow_btn: self.update_follow_btn_visuals()
 
     def refresh_profile(self):
         if not self.current_profile_user: return
         user = self.current_profile_user
 
         # Clear
+        self.generation += 1
         self.clear_layout(self.header_layout)
-        self.clear_layout(self.feed_layout)
+        self.release_post_widgets()
+        self.follow_btn = None
+        self.follow_pending = False
+        self.follow_committed = self.is_following_user
 
         # Name
         name_lbl = QLabel(user.get('full_name', 'Unknown'))
         name_lbl.setAlignment(Qt.AlignCenter)
-        name_lbl.setStyleSheet("font-size: 26px; font-weight: bold; color: #2c3e50;")
+        name_lbl.setStyleSheet(_NAME_LBL_QSS)
         self.header_layout.addWidget(name_lbl)
 
         user_lbl = QLabel(f"@{user.get('username', 'unknown')}")
         user_lbl.setAlignment(Qt.AlignCenter)
-        user_lbl.setStyleSheet("color: #7f8c8d; font-size: 16px; margin-bottom: 15px;")
+        user_lbl.setStyleSheet(_USER_LBL_QSS)
         self.header_layout.addWidget(user_lbl)
 
         # Stats
@@ -105,14 +233,14 @@ class UserProfilePage(QWidget):
         stats_box.addStretch()
 
         self.followers_val_lbl = QLabel(str(user.get('follower_count', 0)))
-        self.followers_val_lbl.setStyleSheet("font-size:20px; font-weight:bold;")
+        self.followers_val_lbl.setStyleSheet(_STAT_VAL_QSS)
         self.followers_val_lbl.setAlignment(Qt.AlignCenter)
         stats_box.addLayout(self.make_stat_box(self.followers_val_lbl, "Followers"))
 
         stats_box.addWidget(self.create_vertical_line())
 
         self.following_val_lbl = QLabel(str(user.get('following_count', 0)))
-        self.following_val_lbl.setStyleSheet("font-size:20px; font-weight:bold;")
+        self.following_val_lbl.setStyleSheet(_STAT_VAL_QSS)
         self.following_val_lbl.setAlignment(Qt.AlignCenter)
         stats_box.addLayout(self.make_stat_box(self.following_val_lbl, "Following"))
 
@@ -120,8 +248,7 @@ class UserProfilePage(QWidget):
         self.header_layout.addLayout(stats_box)
 
         # Follow Button
-        curr = self.main_window.app.get_current_user()
-        if curr and curr.get_id() != user['user_id']:
+        if self.viewer_id is not None and self.viewer_id != user['user_id']:
             self.follow_btn = QPushButton()
             self.follow_btn.setFixedSize(140, 40)
             self.follow_btn.clicked.connect(self.toggle_follow)
@@ -133,117 +260,222 @@ class UserProfilePage(QWidget):
             box.addStretch()
             self.header_layout.addLayout(box)
 
-        # Posts
-        posts = self.main_window.app.get_user_posts(user['user_id'])
-        if not posts:
+        # Posts, first page only; the rest load as the feed is scrolled
+        self.posts_loaded = 0
+        self.posts_exhausted = False
+        self.posts_pending = False
+        self.load_more_posts()
+
+    def load_more_posts(self):
+        """Fetch the next page of posts on the thread pool and append it when it arrives"""
+        self.posts_pending = True
+        generation = self.generation
+        self.run_backend(lambda posts: self.on_posts_loaded(generation, posts),
+                         self.main_window.app.get_user_posts,
+                         self.current_profile_user['user_id'], self.posts_loaded, POSTS_PAGE_SIZE)
+
+    def on_posts_loaded(self, generation, posts):
+        if generation != self.generation: return
+        self.posts_pending = False
+        # The fetch failed; the next scroll tries this page again
+        if posts is None: return
+        if not posts and not self.posts_loaded:
             self.feed_layout.addWidget(QLabel("No posts yet."))
-        else:
-            for p in posts:
-                p['author_name'] = user.get('full_name')
-                p['author_username'] = user.get('username')
-                self.feed_layout.addWidget(self.create_profile_post_widget(p))
+        for p in posts:
+            frame = self.acquire_post_widget(p)
+            self.post_widgets[p['post_id']] = frame
+            self.feed_layout.addWidget(frame)
+        self.posts_loaded += len(posts)
+        self.posts_exhausted = len(posts) < POSTS_PAGE_SIZE
+
+    def maybe_load_more_posts(self, *_):
+        """Load the next page once the scroll bar nears the bottom"""
+        if self.posts_exhausted or self.posts_pending or not self.current_profile_user:
+            return
+        if self.scroll_bar.value() >= self.scroll_bar.maximum() - POSTS_PREFETCH_MARGIN:
+            self.load_more_posts()
 
     def make_stat_box(self, val_lbl, title):
         b = QVBoxLayout()
         b.addWidget(val_lbl)
         l = QLabel(title)
-        l.setStyleSheet("color:#7f8c8d; font-size:12px;")
+        l.setStyleSheet(_STAT_LBL_QSS)
         l.setAlignment(Qt.AlignCenter)
         b.addWidget(l)
         return b
 
     def toggle_follow(self):
-        tid = self.current_profile_user['user_id']
-        if self.is_following_user:
-            success, msg = self.main_window.app.unfollow_user(tid)
-            if success:
-                self.is_following_user = False
-                self.update_stats(False)
-        else:
-            success, msg = self.main_window.app.follow_user(tid)
-            if success:
-                self.is_following_user = True
-                self.update_stats(True)
+        # Show the change now; the backend hears about it once clicks settle
+        self.set_following(not self.is_following_user)
+        self.follow_timer.start()
+
+    def commit_follow_state(self):
+        """Send the shown follow state if it differs from what the backend holds"""
+        # One request at a time; on_follow_toggled re-checks when it returns
+        if self.follow_pending: return
+        follow = self.is_following_user
+        if follow == self.follow_committed: return
+
+        call = self.main_window.app.follow_user if follow else self.main_window.app.unfollow_user
+        self.follow_pending = True
+        generation = self.generation
+        self.run_backend(lambda result: self.on_follow_toggled(generation, follow, result),
+                         call, self.current_profile_user['user_id'],
+                         failed=(False, "Could not update follow status"))
+
+    def on_follow_toggled(self, generation, follow, result):
+        if generation != self.generation: return
+        self.follow_pending = False
+        success, msg = result
+        if success:
+            self.follow_committed = follow
+
+        if self.is_following_user == self.follow_committed: return
+        if not success:
+            # Undo the optimistic change
+            self.set_following(self.follow_committed)
+        elif not self.follow_timer.isActive():
+            # Clicked again while the request was in flight
+            self.commit_follow_state()
+
+    def set_following(self, follow):
+        self.is_following_user = follow
+        self.update_stats(follow)
+        self.current_profile_user['is_following'] = follow
         self.update_follow_btn_visuals()
 
     def update_follow_btn_visuals(self):
-        if self.is_following_user:
-            self.follow_btn.setText("Unfollow")
-            self.follow_btn.setStyleSheet("""
-                QPushButton { background-color: #e74c3c; color: white; font-weight: bold; border-radius: 20px; }
-                QPushButton:hover { background-color: #c0392b; }
-            """)
-        else:
-            self.follow_btn.setText("Follow")
-            self.follow_btn.setStyleSheet("""
-                QPushButton { background-color: #6C5CE7; color: white; font-weight: bold; border-radius: 20px; }
-                QPushButton:hover { background-color: #5A4FD8; }
-            """)
+        text = "Unfollow" if self.is_following_user else "Follow"
+        # Text and stylesheet always change together, so matching text means nothing to do
+        if self.follow_btn.text() == text: return
+        self.follow_btn.setText(text)
+        self.follow_btn.setStyleSheet(_UNFOLLOW_QSS if self.is_following_user else _FOLLOW_QSS)
 
     def update_stats(self, increment):
-        try:
-            val = int(self.followers_val_lbl.text())
-            val = val + 1 if increment else max(0, val - 1)
-            self.followers_val_lbl.setText(str(val))
-        except:
-            pass
+        # The profile dict (possibly the cached one) holds the count; the label only shows it
+        user = self.current_profile_user
+        val = user.get('follower_count') or 0
+        val = val + 1 if increment else max(0, val - 1)
+        user['follower_count'] = val
+        set_text_if_changed(self.followers_val_lbl, str(val))
+
+    def acquire_post_widget(self, post_data):
+        """A post frame filled with post_data, reused from the pool when possible"""
+        if self.post_widget_pool:
+            frame = self.post_widget_pool.pop()
+        else:
+            frame = self.create_profile_post_widget()
+        self.populate_post_widget(frame, post_data)
+        return frame
 
-    def create_profile_post_widget(self, post_data):
+    def release_post_widgets(self):
+        """Empty the feed, keeping post frames in the pool and deleting anything else"""
+        pooled = set(map(id, self.post_widgets.values()))
+        while self.feed_layout.count():
+            w = self.feed_layout.takeAt(0).widget()
+            if not w: continue
+            if id(w) in pooled:
+                w.setParent(None)
+                self.post_widget_pool.append(w)
+            else:
+                w.deleteLater()
+        self.post_widgets = {}
+
+    def create_profile_post_widget(self):
         frame = QFrame()
-        frame.setStyleSheet("background: white; border-radius: 12px; border: 1px solid #ddd;")
+        frame.setStyleSheet(_POST_FRAME_QSS)
         l = QVBoxLayout()
         l.setContentsMargins(20, 20, 20, 20)
 
-        l.addWidget(QLabel(f"<b>{post_data.get('date')}</b>"))
-        c = QLabel(post_data.get('content'))
-        c.setWordWrap(True)
-        l.addWidget(c)
+        frame.date_lbl = QLabel()
+        l.addWidget(frame.date_lbl)
+        frame.content_lbl = QLabel()
+        frame.content_lbl.setWordWrap(True)
+        l.addWidget(frame.content_lbl)
 
         actions = QHBoxLayout()
 
-        # Like
-        lb = QPushButton(f"❤️ {post_data.get('like_count', 0)}")
-        lb.clicked.connect(lambda: self.handle_action(post_data['post_id'], 'like'))
-
-        # Dislike
-        db = QPushButton(f"👎 {post_data.get('dislike_count', 0)}")
-        db.clicked.connect(lambda: self.handle_action(post_data['post_id'], 'dislike'))
-
-        # Comment
-        cb = QPushButton(f"💬 {post_data.get('comment_count', 0)}")
-        cb.clicked.connect(lambda: self.handle_action(post_data['post_id'], 'comment'))
-
-        # HOVER STYLES ADDED HERE
-        base_style = """
-            QPushButton { border: 1px solid #ddd; border-radius: 5px; padding: 5px 15px; background: white; }
-            QPushButton:hover { background-color: #f0f0f0; border-color: #6C5CE7; color: #6C5CE7; }
-        """
-        for btn in [lb, db, cb]:
-            btn.setStyleSheet(base_style)
+        # Every button goes to on_post_action, which reads the action and
+        # post id off the sender, so a pooled frame only needs new properties
+        lb, db, cb = QPushButton(), QPushButton(), QPushButton()
+        for btn, action in ((lb, 'like'), (db, 'dislike'), (cb, 'comment')):
+            btn.setProperty("action", action)
+            btn.clicked.connect(self.on_post_action)
+            # Hover styles live in _POST_BTN_QSS
+            btn.setStyleSheet(_POST_BTN_QSS)
             actions.addWidget(btn)
 
         actions.addStretch()
         l.addLayout(actions)
         frame.setLayout(l)
+        frame.action_buttons = (lb, db, cb)
         return frame
 
+    def populate_post_widget(self, frame, post_data):
+        for btn in frame.action_buttons:
+            btn.setProperty("post_id", post_data['post_id'])
+        frame.date_lbl.setText(f"<b>{post_data.get('date')}</b>")
+        frame.content_lbl.setText(post_data.get('content'))
+        self.set_post_counts(frame, post_data)
+
+    def set_post_counts(self, frame, post_data):
+        """Rewrite a post frame's like/dislike/comment button labels"""
+        lb, db, cb = frame.action_buttons
+        set_text_if_changed(lb, _LIKE_FMT % (post_data.get('like_count') or 0))
+        set_text_if_changed(db, _DISLIKE_FMT % (post_data.get('dislike_count') or 0))
+        set_text_if_changed(cb, _COMMENT_FMT % (post_data.get('comment_count') or 0))
+
+    def on_post_action(self):
+        s = self.sender()
+        self.handle_action(s.property("post_id"), s.property("action"))
+
     def handle_action(self, pid, action):
+        text = None
+        if action == 'comment':
+            text = self.ask_comment()
+            if not text: return
+
+        generation = self.generation
+        self.run_backend(lambda post: self.on_action_done(generation, pid, post),
+                         self.apply_post_action, pid, action, text)
+
+    def ask_comment(self):
+        """Prompt for a comment; returns its text, or None if cancelled"""
+        if self.comment_dialog is None:
+            self.comment_dialog = QInputDialog(self)
+            self.comment_dialog.setWindowTitle("Comment")
+            self.comment_dialog.setLabelText("Text:")
+        self.comment_dialog.setTextValue("")
+        if not self.comment_dialog.exec(): return None
+        return self.comment_dialog.textValue()
+
+    def apply_post_action(self, pid, action, text):
+        """Runs on a pool thread: apply the reaction or comment, then re-read the post"""
+        app = self.main_window.app
         if action == 'like':
-            self.main_window.app.like_post(pid)
+            app.like_post(pid)
         elif action == 'dislike':
-            self.main_window.app.dislike_post(pid)
+            app.dislike_post(pid)
         elif action == 'comment':
-            t, ok = QInputDialog.getText(self, "Comment", "Text:")
-            if ok and t: self.main_window.app.comment_on_post(pid, t)
-
-        self.load_user(self.current_profile_user)
+            app.comment_on_post(pid, text)
+        # Liking can also drop a dislike (and vice versa) and repeats don't
+        # count, so re-read this one post rather than guessing its counters
+        return app.get_post(pid)
+
+    def on_action_done(self, generation, pid, post):
+        if generation != self.generation: return
+        frame = self.post_widgets.get(pid)
+        if post and frame:
+            self.set_post_counts(frame, post)
+        else:
+            self.load_user(self.current_profile_user)
 
     def create_vertical_line(self):
         l = QFrame()
         l.setFrameShape(QFrame.VLine)
         l.setFrameShadow(QFrame.Sunken)
         l.setFixedHeight(30)
-        l.setStyleSheet("color: #ccc;")
+        l.setStyleSheet(_VLINE_QSS)
         return l
 
     def clear_layout(self, layout):
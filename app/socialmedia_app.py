@@ -2,7 +2,12 @@
 SocialMedia Application Integration Class
 Controller that delegates logic to USER, POST, and SocialNetwork layers.
 """
-from typing import List, Optional, Dict, Tuple
+from typing import Callable, List, Optional, Dict, Tuple
+from collections import OrderedDict, defaultdict
+import base64
+import json
+import threading
+import time
 
 # Import Domain Components (NO DIRECT DB ACCESS)
 from .backend_files.USER import USER, System
@@ -10,13 +15,39 @@ from .backend_files.POST import POST
 from .backend_files.social_network import get_social_network
 from .backend_files.message import Msg
 from .backend_files.link_predictor import LinkPredictor
+# Messaging has no domain class of its own and goes straight to db_manager
+from .backend_files import db_manager
+
+# Most profile views kept by search_user_by_id before the oldest is dropped
+PROFILE_VIEW_CACHE_MAX = 2048
+# How long recommend_friends reuses one scoring pass for the same viewer
+RECOMMENDATIONS_TTL = 30.0
 
 class SocialMedia:
     def __init__(self):
         self.current_user: Optional[USER] = None
         self.system = System()  # Handles system-wide logic (Login, Reg, Trie)
         self.network = get_social_network()
-        self.predictor = LinkPredictor()
+        # Trained in the background by _initialize instead of blocking startup
+        self.predictor = LinkPredictor(train=False)
+        # Profile views keyed by (user_id, viewer_id, user version, viewer version);
+        # a write bumps the version, so old entries are never hit again and age out
+        self._user_versions = defaultdict(int)
+        self._profile_views = OrderedDict()
+        self._profile_views_lock = threading.Lock()
+        self._profile_writes = 0
+        # username -> user_id of cached views, so search_user_by_username can hit the
+        # cache too; same LRU bound, and dropped for a user whenever they are written
+        self._profile_view_ids = OrderedDict()
+        # viewer_id -> (expiry, viewer version, [(user_id, score)])
+        self._recommendations = {}
+        # IDs the current user follows, and whose set it is (see _following_ids)
+        self._following_set: Optional[set] = None
+        self._following_set_owner: Optional[int] = None
+        # follow_user/unfollow_user also run on the profile page's thread pool;
+        # one at a time, so the check, the DB write, the graph, the edge count
+        # and the following set always change together
+        self._follow_lock = threading.Lock()
         self._initialize()
 
     def _initialize(self) -> None:
@@ -26,6 +57,9 @@ class SocialMedia:
         except Exception as e:
             print(f"Warning: Could not initialize social network: {e}")
 
+        # The predictor learns from the graph, so start it once the graph is loaded
+        self.predictor.warmup()
+
     # ========================================
     # USER AUTHENTICATION & MANAGEMENT
     # ========================================
@@ -41,11 +75,15 @@ class SocialMedia:
         success, msg, user = self.system.login(username, password)
         if success:
             self.current_user = user
+            self._load_following_set()
         return (success, msg, user)
 
     def logout(self) -> None:
         """Logout the current user"""
-        self.current_user = None
+        # Wait for a follow/unfollow in flight on the pool to finish first
+        with self._follow_lock:
+            self.current_user = None
+            self._following_set = self._following_set_owner = None
 
     def get_current_user(self) -> Optional[USER]:
         return self.current_user
@@ -54,22 +92,21 @@ class SocialMedia:
         return self.current_user is not None
 
     def get_posts_by_interest(self, interest: str):
-        """Return posts that match a given interest/category"""
+        """Return feed posts tagged with a given interest/category, best first"""
         if not self.current_user:
             return []
 
-        # Fetch raw feed
-        raw_posts = self.current_user.get_feed_posts()
-
-        # Filter posts that contain this interest/category
-        filtered = [p for p in raw_posts if interest.lower() in p.get("categories", "").lower()]
-        return filtered
+        # The database filters and ranks; -1 means no LIMIT in SQLite
+        posts, _ = self.current_user.get_feed_posts_page(-1, category=interest)
+        return posts
 
     def update_user_profile(self, user_data: Dict) -> Tuple[bool, str]:
         """Update current user profile"""
         if not self.current_user:
             return (False, "No user logged in")
 
+        before = self.current_user.snapshot_fields()
+
         # Update in-memory object
         if 'username' in user_data: self.current_user.set_username(user_data['username'])
         if 'full_name' in user_data: self.current_user.set_fullname(user_data['full_name'])
@@ -78,8 +115,14 @@ class SocialMedia:
         if 'address' in user_data: self.current_user.set_address(user_data['address'])
         if 'interests' in user_data: self.current_user.set_interests(user_data['interests'])
 
-        # Persist changes
-        success = self.current_user.save_changes()
+        # Persist only the columns that actually changed
+        after = self.current_user.snapshot_fields()
+        changed = {key: value for key, value in after.items() if value != before[key]}
+        if not changed:
+            return (True, "Profile updated successfully")
+
+        success = self.current_user.save_fields(changed)
+        self._bump_user_version(self.current_user.get_id())
         if success:
             return (True, "Profile updated successfully")
         return (False, "Failed to update profile")
@@ -112,17 +155,18 @@ class SocialMedia:
         success = self.current_user.remove_post(post_id)
         return (success, "Post deleted" if success else "Failed")
 
-    def get_user_posts(self, user_id: Optional[int] = None) -> List[Dict]:
-        """Get all posts by a user"""
+    def get_user_posts(self, user_id: Optional[int] = None, offset: int = 0,
+                       limit: Optional[int] = None) -> List[Dict]:
+        """Get a user's posts, newest first; offset/limit select one page"""
         # If no ID provided, use current user
         if user_id is None:
             if not self.current_user: return []
-            return self.current_user.get_my_posts()
+            return self.current_user.get_my_posts(offset, limit)
 
         # If ID provided, fetch that user first
         other_user = USER.get_by_id(user_id)
         if other_user:
-            return other_user.get_my_posts()
+            return other_user.get_my_posts(offset, limit)
         return []
 
     # ========================================
@@ -163,64 +207,78 @@ class SocialMedia:
     # FEED GENERATION
     # ========================================
 
-    def get_feed(self, page: int = 0, posts_per_page: int = 10) -> Dict:
+    def get_feed(self, page: int = 0, posts_per_page: int = 10,
+                 cursor: Optional[str] = None) -> Dict:
         """
         Get paginated feed.
-        Uses USER to get raw posts, and System to sort them.
+        Ranking, pagination and author names all happen in one database read
+        (see db_manager.return_following_posts_page), so only the requested
+        page leaves the database.
+
+        Pass the previous result's 'next_cursor' as cursor to get the page after
+        it without the database skipping over every earlier row; page is then
+        only echoed back as current_page.
         """
         if not self.current_user:
-            return {'posts': [], 'total_posts': 0, 'current_page': 0}
-
-        # 1. Fetch raw feed from the User object
-        raw_posts = self.current_user.get_feed_posts()
+            return {'posts': [], 'total_posts': 0, 'current_page': 0, 'next_cursor': None}
 
-        # 2. Sort using System algorithm (Merge Sort)
-        sorted_posts = self.system.generate_feed(raw_posts)
-
-        # 3. Pagination
-        total_posts = len(sorted_posts)
+        after = self._decode_feed_cursor(cursor) if cursor else None
+        page_posts, total_posts = self.current_user.get_feed_posts_page(
+            posts_per_page, page * posts_per_page, after)
         total_pages = (total_posts + posts_per_page - 1) // posts_per_page
-        start_idx = page * posts_per_page
-        end_idx = min(start_idx + posts_per_page, total_posts)
-        page_posts = sorted_posts[start_idx:end_idx]
 
-        # 4. Enrich posts with Author Names (requires fetching User objects)
-        for post in page_posts:
-            user = USER.get_by_id(post['user_id'])
-            if user:
-                post['author_name'] = user.get_fullname()
-                post['author_username'] = user.get_username()
+        next_cursor = None
+        if len(page_posts) == posts_per_page:
+            next_cursor = self._encode_feed_cursor(*page_posts.cursor(-1))
 
         return {
             'posts': page_posts,
             'total_posts': total_posts,
             'current_page': page,
-            'total_pages': total_pages
+            'total_pages': total_pages,
+            'next_cursor': next_cursor
         }
+
+    @staticmethod
+    def _encode_feed_cursor(score: int, post_id: int) -> str:
+        return base64.urlsafe_b64encode(json.dumps([score, post_id]).encode()).decode()
+
+    @staticmethod
+    def _decode_feed_cursor(cursor: str) -> Tuple[int, int]:
+        score, post_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return score, post_id
     # ========================================
     # SOCIAL CONNECTIONS
     # ========================================
 
     def follow_user(self, user_id: int) -> Tuple[bool, str]:
-        if not self.current_user: return (False, "No user logged in")
-        if user_id == self.current_user.get_id(): return (False, "Cannot follow yourself")
+        with self._follow_lock:
+            user = self.current_user
+            if not user: return (False, "No user logged in")
+            if user_id == user.get_id(): return (False, "Cannot follow yourself")
 
-        # Check if already following
-        if self.is_following(user_id):
-            return (False, "Already following this user")
+            # Check if already following
+            if self.is_following(user_id):
+                return (False, "Already following this user")
 
-        self.current_user.follow(user_id)
-        return (True, "User followed successfully")
+            user.follow(user_id)
+            self._following_ids().add(user_id)
+            self._bump_user_version(user.get_id(), user_id)
+            return (True, "User followed successfully")
 
     def unfollow_user(self, user_id: int) -> Tuple[bool, str]:
-        if not self.current_user: return (False, "No user logged in")
+        with self._follow_lock:
+            user = self.current_user
+            if not user: return (False, "No user logged in")
 
-        # Check if not following
-        if not self.is_following(user_id):
-            return (False, "Not following this user")
+            # Check if not following
+            if not self.is_following(user_id):
+                return (False, "Not following this user")
 
-        self.current_user.unfollow(user_id)
-        return (True, "User unfollowed successfully")
+            user.unfollow(user_id)
+            self._following_ids().discard(user_id)
+            self._bump_user_version(user.get_id(), user_id)
+            return (True, "User unfollowed successfully")
 
     def get_followers(self, user_id: Optional[int] = None) -> List[Dict]:
         """Get followers list - using USER class methods"""
@@ -241,25 +299,48 @@ class SocialMedia:
         return USER.get_user_following_list(user_id)
 
     def is_following(self, user_id: int) -> bool:
-        """Check if current user follows another user via Network Graph or USER class"""
+        """Check if current user follows another user (set lookup, see _following_ids)"""
         if not self.current_user: return False
-
-        # Option 1: Use network graph (if available)
+        return user_id in self._following_ids()
+
+    def _load_following_set(self) -> set:
+        """Read who the current user follows once; follow/unfollow_user keep it current"""
+        user_id = self.current_user.get_id()
+        self._following_set = set(USER.get_user_following_ids(user_id))
+        self._following_set_owner = user_id
+        return self._following_set
+
+    def _following_ids(self) -> set:
+        """The current user's following set, reloaded if someone else has logged in
+        (pages may set current_user directly)"""
+        if self._following_set is None or self._following_set_owner != self.current_user.get_id():
+            return self._load_following_set()
+        return self._following_set
+
+    def _follows(self, follower_id: int, followed_id: int) -> bool:
+        """Follow check that stays in memory whenever the network graph is loaded"""
+        if self.current_user and follower_id == self.current_user.get_id():
+            return followed_id in self._following_ids()
+
+        # Option 1: Use network graph (if available); the adjacency matrix is
+        # kept in step with the follow table by USER.follow/unfollow
         if hasattr(self, 'network') and self.network:
-            return self.network.is_edge(self.current_user.get_id(), user_id)
+            return self.network.is_edge(follower_id, followed_id)
 
         # Option 2: Use USER class method
-        return USER.is_following(self.current_user.get_id(), user_id)
+        return USER.is_following(follower_id, followed_id)
 
     def get_follower_count(self, user_id: Optional[int] = None) -> int:
-        """Get follower count - using USER class methods"""
+        """Get follower count from the (cached) user row, kept current by DB triggers"""
         target_id = user_id if user_id is not None else (self.current_user.get_id() if self.current_user else 0)
-        return USER.get_user_followers_count(target_id)
+        user = USER.get_by_id(target_id)
+        return user.get_followers_count() if user else 0
 
     def get_following_count(self, user_id: Optional[int] = None) -> int:
-        """Get following count - using USER class methods"""
+        """Get following count from the (cached) user row, kept current by DB triggers"""
         target_id = user_id if user_id is not None else (self.current_user.get_id() if self.current_user else 0)
-        return USER.get_user_following_count(target_id)
+        user = USER.get_by_id(target_id)
+        return user.get_following_count() if user else 0
 
     def get_follow_relationship_info(self, user_id: int) -> Dict:
         """Get comprehensive follow relationship info between current user and another user"""
@@ -268,8 +349,8 @@ class SocialMedia:
 
         current_id = self.current_user.get_id()
         return {
-            'is_following': USER.is_following(current_id, user_id),
-            'is_followed_by': USER.is_following(user_id, current_id)
+            'is_following': self._follows(current_id, user_id),
+            'is_followed_by': self._follows(user_id, current_id)
         }
 
     # ========================================
@@ -277,36 +358,68 @@ class SocialMedia:
     # ========================================
 
     def search_user_by_username(self, username: str) -> Optional[Dict]:
-        """Search via USER static method, convert to dict for GUI"""
-        user = USER.get_by_username(username)
-        if user:
-            return {
-                'user_id': user.get_id(),
-                'username': user.get_username(),
-                'full_name': user.get_fullname(),
-                'follower_count': user.get_followers_count(),
-                'following_count': user.get_following_count(),
-                'is_following': self.is_following(user.get_id()) if self.current_user else False,
-                'is_followed_by': USER.is_following(user.get_id(), self.current_user.get_id()) if self.current_user else False,
-                'interests': user.get_interests()
-            }
-        return None
+        """Profile dict for the GUI (see get_profile_view), looked up by username
+        and cached like search_user_by_id"""
+        viewer_id = self.current_user.get_id() if self.current_user else None
+        return self._cached_profile_view(viewer_id, username=username)
 
     def search_user_by_id(self, user_id: int) -> Optional[Dict]:
-        """Search via USER static method, convert to dict for GUI"""
-        user = USER.get_by_id(user_id)
-        if user:
-            return {
-                'user_id': user.get_id(),
-                'username': user.get_username(),
-                'full_name': user.get_fullname(),
-                'follower_count': user.get_followers_count(),
-                'following_count': user.get_following_count(),
-                'is_following': self.is_following(user.get_id()) if self.current_user else False,
-                'is_followed_by': USER.is_following(user.get_id(), self.current_user.get_id()) if self.current_user else False,
-                'interests': user.get_interests()
-            }
-        return None
+        """Profile dict for the GUI (see get_profile_view), cached until either
+        user changes their profile or follows/unfollows"""
+        viewer_id = self.current_user.get_id() if self.current_user else None
+        return self._cached_profile_view(viewer_id, user_id=user_id)
+
+    def _cached_profile_view(self, viewer_id: Optional[int], user_id: Optional[int] = None,
+                             username: Optional[str] = None) -> Optional[Dict]:
+        """Shared cache behind both search_user_by_* lookups; pass user_id or username"""
+        with self._profile_views_lock:
+            if user_id is None:
+                user_id = self._profile_view_ids.get(username)
+            if user_id is not None:
+                key = (user_id, viewer_id, self._user_versions[user_id], self._user_versions[viewer_id])
+                view = self._profile_views.get(key)
+                if view is not None:
+                    self._profile_views.move_to_end(key)
+                    return dict(view)
+            writes_seen = self._profile_writes
+
+        if user_id is not None:
+            view = USER.get_profile_view(user_id, viewer_id)
+        else:
+            view = USER.get_profile_view_by_username(username, viewer_id)
+        if view is None:
+            return None
+
+        with self._profile_views_lock:
+            # Skip storing if a profile write landed while we were reading
+            if self._profile_writes == writes_seen:
+                uid = view['user_id']
+                key = (uid, viewer_id, self._user_versions[uid], self._user_versions[viewer_id])
+                self._profile_views[key] = view
+                self._profile_view_ids[view['username']] = uid
+                self._profile_view_ids.move_to_end(view['username'])
+                if len(self._profile_views) > PROFILE_VIEW_CACHE_MAX:
+                    self._profile_views.popitem(last=False)
+                if len(self._profile_view_ids) > PROFILE_VIEW_CACHE_MAX:
+                    self._profile_view_ids.popitem(last=False)
+        return dict(view)
+
+    def _bump_user_version(self, *user_ids: int) -> None:
+        """Make every cached profile view involving these users stale"""
+        with self._profile_views_lock:
+            self._profile_writes += 1
+            for uid in user_ids:
+                self._user_versions[uid] += 1
+            # A rename must not keep sending the old name to this user
+            for name in [n for n, uid in self._profile_view_ids.items() if uid in user_ids]:
+                del self._profile_view_ids[name]
+
+    def get_profile_view(self, user_id: int) -> Optional[Dict]:
+        """user_id, username, full_name, follower/following counts, interests and
+        is_following/is_followed_by for the current user, read in a single query
+        and cached like search_user_by_id"""
+        viewer_id = self.current_user.get_id() if self.current_user else None
+        return self._cached_profile_view(viewer_id, user_id=user_id)
 
     def get_username_suggestions(self, prefix: str) -> List[str]:
         """Delegate to System class which holds the Trie"""
@@ -316,23 +429,22 @@ class SocialMedia:
         """Get friend recommendations via User object"""
         if not self.current_user: return []
 
-        recommendations = self.current_user.recommend_friends()
-
-        # Convert IDs to user dicts for the GUI
-        result = []
-        for uid, score in recommendations:
-            u_obj = USER.get_by_id(uid)
-            if u_obj:
-                u_dict = {
-                    'user_id': u_obj.get_id(),
-                    'username': u_obj.get_username(),
-                    'full_name': u_obj.get_fullname(),
-                    'follower_count': USER.get_user_followers_count(uid),
-                    'following_count': USER.get_user_following_count(uid),
-                    'is_following': self.is_following(uid) if self.current_user else False
-                }
-                result.append((u_dict, score))
-        return result
+        viewer_id = self.current_user.get_id()
+        version = self._user_versions[viewer_id]
+        cached = self._recommendations.get(viewer_id)
+        if cached and cached[0] > time.monotonic() and cached[1] == version:
+            recommendations = cached[2]
+        else:
+            # Scoring walks the whole graph, so reuse it until the TTL runs out
+            # or the viewer follows/unfollows someone (which bumps their version)
+            recommendations = self.current_user.recommend_friend_ids()
+            self._recommendations[viewer_id] = (time.monotonic() + RECOMMENDATIONS_TTL,
+                                                version, recommendations)
+
+        # Profile dicts for the GUI, all candidates in one query
+        scores = dict(recommendations)
+        dtos = USER.get_recommendation_dtos([uid for uid, _ in recommendations], viewer_id)
+        return [(dto, scores[dto['user_id']]) for dto in dtos]
 
     def get_user_activity(self, user_id: Optional[int] = None) -> List[Dict]:
         """Get recent activity via User object"""
@@ -344,35 +456,37 @@ class SocialMedia:
     # MESSAGES
     # ========================================
 
-    def send_message(self, receiver_id: int, content: str) -> Tuple[bool, str]:
-        """Send a message to another user"""
+    def send_message(self, receiver_id: int, content: str,
+                     on_failed: Optional[Callable[[str], None]] = None) -> Tuple[bool, str]:
+        """Send a message to another user.
+
+        The insert happens in the background, so (True, "queued") only means it
+        was accepted; on_failed(reason) is called, from the writer thread, if it
+        then can't be saved.
+        """
         if not self.current_user:
             return (False, "No user logged in")
 
-         # Adjust import path
-        from .backend_files import db_manager
-
         # Create message object
         msg = Msg()
         msg.set_sender_id(self.current_user.get_id())
         msg.set_receiver_id(receiver_id)
         msg.set_content(content)
 
-        # Save to database
-        success = db_manager.add_message(msg)
-
-        if success:
-            return (True, "Message sent")
-        else:
-            return (False, "Failed to send message")
+        # Written in the background; get_chat flushes the queue before reading
+        future = db_manager.message_writer.enqueue(msg)
+        if on_failed is not None:
+            def report(done):
+                if done.exception() is not None or not done.result():
+                    on_failed("it could not be saved")
+            future.add_done_callback(report)
+        return (True, "queued")
 
     def get_chat(self, other_user_id: int) -> List[Dict]:
         """Get all messages between current user and another user"""
         if not self.current_user:
             return []
 
-        from .backend_files import db_manager
-
         # Get messages from database
         messages = db_manager.get_chat(self.current_user.get_id(), other_user_id)
 
@@ -392,8 +506,6 @@ class SocialMedia:
 
     def delete_message(self, msg_id: int) -> Tuple[bool, str]:
         """Delete a message"""
-        from .backend_files import db_manager
-
         msg = Msg()
         msg.set_msg_id(msg_id)
 
@@ -409,52 +521,7 @@ class SocialMedia:
         if not self.current_user:
             return []
 
-        from .backend_files import db_manager
-
-        conn = db_manager.get_connection()
-        if not conn:
-            return []
-
-        try:
-            cursor = conn.cursor()
-            # Get unique users who have chatted with current user
-            sql = """
-                SELECT DISTINCT 
-                    CASE 
-                        WHEN sender_id = ? THEN receiver_id 
-                        ELSE sender_id 
-                    END as other_user_id,
-                    MAX(date_text) as last_date
-                FROM messages 
-                WHERE sender_id = ? OR receiver_id = ?
-                GROUP BY other_user_id
-                ORDER BY last_date DESC
-            """
-
-            user_id = self.current_user.get_id()
-            cursor.execute(sql, (user_id, user_id, user_id))
-            rows = cursor.fetchall()
-
-            conversations = []
-            for row in rows:
-                other_user_id = row[0]
-                last_date = row[2]
-
-                # Get user data
-                user_data = db_manager.return_user_by_id(other_user_id)
-                if user_data:
-                    conversations.append({
-                        'user_data': user_data,
-                        'last_date': last_date
-                    })
-
-            return conversations
-
-        except Exception as e:
-            print(f"Error getting conversations: {e}")
-            return []
-        finally:
-            conn.close()
+        return db_manager.get_conversations(self.current_user.get_id())
 
 
     # ========================================
@@ -1,84 +1,88 @@
-def get_stylesheet(light=True):
-    # --- PALETTE DEFINITION ---
-    if light:
-        # LIGHT MODE (Exact colors from old_settings.py)
-        bg_main = "#F8F9FD"
-        text_main = "#2D3436"
-        text_sub = "#666666"
-
-        # Cards (Profile, etc.)
-        card_bg = "white"
-        card_border = "#E5E5F0"
-
-        # --- SETTINGS SPECIFIC (From old_settings.py) ---
-        settings_card_bg = "#f8f9fa"  # Light Gray Box
-        settings_input_bg = "white"  # White Input
-        settings_input_border = "#ddd"  # Light Grey Border
-        settings_input_text = "#333"  # Dark Text
-
-        # Buttons
-        accent = "#6C5CE7"
-        btn_text = "white"
-        btn_hover = "#7E6FF2"
-        action_btn_hover = "#F0F0F0"
-
-        # Danger Zone
-        danger_bg = "#FFF5F5"
-        danger_border = "#FFEBEE"
-
-        # Messaging
-        msg_user_bg = "white"
-        msg_input_bg = "white"
-        msg_border = "#E0E0E0"
-        msg_hover = "#F5F6FA"
-
-        # Chat Bubbles
-        sent_bg = "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #6C5CE7, stop:1 #5B4BC4)"
-        recv_bg = "#F1F2F6"
-        recv_text = "#2D3436"
-
-        list_hover = "#F0F0F0"
-
-    else:
-        # DARK MODE (The Dark equivalent of old_settings)
-        bg_main = "#2C2C2C"
-        text_main = "#ECF0F1"
-        text_sub = "#BDC3C7"
-
-        # Cards
-        card_bg = "#383838"
-        card_border = "#555555"
-
-        # --- SETTINGS SPECIFIC ---
-        settings_card_bg = "#383838"  # Dark Box
-        settings_input_bg = "#444444"  # Darker Input
-        settings_input_border = "#666666"  # Grey Border
-        settings_input_text = "#ECF0F1"  # White Text
-
-        # Buttons
-        accent = "#6C5CE7"
-        btn_text = "white"
-        btn_hover = "#7E6FF2"
-        action_btn_hover = "#666666"
-
-        # Danger Zone
-        danger_bg = "#4A2C2C"
-        danger_border = "#6E3B3B"
-
-        # Messaging
-        msg_user_bg = "#383838"
-        msg_input_bg = "#383838"
-        msg_border = "#555555"
-        msg_hover = "#444444"
-
-        # Chat Bubbles
-        sent_bg = "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #6C5CE7, stop:1 #5B4BC4)"
-        recv_bg = "#444444"
-        recv_text = "#ECF0F1"
-
-        list_hover = "#555555"
-
-    return f"""
+from functools import lru_cache
+
+# --- PALETTE DEFINITION ---
+_LIGHT_PALETTE = {
+    # LIGHT MODE (Exact colors from old_settings.py)
+    "bg_main": "#F8F9FD",
+    "text_main": "#2D3436",
+    "text_sub": "#666666",
+
+    # Cards (Profile, etc.)
+    "card_bg": "white",
+    "card_border": "#E5E5F0",
+
+    # --- SETTINGS SPECIFIC (From old_settings.py) ---
+    "settings_card_bg": "#f8f9fa",  # Light Gray Box
+    "settings_input_bg": "white",  # White Input
+    "settings_input_border": "#ddd",  # Light Grey Border
+    "settings_input_text": "#333",  # Dark Text
+
+    # Buttons
+    "accent": "#6C5CE7",
+    "btn_text": "white",
+    "btn_hover": "#7E6FF2",
+    "action_btn_hover": "#F0F0F0",
+
+    # Danger Zone
+    "danger_bg": "#FFF5F5",
+    "danger_border": "#FFEBEE",
+
+    # Messaging
+    "msg_user_bg": "white",
+    "msg_input_bg": "white",
+    "msg_border": "#E0E0E0",
+    "msg_hover": "#F5F6FA",
+
+    # Chat Bubbles
+    "sent_bg": "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #6C5CE7, stop:1 #5B4BC4)",
+    "recv_bg": "#F1F2F6",
+    "recv_text": "#2D3436",
+
+    "list_hover": "#F0F0F0",
+}
+
+_DARK_PALETTE = {
+    # DARK MODE (The Dark equivalent of old_settings)
+    "bg_main": "#2C2C2C",
+    "text_main": "#ECF0F1",
+    "text_sub": "#BDC3C7",
+
+    # Cards
+    "card_bg": "#383838",
+    "card_border": "#555555",
+
+    # --- SETTINGS SPECIFIC ---
+    "settings_card_bg": "#383838",  # Dark Box
+    "settings_input_bg": "#444444",  # Darker Input
+    "settings_input_border": "#666666",  # Grey Border
+    "settings_input_text": "#ECF0F1",  # White Text
+
+    # Buttons
+    "accent": "#6C5CE7",
+    "btn_text": "white",
+    "btn_hover": "#7E6FF2",
+    "action_btn_hover": "#666666",
+
+    # Danger Zone
+    "danger_bg": "#4A2C2C",
+    "danger_border": "#6E3B3B",
+
+    # Messaging
+    "msg_user_bg": "#383838",
+    "msg_input_bg": "#383838",
+    "msg_border": "#555555",
+    "msg_hover": "#444444",
+
+    # Chat Bubbles
+    "sent_bg": "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #6C5CE7, stop:1 #5B4BC4)",
+    "recv_bg": "#444444",
+    "recv_text": "#ECF0F1",
+
+    "list_hover": "#555555",
+}
+
+# Filled in with str.format from one of the palettes above
+_STYLESHEET_TEMPLATE = """
     /* GLOBAL RESET */
     QWidget {{
         background-color: {bg_main};
@@ -232,4 +236,10 @@ def get_stylesheet(light=True):
         color: {accent};
         border-color: {accent};
     }}
-    """
\ No newline at end of file
+    """
+
+
+@lru_cache(maxsize=2)
+def get_stylesheet(light=True):
+    # Only two possible outputs, so each is formatted once and reused
+    return _STYLESHEET_TEMPLATE.format(**(_LIGHT_PALETTE if light else _DARK_PALETTE))
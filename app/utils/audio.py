@@ -1,8 +1,17 @@
 # app/utils/audio.py
 import os
+from functools import lru_cache
 from PySide6.QtMultimedia import QSoundEffect
 from PySide6.QtCore import QUrl
-from .paths import SOUND_DIR  # Import the path we just defined
+from .paths import SOUNDS  # Sound file paths, joined once in paths.py
+
+
+@lru_cache(maxsize=1)
+def get_audio_manager():
+    """The one AudioManager every page shares, so each sound is loaded only once.
+    Call after the QApplication exists."""
+    return AudioManager()
+
 
 class AudioManager:
     def __init__(self):
@@ -20,7 +29,7 @@ class AudioManager:
 
 
     def _load(self, effect, filename, vol):
-        path = os.path.join(SOUND_DIR, filename)
+        path = SOUNDS[filename]
         if os.path.exists(path):
             effect.setSource(QUrl.fromLocalFile(path))
             effect.setVolume(vol)
@@ -0,0 +1,9 @@
+def set_text_if_changed(widget, text):
+    """setText only when text differs from what the label or button shows.
+
+    Every setText invalidates the widget's size hint and schedules a repaint,
+    even when the text is identical, so refresh paths that re-apply the same
+    values go through here.
+    """
+    if widget.text() != text:
+        widget.setText(text)
@@ -6,4 +6,54 @@ BASE_DIR = os.path.abspath(
 )
 backend_path = os.path.join(BASE_DIR, "app", "backend_files")
 IMAGE_DIR = os.path.join(BASE_DIR, "resources", "images")
-SOUND_DIR = os.path.join(BASE_DIR, "resources", "audio")
\ No newline at end of file
+SOUND_DIR = os.path.join(BASE_DIR, "resources", "audio")
+
+# Full paths of the bundled sound effects, by file name
+SOUNDS = {
+    name: os.path.join(SOUND_DIR, name)
+    for name in ("soft_startup.wav", "hover.wav", "notification_pluck_on.wav", "error.wav")
+}
+
+# Profile image extensions, tried in order; matching ignores their case only
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# (stem, lower-case extension) -> path for IMAGE_DIR, with the directory mtime it was read at
+_image_index = None
+_image_index_mtime = None
+
+
+def _user_images():
+    """IMAGE_DIR listed once and reused until the directory changes on disk"""
+    global _image_index, _image_index_mtime
+    try:
+        mtime = os.stat(IMAGE_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+
+    if _image_index is None or mtime != _image_index_mtime:
+        index = {}
+        for entry in os.scandir(IMAGE_DIR):
+            stem, ext = os.path.splitext(entry.name)
+            index.setdefault((stem, ext.lower()), entry.path)
+        _image_index, _image_index_mtime = index, mtime
+    return _image_index
+
+
+def invalidate_user_images():
+    """Forget the cached listing; call after saving a profile picture"""
+    global _image_index
+    _image_index = None
+
+
+def find_user_image(username):
+    """Return the path of a user's profile image in IMAGE_DIR, or None.
+
+    The username must match the file name exactly (ZIAD and ziad are different
+    users); only the extension's case is ignored, e.g. ziad.JPG.
+    """
+    images = _user_images()
+    for ext in IMAGE_EXTENSIONS:
+        path = images.get((username, ext))
+        if path:
+            return path
+    return None
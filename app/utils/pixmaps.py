@@ -0,0 +1,24 @@
+from PySide6.QtGui import QPixmap, QPixmapCache
+from PySide6.QtCore import Qt
+
+
+def load_scaled_pixmap(path, size):
+    """Return the image at path scaled to fit size x size, or a null pixmap.
+
+    The decoded, pre-scaled pixmap is kept in QPixmapCache under the path and
+    size, so pages that are rebuilt (or share a logo) skip the PNG decode and
+    the smooth rescale after the first load.
+    """
+    key = f"{path}@{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None and not pixmap.isNull():
+        return pixmap
+
+    pixmap = QPixmap(path)
+    if pixmap.isNull():
+        print("❌ Image missing:", path)
+        return pixmap
+
+    pixmap = pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap